@@ -1,19 +1,18 @@
 from app.imports import *
-from apscheduler.schedulers.background import BackgroundScheduler
-from datetime import datetime, timedelta
-from app.models.events import Events
-from app.models.userProfiles import UserProfiles
-from app.models.volunteerHistory import VolunteerHistory
-from sqlalchemy import and_
 from app.utils.mailer import init_mail
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
+from app.utils.socket_metrics import InstrumentedSocketIO
 
-migrate = Migrate()
-socketio = SocketIO(cors_allowed_origins="*")  # No config yet
+socketio = InstrumentedSocketIO(cors_allowed_origins="*")  # No config yet; counts emits / events
 jwt = JWTManager()
 
 def create_app(config_object="app.config.DevConfig"):
+    """Build the Flask app. Pure setup: no threads, no DB connections.
+
+    Periodic jobs are opt-in via `start_background_services(app)` (see run.py),
+    so tests, scripts and `flask ...` commands never start them.
+    """
     app = Flask(__name__)
     app.config.from_object(config_object)
     
@@ -21,9 +20,20 @@ def create_app(config_object="app.config.DevConfig"):
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "default-key")
 
     db.init_app(app)
-    migrate.init_app(app, db)
-    socketio.init_app(app, cors_allowed_origins="*")  # ✅ CORS properly applied here
-    from app import sockets  # ✅ Import after socketio.init_app
+    if os.environ.get("FLASK_RUN_FROM_CLI"):
+        # Flask-Migrate pulls in all of alembic; only `flask db ...` needs it
+        from flask_migrate import Migrate
+        Migrate(app, db)
+    from app.utils.socket_manager import make_client_manager
+    socketio.init_app(
+        app,
+        cors_allowed_origins="*",  # ✅ CORS properly applied here
+        async_mode=app.config.get("SOCKETIO_ASYNC_MODE"),
+        client_manager=make_client_manager(app),  # bounded queues; Postgres fan-out if configured
+    )
+    from app import sockets  # ✅ registers the handlers; keep AFTER socketio.init_app
+    from app.utils.emit_coalescer import init_emit_coalescer
+    init_emit_coalescer(app, socketio)
     CORS(
       app,
       origins= app.config["FRONTEND_ORIGIN"],
@@ -37,6 +47,7 @@ def create_app(config_object="app.config.DevConfig"):
     jwt.init_app(app)
     
     from app.models.userCredentials import UserCredentials, User_Roles  # local import to avoid circular
+    from app.models.revokedToken import RevokedToken
 
     @jwt.user_identity_loader
     def user_identity_lookup(user: "UserCredentials | int | str"):
@@ -52,55 +63,56 @@ def create_app(config_object="app.config.DevConfig"):
         return str(user)   # covers int or str
 
     @jwt.additional_claims_loader
-    def add_claims_to_access_token(identity: str):
+    def add_claims_to_access_token(identity: "UserCredentials | int | str"):
         """
-        identity arrives as the string we returned above.
-        Cast to int for DB lookups.
+        identity is whatever was passed to create_*_token. Callers that have
+        already loaded the row pass the UserCredentials itself so no second
+        lookup is needed; ids are cast to int for a DB lookup.
         """
-        try:
-            uid = int(identity)
-        except (TypeError, ValueError):
-            return {}
-        user = db.session.get(UserCredentials, uid)
+        if isinstance(identity, UserCredentials):
+            user = identity
+        else:
+            try:
+                uid = int(identity)
+            except (TypeError, ValueError):
+                return {}
+            user = db.session.get(UserCredentials, uid)
         if not user:
             return {}
         return {
             "email": user.email,
             "role": user.role.value,
             "email_confirmed": user.is_email_confirmed,
+            "rv": user.role_version,
         }
-    for blueprint, prefix in blueprint_with_prefixes.items():
-        app.register_blueprint(blueprint, url_prefix=prefix)
 
-    from app import sockets  # ✅ Keep this AFTER socketio.init_app, let me know if you need to change this
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload: dict) -> bool:
+        """
+        Only refresh tokens can be revoked; access tokens are short-lived and
+        skip the lookup entirely.
+        """
+        if jwt_payload.get("type") != "refresh":
+            return False
+        return db.session.get(RevokedToken, jwt_payload["jti"]) is not None
 
-    # Background task to check upcoming events and send reminders
-    def check_upcoming_events():
-        with app.app_context():
-            now = datetime.utcnow()
-            one_hour_later = now + timedelta(hours=1)
-            upcoming_events = db.session.query(Events).filter(
-                and_(Events.date >= now, Events.date <= one_hour_later)
-            ).all()
+    from app.routes import register_blueprints
+    register_blueprints(app)
 
-            for event in upcoming_events:
-                assignments = db.session.query(VolunteerHistory).filter_by(event_id=event.event_id, participation_status='ASSIGNED').all()
-                for assignment in assignments:
-                    socketio.emit(
-                        "event_reminder",
-                        {
-                            "user_id": assignment.user_id,
-                            "event_id": event.event_id,
-                            "name": event.name,
-                            "message": f"⏰ Reminder: Your event '{event.name}' starts in less than 1 hour!"
-                        },
-                        to=str(assignment.user_id)  # 🔥 Send only to the specific user room
-                    )
+    return app
 
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(func=check_upcoming_events, trigger="interval", minutes=1)
-    scheduler.start()
 
-    return app
+def start_background_services(app):
+    """Warm the reference-data cache and start the periodic-job scheduler
+    (leader election, reminders, outbox, digests) for a serving process.
+    The scheduler respects SCHEDULER_ENABLED."""
+    from app.utils.reference_cache import reference_cache
+    with app.app_context():
+        reference_cache.get()
+        db.session.remove()
+    if not app.config.get("SCHEDULER_ENABLED", True):
+        return None
+    from app.utils.scheduler import init_scheduler
+    return init_scheduler(app)
 
-__all__ = ["create_app", "db"]
\ No newline at end of file
+__all__ = ["create_app", "db", "start_background_services"]
\ No newline at end of file
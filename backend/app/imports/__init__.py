@@ -1,4 +1,3 @@
 from .libraries import *
 from .utilities import * 
-from .routes_import import *
 from ..models import *
\ No newline at end of file
@@ -4,19 +4,14 @@ load_dotenv()
 
 from flask_sqlalchemy import SQLAlchemy
 
-import jwt
 from datetime import datetime, timedelta
 from functools import wraps
-import psycopg2.extras as extra
-import psycopg2
 import os 
 
 from flask import Flask 
 from flask_cors import CORS
 from flask import Blueprint, request, jsonify
 
-from flask_migrate import Migrate
-
 from sqlalchemy import asc, desc
 
 import enum
@@ -33,15 +28,11 @@ __all__ = [
     "CORS",
     "load_dotenv",
     "os",
-    "psycopg2",
-    "extra",
-    "jwt",
     "datetime",
     "timedelta",
     "wraps",
     "SQLAlchemy",
     "enum",
-    "Migrate",
     "asc",
     "desc",
     "SocketIO",
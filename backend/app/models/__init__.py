@@ -1,6 +1,15 @@
 from app.models.events import Events, UrgencyEnum
+from app.models.emailOutbox import EmailOutbox, OutboxStatusEnum
 from app.models.eventToSkill import EventToSkill
+from app.models.notification import Notification
+from app.models.notificationLog import NotificationCursor, NotificationLog
+from app.models.pendingEventChange import PendingEventChange
+from app.models.rateLimitBucket import RateLimitBucket
+from app.models.referenceVersion import ReferenceVersion
+from app.models.reminderLedger import ReminderLedger
+from app.models.revokedToken import RevokedToken
 from app.models.skill import Skill, SkillLevelEnum
+from app.models.socketioSpill import SocketioSpill
 from app.models.state import States
 from app.models.userAvailability import UserAvailability  # ensure model registered
 from app.models.userCredentials import UserCredentials, User_Roles
@@ -10,8 +19,17 @@ from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnu
 
 __all__ = [
     "Events", "UrgencyEnum",
+    "EmailOutbox", "OutboxStatusEnum",
     "EventToSkill",
+    "Notification",
+    "NotificationCursor", "NotificationLog",
+    "PendingEventChange",
+    "RateLimitBucket",
+    "ReferenceVersion",
+    "ReminderLedger",
+    "RevokedToken",
     "Skill", "SkillLevelEnum",
+    "SocketioSpill",
     "States",
     "UserCredentials",
     "UserAvailability",
@@ -0,0 +1,40 @@
+from app.imports import *
+
+
+class OutboxStatusEnum(enum.Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"   # gave up after MAIL_OUTBOX_MAX_ATTEMPTS
+
+
+class EmailOutbox(db.Model):
+    """Transactional outbox for outgoing mail.
+
+    Rows are written in the same commit as the change that triggers them and
+    drained by `app.utils.outbox.drain_outbox`.
+    """
+    __tablename__ = "email_outbox"
+
+    outbox_id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    to_email = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    html = db.Column(db.Text, nullable=True)
+    status = db.Column(db.Enum(OutboxStatusEnum), nullable=False, default=OutboxStatusEnum.PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # the sender only ever scans pending rows that are due
+        db.Index(
+            "ix_email_outbox_pending_due",
+            "next_attempt_at",
+            postgresql_where=db.text("status = 'PENDING'"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox {self.outbox_id} to={self.to_email} status={self.status.name}>"
@@ -30,5 +30,8 @@ class Events(db.Model):
         backref="events",
     )
 
+    # keyset pages of /events/upcoming and /events/past
+    __table_args__ = (db.Index("ix_events_date", date, event_id),)
+
     def __repr__(self) -> str:       # type: ignore[override]
         return f"<Event {self.event_id}>"
@@ -0,0 +1,42 @@
+from app.imports import *
+
+
+class Notification(db.Model):
+    """A user's notification inbox; unlike `notification_log` nothing rotates out.
+
+    Listed newest first with keyset pagination on (created_at, notification_id),
+    served by `ix_notifications_user_created`. Unread totals live in
+    `notification_cursors.unread_count`, maintained by the same statements that
+    insert / mark rows, so the badge never needs a COUNT(*).
+    """
+    __tablename__ = "notifications"
+
+    notification_id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user_credentials.user_id", ondelete="CASCADE"), nullable=False)
+    kind = db.Column(db.String(30), nullable=False)  # event_created / event_update / event_assigned / event_reminder
+    event_id = db.Column(db.Integer, db.ForeignKey("events.event_id", ondelete="CASCADE"), nullable=True)
+    message = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    read_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_notifications_user_created", "user_id", "created_at", "notification_id"),
+        # repeated edits of an event leave one unread "updated" entry, not one per save
+        db.Index(
+            "uq_notifications_unread_update", "user_id", "event_id", unique=True,
+            postgresql_where=db.text("read_at IS NULL AND kind = 'event_update'"),
+        ),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.notification_id,
+            "kind": self.kind,
+            "event_id": self.event_id,
+            "message": self.message,
+            "created_at": self.created_at.isoformat(),
+            "read": self.read_at is not None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<Notification #{self.notification_id} user={self.user_id} {self.kind}>"
@@ -0,0 +1,37 @@
+from app.imports import *
+
+
+class NotificationCursor(db.Model):
+    """Per-user notification counters: last sequence issued, last one acked,
+    unread inbox entries.
+
+    Bumped with INSERT ... ON CONFLICT DO UPDATE ... RETURNING, which locks the
+    user's row, so sequence numbers are gap-free and strictly increasing even
+    with several workers writing for the same user.
+    """
+    __tablename__ = "notification_cursors"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user_credentials.user_id", ondelete="CASCADE"), primary_key=True)
+    last_seq = db.Column(db.BigInteger, nullable=False, default=0)
+    acked_seq = db.Column(db.BigInteger, nullable=False, default=0)
+    unread_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<NotificationCursor user={self.user_id} last={self.last_seq} acked={self.acked_seq}>"
+
+
+class NotificationLog(db.Model):
+    """Recent socket notifications per user, kept for replay after a reconnect.
+
+    A ring: only the newest `NOTIFICATION_LOG_RETENTION` rows per user are kept.
+    """
+    __tablename__ = "notification_log"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user_credentials.user_id", ondelete="CASCADE"), primary_key=True)
+    seq = db.Column(db.BigInteger, primary_key=True)
+    event = db.Column(db.String(50), nullable=False)  # socket event name, e.g. "event_assigned"
+    payload = db.Column(db.JSON, nullable=False)  # json, not jsonb: stored verbatim, only replayed
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<NotificationLog user={self.user_id} #{self.seq} {self.event}>"
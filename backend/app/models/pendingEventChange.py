@@ -0,0 +1,18 @@
+from app.imports import *
+
+
+class PendingEventChange(db.Model):
+    """One row per event edited since the last digest run.
+
+    Repeated edits only bump `last_changed_at` / `change_count`; the digest job
+    picks rows whose `first_changed_at` is older than the coalescing window.
+    """
+    __tablename__ = "pending_event_changes"
+
+    event_id = db.Column(db.Integer, db.ForeignKey("events.event_id", ondelete="CASCADE"), primary_key=True)
+    first_changed_at = db.Column(db.DateTime, nullable=False, index=True)
+    last_changed_at = db.Column(db.DateTime, nullable=False)
+    change_count = db.Column(db.Integer, nullable=False, default=1)
+
+    def __repr__(self) -> str:
+        return f"<PendingEventChange event={self.event_id} x{self.change_count}>"
@@ -0,0 +1,18 @@
+from app.imports import *
+
+
+class RateLimitBucket(db.Model):
+    """Shared token buckets for multi-worker rate limiting.
+
+    UNLOGGED: no WAL traffic, contents are lost on crash – fine for counters.
+    """
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key = db.Column(db.String(255), primary_key=True)
+    tokens = db.Column(db.Float, nullable=False)
+    allowed = db.Column(db.Boolean, nullable=False, default=True)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket {self.key} tokens={self.tokens:.2f}>"
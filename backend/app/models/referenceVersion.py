@@ -0,0 +1,44 @@
+from app.imports import *
+from app.models.skill import Skill
+from app.models.state import States
+
+
+class ReferenceVersion(db.Model):
+    """Change counter per reference table (states, skills).
+
+    Bumped by a statement-level trigger on every write to the table, with a
+    value from `reference_version_seq`. Sequence values are never reused, even
+    when the writing transaction rolls back, so a cached copy tagged with an
+    old version can never be mistaken for current (app/utils/reference_cache.py).
+    """
+    __tablename__ = "reference_versions"
+
+    name = db.Column(db.String(63), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReferenceVersion {self.name}={self.version}>"
+
+
+BUMP_FUNCTION = """
+CREATE SEQUENCE IF NOT EXISTS reference_version_seq;
+CREATE OR REPLACE FUNCTION bump_reference_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO reference_versions (name, version)
+    VALUES (TG_TABLE_NAME, nextval('reference_version_seq'))
+    ON CONFLICT (name) DO UPDATE SET version = excluded.version;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+BUMP_TRIGGER = """
+CREATE TRIGGER {table}_bump_reference_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_version();
+"""
+
+# create_all() installs the triggers too (the migration does the same)
+for _table in (States.__table__, Skill.__table__):
+    db.event.listen(_table, "after_create", db.DDL(BUMP_FUNCTION))
+    db.event.listen(_table, "after_create", db.DDL(BUMP_TRIGGER.format(table=_table.name)))
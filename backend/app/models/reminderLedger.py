@@ -0,0 +1,18 @@
+from app.imports import *
+
+
+class ReminderLedger(db.Model):
+    """Reminders already sent, one row per (volunteer, event, offset).
+
+    The reminder job inserts here with ON CONFLICT DO NOTHING and only emits
+    for rows it actually inserted, so each reminder goes out exactly once.
+    """
+    __tablename__ = "reminder_ledger"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user_credentials.user_id", ondelete="CASCADE"), primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey("events.event_id", ondelete="CASCADE"), primary_key=True)
+    offset_minutes = db.Column(db.Integer, primary_key=True)  # "starts in N minutes" reminder
+    sent_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<ReminderLedger user={self.user_id} event={self.event_id} -{self.offset_minutes}m>"
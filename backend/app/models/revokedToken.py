@@ -0,0 +1,16 @@
+from app.imports import *
+
+
+class RevokedToken(db.Model):
+    """Refresh-token blocklist.
+
+    Only *refresh* token ids land here (rotated or logged out), and only until
+    the token would have expired anyway, so the table stays small.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = db.Column(db.String(36), primary_key=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<RevokedToken {self.jti} until={self.expires_at}>"
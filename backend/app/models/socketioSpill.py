@@ -0,0 +1,19 @@
+from app.imports import *
+
+
+class SocketioSpill(db.Model):
+    """Socket.IO messages too large for a NOTIFY payload (8000 bytes).
+
+    `PostgresManager` stores the JSON here and notifies only the id.
+    UNLOGGED and pruned after a minute: rows are only read by listeners
+    within milliseconds of being written.
+    """
+    __tablename__ = "socketio_spill"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    spill_id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    payload = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
+
+    def __repr__(self) -> str:
+        return f"<SocketioSpill {self.spill_id} {len(self.payload)}B>"
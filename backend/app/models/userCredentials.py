@@ -1,6 +1,7 @@
 from app.imports import *
 from datetime import datetime
-from sqlalchemy.orm import relationship
+from sqlalchemy import func, text
+from sqlalchemy.orm import relationship, lazyload
 from app.models.userToSkill import UserToSkill
 
 class User_Roles(enum.Enum):
@@ -12,13 +13,15 @@ class UserCredentials(db.Model):
     __tablename__ = "user_credentials"
 
     user_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), nullable=False)  # unique case-insensitively, see __table_args__
     role = db.Column(db.Enum(User_Roles, name="user_roles", native_enum=True), nullable=False, default=User_Roles.VOLUNTEER)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     password_hash = db.Column(db.String(255), nullable=False)
     email_confirmed_at = db.Column(db.DateTime, nullable=True)
     confirmation_token_version = db.Column(db.Integer, default=0, nullable=False)
+    # Bumped on every role change; carried in JWTs as the `rv` claim.
+    role_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     # One-to-one profile -------------------------------------------------
     profile = relationship(
@@ -37,6 +40,26 @@ class UserCredentials(db.Model):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        db.Index("uq_user_credentials_email_lower", func.lower(email), unique=True),
+        # prefix search (lower(email) LIKE 'x%') and keyset pages sorted by date
+        db.Index("ix_user_credentials_email_pattern", text("lower(email) text_pattern_ops")),
+        db.Index("ix_user_credentials_created", created_at, user_id),
+    )
+
+    @classmethod
+    def find_by_email(cls, email: str) -> "UserCredentials | None":
+        """Case-insensitive lookup served by the lower(email) index.
+
+        Loads only the credential row (no skills_assoc round-trip).
+        """
+        return (
+            cls.query
+            .options(lazyload(cls.skills_assoc))
+            .filter(func.lower(cls.email) == email.strip().lower())
+            .first()
+        )
+
     def __repr__(self) -> str:  # pragma: no cover - debug helper
         return f"<UserCredentials id={self.user_id} email={self.email} role={self.role.name}>"
 
@@ -1,7 +1,9 @@
-from typing import Iterable, List
+from datetime import date
+from typing import Dict, Iterable, List
 
 from sqlalchemy.orm import relationship
-from sqlalchemy import select
+from sqlalchemy import Integer, any_, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 
 from app.imports import db
 from app.models.state import States
@@ -34,6 +36,12 @@ class UserProfiles(db.Model):
     zipcode = db.Column(db.String(9), nullable=False)  # stored digits-only (5 or 9)
     preferences = db.Column(db.Text, nullable=True)
 
+    # Prefix search on lower(full_name). Substring search ("contains") uses the
+    # pg_trgm GIN index ix_user_profiles_full_name_trgm, created by migration only.
+    __table_args__ = (
+        db.Index("ix_user_profiles_full_name_pattern", text("lower(full_name) text_pattern_ops")),
+    )
+
     # Relationships ----------------------------------------------------------
     user = relationship(
         "UserCredentials",
@@ -60,15 +68,34 @@ class UserProfiles(db.Model):
 
     # Skills convenience ----------------------------------------------------
     def get_skill_ids(self) -> List[int]:
+        """Skill ids for this user (see `skill_ids_for` for many users)."""
+        return UserProfiles.skill_ids_for([self.user_id]).get(self.user_id, [])
+
+    @staticmethod
+    def skill_ids_for(user_ids: Iterable[int]) -> Dict[int, List[int]]:
         """
-        Return list of skill_ids for this user by querying user_to_skill.
+        {user_id: [skill_id, ...]} for many users in one query (array_agg).
 
         We query via the association table because its FK targets user_credentials,
-        not user_profiles.
+        not user_profiles. Users without skills are absent from the result.
         """
-        stmt = select(UserToSkill.skill_id).where(UserToSkill.user_id == self.user_id)
-        rows = db.session.execute(stmt).scalars().all()
-        return list(rows)
+        stmt = (
+            select(UserToSkill.user_id, func.array_agg(aggregate_order_by(UserToSkill.skill_id, UserToSkill.skill_id)))
+            .where(UserToSkill.user_id == any_(_int_array(user_ids)))
+            .group_by(UserToSkill.user_id)
+        )
+        return dict(db.session.execute(stmt).all())
+
+    @staticmethod
+    def availability_for(user_ids: Iterable[int]) -> Dict[int, List[date]]:
+        """{user_id: [available_date, ...]} (ascending) for many users in one query."""
+        d = UserAvailability.available_date
+        stmt = (
+            select(UserAvailability.user_id, func.array_agg(aggregate_order_by(d, d)))
+            .where(UserAvailability.user_id == any_(_int_array(user_ids)))
+            .group_by(UserAvailability.user_id)
+        )
+        return dict(db.session.execute(stmt).all())
 
     def get_skills(self) -> List[Skill]:
         """
@@ -89,23 +116,42 @@ class UserProfiles(db.Model):
         include_skills: bool = False,
         include_availability: bool = False,
     ) -> dict:
-        data = {
-            "user_id": self.user_id,
-            "full_name": self.full_name,
-            "address1": self.address1,
-            "address2": self.address2,
-            "city": self.city,
-            "state": self.state_id,
-            "zipcode": self.zipcode,
-            "preferences": self.preferences,
-        }
-
-        if include_skills:
-            data["skills"] = self.get_skill_ids()
-
-        if include_availability:
-            data["availability"] = [
-                ua.available_date.isoformat() for ua in self.availability
-            ]
-
-        return data
\ No newline at end of file
+        return UserProfiles.to_dicts([self], include_skills, include_availability)[0]
+
+    @staticmethod
+    def to_dicts(
+        profiles: List["UserProfiles"],
+        include_skills: bool = False,
+        include_availability: bool = False,
+    ) -> List[dict]:
+        """
+        Serialize many profiles with at most one skills query and one
+        availability query in total, however many profiles there are.
+        """
+        ids = [p.user_id for p in profiles]
+        skills = UserProfiles.skill_ids_for(ids) if include_skills and ids else {}
+        availability = UserProfiles.availability_for(ids) if include_availability and ids else {}
+
+        out = []
+        for p in profiles:
+            data = {
+                "user_id": p.user_id,
+                "full_name": p.full_name,
+                "address1": p.address1,
+                "address2": p.address2,
+                "city": p.city,
+                "state": p.state_id,
+                "zipcode": p.zipcode,
+                "preferences": p.preferences,
+            }
+            if include_skills:
+                data["skills"] = skills.get(p.user_id, [])
+            if include_availability:
+                data["availability"] = [d.isoformat() for d in availability.get(p.user_id, [])]
+            out.append(data)
+        return out
+
+
+def _int_array(values: Iterable[int]):
+    # one array parameter (= ANY(:ids)) instead of an IN list per id count
+    return bindparam("user_ids", [int(v) for v in values], type_=ARRAY(Integer))
@@ -1,4 +1,5 @@
 from app.imports import *
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 class UrgencyEnum(enum.IntEnum):
     LOW = 0
@@ -20,8 +21,32 @@ class VolunteerHistory(db.Model):
     event_id = db.Column(db.Integer, db.ForeignKey('events.event_id'), nullable=False)
     participation_status = db.Column(db.Enum(ParticipationStatusEnum), nullable=False)
     hours_volunteered = db.Column(db.Numeric(4,2), nullable=True)
-    
 
-    
+    # One assignment row per (volunteer, event) – see `assign` below.
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "event_id", name="uq_volunteer_history_user_event"),
+        db.Index("ix_volunteer_history_user", "user_id", "vol_history_id"),  # keyset pages of /tasks
+    )
+
+    @classmethod
+    def assign(cls, user_id: int, event_id: int) -> bool:
+        """Idempotently assign a volunteer to an event.
+
+        Upserts on (user_id, event_id) and returns True only when a new row
+        was inserted, so callers can skip duplicate notifications.
+        """
+        stmt = (
+            pg_insert(cls)
+            .values(
+                user_id=user_id,
+                event_id=event_id,
+                participation_status=ParticipationStatusEnum.ASSIGNED,
+                hours_volunteered=0,
+            )
+            .on_conflict_do_nothing(constraint="uq_volunteer_history_user_event")
+            .returning(cls.vol_history_id)
+        )
+        return db.session.execute(stmt).scalar() is not None
+
 def __repr__(self):
     return f"<VolunteerHistory user={self.user_id}, event={self.event_id}, status={self.participation_status.name}>"
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Blueprint registry.
+
+Route modules are imported by `register_blueprints` (called from
+`create_app`), not when `app` or `app.imports` is imported, so scripts,
+migrations and tooling that never build the web app don't load them.
+"""
+
+
+def register_blueprints(app) -> None:
+    from app.routes.states import states_bp
+    from app.routes.user_profiles import users_profiles_bp
+    from app.routes.registration import register_user_bp
+    from app.routes.login import login_user_bp
+    from app.routes.events import events_bp
+    from app.routes.skills import skills_bp
+    from app.routes.volunteer_history import volunteer_history_bp
+    from app.routes.admin import admin_bp
+    from app.routes.task import task_list_bp
+    from app.routes.volunteer_matching import volunteer_matching_bp
+    from app.routes.notifications import notifications_bp
+    from app.routes.metrics import metrics_bp
+    # from app.routes.converters import converters_bp  # Uncomment if converters are needed
+
+    blueprint_with_prefixes = {
+        states_bp: '/states',
+        users_profiles_bp: '/volunteer/profile',
+        register_user_bp: '/auth',
+        login_user_bp: '/auth',
+        events_bp: '/events',
+        skills_bp: '/skills',
+        volunteer_history_bp: '/volunteer/history',
+        admin_bp: '/admin',
+        task_list_bp: '/tasks',
+        volunteer_matching_bp: '/volunteer/matching',
+        notifications_bp: '/notifications',
+        metrics_bp: '/metrics',
+        # converters_bp: '/converters'
+    }
+    for blueprint, prefix in blueprint_with_prefixes.items():
+        app.register_blueprint(blueprint, url_prefix=prefix)
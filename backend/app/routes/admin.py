@@ -1,7 +1,12 @@
 from app.imports import *
-from flask import Blueprint, jsonify, request
-from sqlalchemy.orm import joinedload
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, lazyload
 from app.models import UserProfiles, UserCredentials, User_Roles
+from app.utils.auth import invalidate_role_cache, roles_required
+from app.utils.bulk_import import ImportTooLarge, import_volunteers
+from app.utils.query_handler import Filter, ListSpec, QueryError, parse_date, parse_end_date
+from app.utils.socket_metrics import socket_metrics_snapshot
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -12,7 +17,10 @@ def pending_users():
         UserCredentials.query
         .filter_by(role=User_Roles.ADMIN_PENDING)
         .outerjoin(UserProfiles)
-        .options(joinedload(UserCredentials.profile))
+        .options(
+            joinedload(UserCredentials.profile).lazyload(UserProfiles.availability),
+            lazyload(UserCredentials.skills_assoc),
+        )
         .all()
     )
 
@@ -36,7 +44,9 @@ def approve_user(user_id):
 
     if user.role == User_Roles.ADMIN_PENDING:
         user.role = User_Roles.ADMIN
+        user.role_version += 1
         db.session.commit()
+        invalidate_role_cache(user_id)
         return jsonify({"message": "User approved"}), 200
     elif user.role == User_Roles.VOLUNTEER:
         return jsonify({"error": "User is a volunteer"}), 400
@@ -53,7 +63,9 @@ def deny_user(user_id):
 
     if user.role == User_Roles.ADMIN_PENDING:
         user.role = User_Roles.VOLUNTEER
+        user.role_version += 1
         db.session.commit()
+        invalidate_role_cache(user_id)
         return jsonify({"message": "User denied"}), 200
     elif user.role == User_Roles.VOLUNTEER:
         return jsonify({"error": "User is already a volunteer"}), 400
@@ -62,20 +74,115 @@ def deny_user(user_id):
 
 
 # ------------------- List All Users -------------------
+USER_LIST = ListSpec(
+    UserCredentials,
+    filters={
+        "role": Filter(UserCredentials.role),
+        "state": Filter(UserProfiles.state_id, parse=str.upper),
+        "email": Filter(UserCredentials.email, "prefix"),
+        "name": Filter(UserProfiles.full_name, "prefix"),
+        "q": Filter(UserProfiles.full_name, "contains"),  # trigram index
+        "start_date": Filter(UserCredentials.created_at, "min", parse=parse_date),
+        "end_date": Filter(UserCredentials.created_at, "before", parse=parse_end_date),
+    },
+    sorts={
+        "user_id": UserCredentials.user_id,
+        "created_at": UserCredentials.created_at,
+        "email": func.lower(UserCredentials.email),
+        "full_name": func.coalesce(UserProfiles.full_name, ""),
+        "role": UserCredentials.role,
+    },
+    joins=[(UserProfiles, UserProfiles.user_id == UserCredentials.user_id)],
+)
+
+
 @admin_bp.route("/list", methods=["GET"])
 def list_users():
-    filters_dict = request.args.to_dict()
-    users = query_handler(UserCredentials, filters_dict, date_column="created_at")
+    """
+    Filters: role, state, email (prefix), name (prefix), q (name contains),
+    start_date / end_date (MM-DD-YYYY or YYYY-MM-DD, inclusive).
+    Sort: sort=user_id|created_at|email|full_name|role, order=asc|desc.
+    Paging: limit, then `cursor` = the previous page's `next_cursor`.
+    """
+    try:
+        # plain columns off the profile join: one statement per page, no
+        # per-user profile loads and no skills_assoc selectin
+        page = query_handler(USER_LIST, request.args, columns=[
+            UserCredentials.user_id, UserProfiles.full_name, UserCredentials.role, UserProfiles.state_id,
+        ])
+    except QueryError as exc:
+        return jsonify({"error": str(exc)}), 400
 
-    if not users:
-        return jsonify({"message": "No users found"}), 404
+    return jsonify({
+        "items": [{**row, "role": row["role"].name} for row in page],
+        "next_cursor": page.next_cursor,
+    }), 200
 
-    return jsonify([
-        {
-            "user_id": user.user_id,
-            "full_name": user.profile.full_name if user.profile else None,
-            "role": user.role.name,
-            "state_id": user.profile.state_id if user.profile else None
-        }
-        for user in users
-    ]), 200
+
+# ------------------- Batch Profiles -------------------
+MAX_PROFILE_BATCH = 200
+
+
+@admin_bp.route("/profiles", methods=["GET"])
+@roles_required(User_Roles.ADMIN)
+def batch_profiles():
+    """
+    GET /admin/profiles?ids=1,2,3 (or ids=1&ids=2...): full profiles with
+    skills and availability, in the order asked for. Three queries however
+    many ids (profiles, skills, availability); ids without a profile are
+    returned in `missing`.
+    """
+    try:
+        ids = list(dict.fromkeys(
+            int(part) for raw in request.args.getlist("ids") for part in raw.split(",") if part.strip()
+        ))
+    except ValueError:
+        return jsonify({"error": "ids must be integers"}), 400
+    if not ids:
+        return jsonify({"error": "ids required"}), 400
+    if len(ids) > MAX_PROFILE_BATCH:
+        return jsonify({"error": f"At most {MAX_PROFILE_BATCH} ids per request"}), 400
+
+    profiles = db.session.execute(
+        select(UserProfiles)
+        .where(UserProfiles.user_id.in_(ids))
+        .options(lazyload(UserProfiles.user), lazyload(UserProfiles.availability))
+    ).scalars().all()
+    by_id = {p.user_id: p for p in profiles}
+    ordered = [by_id[i] for i in ids if i in by_id]
+
+    return jsonify({
+        "profiles": UserProfiles.to_dicts(ordered, include_skills=True, include_availability=True),
+        "missing": [i for i in ids if i not in by_id],
+    }), 200
+
+
+# ------------------- Bulk Import Volunteers -------------------
+@admin_bp.route("/import-volunteers", methods=["POST"])
+@roles_required(User_Roles.ADMIN)
+def import_volunteers_csv():
+    """Create volunteers from a CSV upload (multipart field `file`, or a text/csv body)."""
+    upload = request.files.get("file")
+    raw = upload.read() if upload else request.get_data()
+    if not raw:
+        return jsonify({"error": "CSV file required."}), 400
+    try:
+        # runs inside the request: small files only, hashed inline (no process pool)
+        report = import_volunteers(
+            raw.decode("utf-8-sig"),
+            max_rows=current_app.config.get("BULK_IMPORT_MAX_HTTP_ROWS", 200),
+            processes=1,
+        )
+    except ImportTooLarge as exc:
+        return jsonify({"error": str(exc)}), 413
+    except (UnicodeDecodeError, ValueError) as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(report), 201 if report["created"] else 200
+
+
+# ------------------- Socket Emit Metrics -------------------
+@admin_bp.route("/socket-metrics", methods=["GET"])
+@roles_required(User_Roles.ADMIN)
+def socket_metrics():
+    """Same snapshot as the local-only /metrics/sockets, for admins."""
+    return jsonify(socket_metrics_snapshot()), 200
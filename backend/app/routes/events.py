@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 from sqlalchemy import cast, Date
+from sqlalchemy.orm import selectinload
 from flask import Blueprint, jsonify, request
 from datetime import datetime, time
 from app.imports import db
@@ -11,14 +12,13 @@ from flask_jwt_extended import get_jwt_identity, jwt_required
 from app.models.events import Events, UrgencyEnum
 from app.models.skill import Skill
 from app.models.userCredentials import UserCredentials
+from app.utils.event_digest import record_event_change
+from app.utils.inbox import add_event_to_inbox
+from app.utils.reminders import schedule_event_reminders
+from app.utils.emit_coalescer import coalesced_emit
+from app.utils.query_handler import Filter, ListSpec, QueryError, parse_date, parse_end_date, query_handler
+from app.utils.socket_rooms import event_rooms
 
-# ───────────────────────── socket.io: safe import ─────────────────────────
-try:
-    from app.sockets import socketio          # type: ignore
-except Exception:                              # noqa: BLE001
-    import types
-    socketio = types.SimpleNamespace(emit=lambda *a, **kw: None)  # type: ignore
-# --------------------------------------------------------------------------
 
 events_bp = Blueprint("events", __name__)
 
@@ -43,28 +43,42 @@ def _serialize(event: Events) -> dict:
 # ---------------------------------------------------------------------------
 # list endpoints
 # ---------------------------------------------------------------------------
+EVENT_FILTERS = {
+    "state": Filter(Events.state_id, parse=str.upper),
+    "city": Filter(Events.city, "prefix"),
+    "name": Filter(Events.name, "prefix"),
+    "urgency": Filter(Events.urgency, parse=lambda v: UrgencyEnum[v.lower()]),
+    "start_date": Filter(Events.date, "min", parse=parse_date),
+    "end_date": Filter(Events.date, "before", parse=parse_end_date),
+}
+EVENT_SORTS = {"date": Events.date, "event_id": Events.event_id}
+UPCOMING_EVENTS = ListSpec(Events, EVENT_FILTERS, EVENT_SORTS)
+PAST_EVENTS = ListSpec(Events, EVENT_FILTERS, EVENT_SORTS, default_order="desc")
+
+
+def _event_page(spec: ListSpec, window):
+    try:
+        # one IN query for every page's skills instead of the joined eager load
+        page = query_handler(spec, request.args, options=[selectinload(Events.skills)], where=[window])
+    except QueryError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify({"items": [_serialize(r) for r in page], "next_cursor": page.next_cursor}), 200
+
+
 @events_bp.get("/upcoming")
 def list_upcoming_events():
-    now = datetime.utcnow()
-    rows: List[Events] = (
-        Events.query
-        .filter(Events.date >= now)
-        .order_by(Events.date)
-        .all()
-    )
-    return jsonify([_serialize(r) for r in rows]), 200
+    """
+    Filters: state, city (prefix), name (prefix), urgency, start_date / end_date.
+    Sort: sort=date|event_id, order=asc|desc (soonest first by default).
+    Paging: limit, then `cursor` = the previous page's `next_cursor`.
+    """
+    return _event_page(UPCOMING_EVENTS, Events.date >= datetime.utcnow())
 
 
 @events_bp.get("/past")
 def list_past_events():
-    now = datetime.utcnow()
-    rows: List[Events] = (
-        Events.query
-        .filter(Events.date < now)
-        .order_by(Events.date.desc())
-        .all()
-    )
-    return jsonify([_serialize(r) for r in rows]), 200
+    """Same parameters as /upcoming; most recent first by default."""
+    return _event_page(PAST_EVENTS, Events.date < datetime.utcnow())
 
 # ---------------------------------------------------------------------------
 # single‑row CRUD
@@ -101,13 +115,19 @@ def create_event():
             .all()
         )
 
+    db.session.flush()  # skills must be visible to the inbox INSERT ... SELECT
+    add_event_to_inbox(new_row.event_id, new_row.state_id, "event_created",
+                       f"New event '{new_row.name}' has been created.")
+    schedule_event_reminders(new_row.event_id, new_row.date)  # NOTIFY goes out with the commit
     db.session.commit()
 
-    socketio.emit(
+    payload = _serialize(new_row)
+    coalesced_emit(
         "event_created",
-        {**_serialize(new_row),
+        new_row.event_id,
+        {**payload,
          "message": f"🆕 New event '{new_row.name}' has been created!"},
-        broadcast=True,
+        to=event_rooms(payload["state_id"], payload["skills"]),  # only volunteers who could care
     )
     print("✅ Event created:", new_row.event_id)
 
@@ -139,15 +159,23 @@ def update_event(event_id: int):
             .all()
         )
 
+    record_event_change(row.event_id)  # emailed to volunteers as a digest later
+    db.session.flush()
+    add_event_to_inbox(row.event_id, row.state_id, "event_update",
+                       f"Event '{row.name}' has been updated.")
+    schedule_event_reminders(row.event_id, row.date)  # NOTIFY goes out with the commit
     db.session.commit()
 
-    socketio.emit(
+    # repeated saves of the same event within the window collapse into one item
+    payload = _serialize(row)
+    coalesced_emit(
         "event_update",
+        row.event_id,
         {
-            **_serialize(row),
+            **payload,
             "message": f"📅 Event '{row.name}' has been updated."
         },
-        broadcast=True,
+        to=event_rooms(payload["state_id"], payload["skills"]),
     )
     print(" UPDATED AHH")
 
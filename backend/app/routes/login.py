@@ -1,13 +1,18 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.security import check_password_hash
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, get_jwt
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.imports import db
 from app.models.userCredentials import UserCredentials, User_Roles
+from app.models.revokedToken import RevokedToken
+from app.utils.passwords import HashPoolBusy, needs_rehash, hash_password, verify_password
+from app.utils.rate_limit import enforce_auth_rate_limit
 
 from datetime import datetime
 
 login_user_bp = Blueprint("login_user", __name__)
+login_user_bp.before_request(enforce_auth_rate_limit)
 
 
 # ------------------------------------------------------------------
@@ -23,13 +28,21 @@ def login():
     if not email or not password:
         return jsonify({"error": "missing_credentials", "message": "Email and password are required."}), 400
 
-    user = UserCredentials.query.filter_by(email=email).first()
+    user = UserCredentials.find_by_email(email)
     if not user:
         # Deliberately vague to avoid user enumeration
         return jsonify({"error": "invalid_login", "message": "Invalid email or password."}), 401
 
-    if not check_password_hash(user.password_hash, password):
-        return jsonify({"error": "invalid_login", "message": "Invalid email or password."}), 401
+    try:
+        if not verify_password(user.password_hash, password):
+            return jsonify({"error": "invalid_login", "message": "Invalid email or password."}), 401
+
+        # Cost changed since this hash was made -> upgrade it while we have the plaintext
+        if needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
+            db.session.commit()
+    except HashPoolBusy:
+        return jsonify({"error": "busy", "message": "Too many sign-in attempts right now. Please retry shortly."}), 503, {"Retry-After": "1"}
 
     # Email confirmation gate -----------------------------------------
     if not user.is_email_confirmed:
@@ -53,7 +66,9 @@ def login():
         )
 
     # Good login -> issue token --------------------------------------
-    access_token = create_access_token(identity=user.user_id)
+    # Pass the loaded row: claims are built from it, no second SELECT
+    access_token = create_access_token(identity=user)
+    refresh_token = create_refresh_token(identity=user)
 
     payload = user_to_dict(user)
 
@@ -67,10 +82,48 @@ def login():
 
     return jsonify({
         "access_token": access_token,
+        "refresh_token": refresh_token,
         "user": payload,
     }), 200
 
 
+# ------------------------------------------------------------------
+# POST /auth/refresh
+# Header: Authorization: Bearer <refresh token>
+# Rotates the refresh token: the presented one is revoked and a new
+# access/refresh pair is returned. No password hash involved.
+# ------------------------------------------------------------------
+@login_user_bp.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+def refresh():
+    claims = get_jwt()
+    user = db.session.get(UserCredentials, int(get_jwt_identity()))
+    if not user or not user.is_email_confirmed or user.is_admin_pending:
+        return jsonify({"error": "invalid_refresh", "message": "Please sign in again."}), 401
+
+    if not _revoke_refresh_token(claims):
+        # Lost a race with another refresh using the same token
+        return jsonify({"error": "invalid_refresh", "message": "Please sign in again."}), 401
+    db.session.commit()
+
+    return jsonify({
+        "access_token": create_access_token(identity=user),
+        "refresh_token": create_refresh_token(identity=user),
+    }), 200
+
+
+# ------------------------------------------------------------------
+# POST /auth/logout
+# Header: Authorization: Bearer <refresh token>
+# ------------------------------------------------------------------
+@login_user_bp.route("/logout", methods=["POST"])
+@jwt_required(refresh=True)
+def logout():
+    _revoke_refresh_token(get_jwt())
+    db.session.commit()
+    return jsonify({"message": "Signed out."}), 200
+
+
 # ------------------------------------------------------------------
 # POST /auth/resend-confirmation  (optional helper)
 # Body: {"email": str}
@@ -80,7 +133,7 @@ def login():
 @login_user_bp.route("/resend-confirmation", methods=["POST"])
 def resend_confirmation():
     from app.utils.tokens import generate_email_token
-    from app.utils.mailer import send_email_confirmation
+    from app.utils.mailer import queue_email_confirmation
     from flask import url_for
 
     data = request.get_json(silent=True) or {}
@@ -88,11 +141,12 @@ def resend_confirmation():
     if not email:
         return jsonify({"error": "missing_email", "message": "Email is required."}), 400
 
-    user = UserCredentials.query.filter_by(email=email).first()
+    user = UserCredentials.find_by_email(email)
     if user and not user.is_email_confirmed:
         token = generate_email_token(user.user_id, user.email, user.role.value.lower(), user.confirmation_token_version)
         confirm_link = url_for("register_user.confirm_email", token=token, _external=True)
-        send_email_confirmation(to_email=user.email, confirm_url=confirm_link)
+        queue_email_confirmation(to_email=user.email, confirm_url=confirm_link)
+        db.session.commit()
 
     # Always return 200 so attackers can't probe which emails exist
     return jsonify({"message": "If that email is registered and unconfirmed, a confirmation link has been sent."}), 200
@@ -128,4 +182,20 @@ def user_to_dict(user: UserCredentials) -> dict:
         "email_confirmed_at": user.email_confirmed_at.isoformat() if user.email_confirmed_at else None,
         "created_at": user.created_at.isoformat() if user.created_at else None,
         "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-    }
\ No newline at end of file
+    }
+
+
+def _revoke_refresh_token(claims: dict) -> bool:
+    """Blocklist a refresh token until its natural expiry.
+
+    Returns False when the jti was already revoked. Expired entries are
+    purged on the way so the table only ever holds live tokens.
+    """
+    db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow()))
+    stmt = (
+        pg_insert(RevokedToken)
+        .values(jti=claims["jti"], expires_at=datetime.utcfromtimestamp(claims["exp"]))
+        .on_conflict_do_nothing()
+        .returning(RevokedToken.jti)
+    )
+    return db.session.execute(stmt).scalar() is not None
@@ -0,0 +1,15 @@
+# backend/app/routes/metrics.py
+from __future__ import annotations
+
+from flask import Blueprint, jsonify
+
+from app.utils.auth import local_only
+from app.utils.socket_metrics import socket_metrics_snapshot
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.get("/sockets")               # GET /metrics/sockets (loopback only)
+@local_only
+def socket_metrics():
+    return jsonify(socket_metrics_snapshot()), 200
@@ -0,0 +1,56 @@
+# backend/app/routes/notifications.py
+from __future__ import annotations
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.imports import db
+from app.utils import inbox
+
+notifications_bp = Blueprint("notifications", __name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@notifications_bp.get("")                 # GET /notifications?cursor=&limit=
+@jwt_required()
+def list_my_notifications():
+    """Newest first. Pass `next_cursor` back as `cursor` for the next page."""
+    uid = int(get_jwt_identity())
+    try:
+        limit = min(max(int(request.args.get("limit", DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        rows, next_cursor = inbox.list_page(uid, request.args.get("cursor") or None, limit)
+    except ValueError as exc:
+        return jsonify({"error": "bad_request", "message": str(exc)}), 400
+    return jsonify({
+        "items": [n.to_dict() for n in rows],
+        "next_cursor": next_cursor,
+        "unread": inbox.unread_count(uid),
+    }), 200
+
+
+@notifications_bp.get("/unread-count")
+@jwt_required()
+def my_unread_count():
+    return jsonify({"unread": inbox.unread_count(int(get_jwt_identity()))}), 200
+
+
+@notifications_bp.post("/read")           # POST /notifications/read
+@jwt_required()
+def mark_my_notifications_read():
+    """
+    Body: { "ids": [<notification_id>, ...] }  or  { "all": true }
+    """
+    uid = int(get_jwt_identity())
+    data = request.get_json(silent=True) or {}
+    if data.get("all") is True:
+        ids = None
+    elif isinstance(data.get("ids"), list) and all(isinstance(i, int) for i in data["ids"]):
+        ids = data["ids"]
+    else:
+        return jsonify({"error": "bad_request", "message": "ids (list of ints) or all=true required"}), 400
+
+    unread = inbox.mark_read(uid, ids)
+    db.session.commit()
+    return jsonify({"unread": unread}), 200
@@ -1,5 +1,4 @@
 from app.imports import *
-from werkzeug.security import generate_password_hash
 from sqlalchemy.exc import IntegrityError
 from flask import current_app, url_for, redirect, request, jsonify, Blueprint
 
@@ -7,9 +6,12 @@ from datetime import datetime
 
 from app.models.userCredentials import UserCredentials, User_Roles
 from app.utils.tokens import generate_email_token, verify_email_token
-from app.utils.mailer import send_email_confirmation
+from app.utils.mailer import queue_email_confirmation
+from app.utils.passwords import HashPoolBusy, hash_password
+from app.utils.rate_limit import enforce_auth_rate_limit
 
 register_user_bp = Blueprint("register_user", __name__)
+register_user_bp.before_request(enforce_auth_rate_limit)
 
 
 @register_user_bp.route("/test", methods=["GET"])
@@ -28,7 +30,8 @@ def register_user():
       * volunteer → role=VOLUNTEER
       * admin → role=ADMIN_PENDING (will require manual staff approval later)
     - Leave `email_confirmed_at` NULL until email link clicked.
-    - Send confirmation email.
+    - Queue the confirmation email in the outbox (same commit as the user row);
+      the background sender delivers it, so SMTP never blocks this request.
     """
     data = request.get_json(silent=True) or {}
     email = (data.get("email") or "").strip().lower()
@@ -47,11 +50,16 @@ def register_user():
     else:  # admin requested
         db_role = User_Roles.ADMIN_PENDING
 
-    user = UserCredentials(email=email, role=db_role, password_hash=generate_password_hash(password))
+    try:
+        password_hash = hash_password(password)
+    except HashPoolBusy:
+        return jsonify({"error": "Server busy, please retry shortly."}), 503, {"Retry-After": "1"}
+
+    user = UserCredentials(email=email, role=db_role, password_hash=password_hash)
 
     db.session.add(user)
     try:
-        db.session.commit()
+        db.session.flush()  # assigns user_id; duplicate email surfaces here
     except IntegrityError:
         db.session.rollback()
         return jsonify({"error": "Email already registered."}), 409
@@ -60,8 +68,9 @@ def register_user():
     token = generate_email_token(user.user_id, user.email, role_requested, user.confirmation_token_version)
     confirm_link = url_for("register_user.confirm_email", token=token, _external=True)
 
-    # send mail -----------------------------------------------------------
-    send_email_confirmation(to_email=user.email, confirm_url=confirm_link)
+    # queue mail + user row in one transaction ----------------------------
+    queue_email_confirmation(to_email=user.email, confirm_url=confirm_link)
+    db.session.commit()
 
     return (
         jsonify({
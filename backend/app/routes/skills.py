@@ -1,17 +1,12 @@
 from __future__ import annotations
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app
 
-from app.imports import db
-from app.models.skill import Skill
+from app.utils.reference_cache import reference_cache
 
 skills_bp = Blueprint("skills", __name__)
 
 @skills_bp.get("/")
 def list_skills():
-    rows = db.session.query(Skill).order_by(Skill.skill_name).all()
-    return jsonify({
-        "skills": [
-            {"id": r.skill_id, "name": r.skill_name, "level": r.level.name} for r in rows
-        ]
-    }), 200
\ No newline at end of file
+    # body encoded once per change to `skills`, see app/utils/reference_cache.py
+    return current_app.response_class(reference_cache.get().skills_json, mimetype="application/json")
@@ -1,15 +1,10 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app
 
-from app.imports import db
-from app.models.state import States
+from app.utils.reference_cache import reference_cache
 
 states_bp = Blueprint("states", __name__)
 
 @states_bp.get("/")
 def list_states():
-    rows = db.session.query(States).order_by(States.name).all()
-    return jsonify({
-        "states": [
-            {"code": r.state_id, "name": r.name} for r in rows
-        ]
-    }), 200
\ No newline at end of file
+    # body encoded once per change to `states`, see app/utils/reference_cache.py
+    return current_app.response_class(reference_cache.get().states_json, mimetype="application/json")
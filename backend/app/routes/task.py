@@ -8,43 +8,62 @@ from app.imports import db
 from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
 from app.models.events           import Events
 from app.models.userCredentials  import UserCredentials
+from app.utils.query_handler     import Filter, ListSpec, QueryError, query_handler
 
 task_list_bp = Blueprint("task_list", __name__, url_prefix="/tasks")
 
 # ───────────────────────────────────────── helpers ──────────────────────────
-def _task_row(vh: VolunteerHistory, ev: Events, assignee_email: str) -> dict:
+def _task_row(row: dict) -> dict:
     """Return the JSON shape expected by the React TaskList."""
     return {
-        "id":          str(vh.vol_history_id),
-        "title":       ev.name,
-        "description": ev.description,
-        "date":        ev.date.date().isoformat(),
-        "status":      vh.participation_status.name.lower(),  # assigned / registered / completed
-        "assignee":    assignee_email,
+        "id":          str(row["vol_history_id"]),
+        "title":       row["name"],
+        "description": row["description"],
+        "date":        row["date"].date().isoformat(),
+        "status":      row["participation_status"].name.lower(),  # assigned / registered / completed
+        "assignee":    row["email"],
     }
 
+
+TASK_LIST = ListSpec(
+    VolunteerHistory,
+    filters={"status": Filter(VolunteerHistory.participation_status)},
+    sorts={"id": VolunteerHistory.vol_history_id, "date": Events.date},
+    joins=[
+        (Events,          Events.event_id        == VolunteerHistory.event_id),
+        (UserCredentials, UserCredentials.user_id == VolunteerHistory.user_id),
+    ],
+)
+
 # ───────────────────────────────────────── routes ───────────────────────────
 @task_list_bp.get("")                 # GET /tasks
 @jwt_required()
-def list_my_tasks() -> tuple[list[dict], int]:
-    """Return every task that belongs to the *current* volunteer."""
+def list_my_tasks() -> tuple[dict, int]:
+    """Return a page of the tasks that belong to the *current* volunteer.
+
+    Filters: status. Sort: sort=id|date, order=asc|desc.
+    Paging: limit, then `cursor` = the previous page's `next_cursor`.
+    """
     uid = int(get_jwt_identity())     # ← cast JWT “sub” to int
 
-    rows = (
-        db.session.query(
-            VolunteerHistory,
-            Events,
-            UserCredentials.email,
+    try:
+        page = query_handler(
+            TASK_LIST,
+            request.args,
+            columns=[
+                VolunteerHistory.vol_history_id,
+                VolunteerHistory.participation_status,
+                Events.name,
+                Events.description,
+                Events.date,
+                UserCredentials.email,
+            ],
+            where=[VolunteerHistory.user_id == uid],
         )
-        .join(Events,          Events.event_id        == VolunteerHistory.event_id)
-        .join(UserCredentials, UserCredentials.user_id == VolunteerHistory.user_id)
-        .filter(VolunteerHistory.user_id == uid)
-        .order_by(VolunteerHistory.vol_history_id)
-        .all()
-    )
-
-    tasks = [_task_row(vh, ev, email) for vh, ev, email in rows]
-    return jsonify(tasks), 200
+    except QueryError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    return jsonify({"items": [_task_row(row) for row in page], "next_cursor": page.next_cursor}), 200
 
 
 @task_list_bp.post("/status")         # POST /tasks/status
@@ -9,11 +9,11 @@ from sqlalchemy import select
 
 from app.imports import db
 from app.models.userProfiles import UserProfiles
-from app.models.userToSkill import UserToSkill
-from app.models.userAvailability import UserAvailability
 from app.models.skill import Skill
 
+from app.utils.profile_sync import sync_availability, sync_skills
 from app.utils.profile_validation import validate_profile_payload
+from app.utils.socket_rooms import refresh_interest_rooms
 
 users_profiles_bp = Blueprint("users_profiles", __name__)
 
@@ -61,15 +61,10 @@ def _apply_profile_changes(uid: int, payload: dict) -> tuple[UserProfiles, bool]
         prof.zipcode = payload["zipcode"]
         prof.preferences = payload.get("preferences")
 
-    # Replace skills ------------------------------------------------------
-    db.session.query(UserToSkill).filter_by(user_id=uid).delete(synchronize_session=False)
-    for sid in payload["skills"]:
-        db.session.add(UserToSkill(user_id=uid, skill_id=sid))
-
-    # Replace availability ------------------------------------------------
-    db.session.query(UserAvailability).filter_by(user_id=uid).delete(synchronize_session=False)
-    for ds in payload["availability"]:  # iso yyyy-mm-dd
-        db.session.add(UserAvailability(user_id=uid, available_date=ds))
+    # Skills / availability: write only what changed --------------------
+    db.session.flush()  # a new profile must exist before its availability rows
+    sync_skills(int(uid), payload["skills"])
+    sync_availability(int(uid), payload["availability"])  # iso yyyy-mm-dd
 
     return prof, created
 
@@ -102,6 +97,7 @@ def create_or_update_my_profile():
 
     prof, created = _apply_profile_changes(uid, norm)
     db.session.commit()
+    refresh_interest_rooms(int(uid))  # state / skills may have changed
     return jsonify({"profile": _serialize_profile(prof), "created": created}), 200
 
 
@@ -127,4 +123,5 @@ def patch_my_profile():
 
     _apply_profile_changes(uid, norm)
     db.session.commit()
+    refresh_interest_rooms(int(uid))
     return jsonify({"profile": _serialize_profile(prof)}), 200
\ No newline at end of file
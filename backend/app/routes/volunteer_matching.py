@@ -12,6 +12,9 @@ from app.models.userProfiles     import UserProfiles
 from app.models.userToSkill      import UserToSkill
 from app.models.userAvailability import UserAvailability
 from app.models.volunteerHistory import VolunteerHistory
+from app.utils.inbox import add_to_inbox
+from app.utils.notification_log import emit_recorded, record_notifications
+from app.utils.reminders import schedule_event_reminders
 
 volunteer_matching_bp = Blueprint(
     "volunteer_matching",
@@ -149,28 +152,30 @@ def save_volunteer_match():
         return jsonify({"error": "eventId and volunteerId required"}), 400
 
     if str(eid).isdigit() and str(vid).isdigit():
-        db.session.execute(
-            sql(
-                "INSERT INTO volunteer_history "
-                "(user_id, event_id, participation_status, hours_volunteered) "
-                "VALUES (:uid, :eid, 'ASSIGNED', 0) "
-                "ON CONFLICT DO NOTHING"
-            ),
-            {"uid": int(vid), "eid": int(eid)},
-        )
+        inserted = VolunteerHistory.assign(user_id=int(vid), event_id=int(eid))
+        if not inserted:
+            # already assigned → nothing new to tell the volunteer
+            db.session.commit()
+            return jsonify({"saved": {"eventId": eid, "volunteerId": vid}, "created": False}), 200
+
+        schedule_event_reminders(int(eid))  # a reminder band may already be open
+        add_to_inbox([{"user_id": int(vid), "kind": "event_assigned", "event_id": int(eid),
+                       "message": f"You have been assigned to event #{eid}."}])
+        # logged with a sequence number, in the assignment's transaction, so a
+        # disconnected volunteer gets it on replay
+        recorded = record_notifications([(
+            int(vid),
+            "event_assigned",
+            {
+                "eventId": eid,
+                "volunteerId": vid,
+                "message": f"🎉 You’ve been assigned to event #{eid}!",
+            },
+        )])
         db.session.commit()
-        
+
         try:
-            from app.sockets import socketio
-            socketio.emit(
-                "event_assigned",
-                {
-                    "eventId": eid,
-                    "volunteerId": vid,
-                    "message": f"🎉 You’ve been assigned to event #{eid}!",
-                },
-                to=str(vid),  # emit to the volunteer’s socket room
-            )
+            emit_recorded(recorded)
         except Exception as e:
             print("⚠️ Socket emit failed:", str(e))
 
@@ -1,7 +1,7 @@
-from app import create_app, socketio
-# import app.sockets
+from app import create_app, socketio, start_background_services
 
 app = create_app()
+start_background_services(app)  # periodic jobs only run in serving processes
 
 if __name__ == "__main__":
     socketio.run(app, debug=True, allow_unsafe_werkzeug=True)
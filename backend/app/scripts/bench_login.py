@@ -0,0 +1,56 @@
+"""Login throughput with inline hashing vs. the bounded hash pool.
+
+    python -m app.scripts.bench_login [logins] [concurrency]
+
+Creates a temporary confirmed volunteer, hammers POST /auth/login from
+`concurrency` threads, then deletes the user again.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import perf_counter
+
+from app import create_app, db
+from app.models.userCredentials import UserCredentials, User_Roles
+from app.utils.passwords import hash_password, shutdown_pool
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+CONCURRENCY = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+EMAIL, PASSWORD = "bench-login@example.invalid", "BenchPass!1"
+
+app = create_app()
+client = app.test_client()
+
+with app.app_context():
+    user = UserCredentials(
+        email=EMAIL,
+        role=User_Roles.VOLUNTEER,
+        password_hash=hash_password(PASSWORD),
+        email_confirmed_at=datetime.utcnow(),
+    )
+    db.session.add(user)
+    db.session.commit()
+    uid = user.user_id
+
+
+def _login(_):
+    r = client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    return r.status_code
+
+
+try:
+    print(f"method={app.config['PASSWORD_HASH_METHOD']} logins={N} concurrency={CONCURRENCY}")
+    for label, workers in (("inline", 0), ("pool", app.config["PASSWORD_HASH_WORKERS"] or 4)):
+        app.config["PASSWORD_HASH_WORKERS"] = workers
+        app.config["PASSWORD_HASH_MAX_PENDING"] = max(N, 32)
+        shutdown_pool()
+        start = perf_counter()
+        with ThreadPoolExecutor(CONCURRENCY) as ex:
+            codes = list(ex.map(_login, range(N)))
+        elapsed = perf_counter() - start
+        ok = sum(c == 200 for c in codes)
+        print(f"{label:8s} {N / elapsed:8.1f} logins/s  ({ok}/{N} ok)")
+finally:
+    with app.app_context():
+        db.session.query(UserCredentials).filter_by(user_id=uid).delete()
+        db.session.commit()
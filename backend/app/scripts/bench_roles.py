@@ -0,0 +1,54 @@
+"""Compare `roles_required` with and without the role_version cache.
+
+    python -m app.scripts.bench_roles [iterations]
+
+Creates a throw-away admin inside a transaction that is rolled back.
+"""
+import sys
+from time import perf_counter
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models.userCredentials import UserCredentials, User_Roles
+from app.utils.auth import roles_required, invalidate_role_cache
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+app = create_app()
+queries = 0
+
+
+def _count(*_):
+    global queries
+    queries += 1
+
+
+with app.app_context():
+    # listen before the session checks out its connection
+    event.listen(db.engine, "before_cursor_execute", _count)
+
+    user = UserCredentials(email="bench-roles@example.invalid", role=User_Roles.ADMIN, password_hash="!")
+    db.session.add(user)
+    db.session.flush()
+    headers = {"Authorization": f"Bearer {create_access_token(identity=user.user_id)}"}
+
+    @roles_required(User_Roles.ADMIN)
+    def view():
+        return "ok"
+
+    try:
+        for label, ttl in (("no cache (db hit per request)", 0), ("cached claims", 30)):
+            app.config["AUTH_ROLE_CACHE_TTL"] = ttl
+            invalidate_role_cache()
+            queries = 0
+            start = perf_counter()
+            for _ in range(N):
+                with app.test_request_context(headers=headers):
+                    assert view() == "ok"
+            elapsed = perf_counter() - start
+            print(f"{label:32s} {N / elapsed:10.0f} req/s  {queries / N:.3f} queries/req")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _count)
+        db.session.rollback()
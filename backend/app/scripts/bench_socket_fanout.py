@@ -0,0 +1,62 @@
+"""Socket packets per event change: broadcast vs interest rooms.
+
+    python -m app.scripts.bench_socket_fanout [clients] [changes]
+
+Connects `clients` fake sockets (10k by default) to an in-process Socket.IO
+server, each placed in the rooms a real connection would join: its user room,
+role:<ROLE>, state:<one of 50> and 1-4 skill:<one of 30>. Then sends
+`changes` random event notifications both ways and counts packets handed to
+clients:
+  * broadcast - the old behaviour, every socket gets every change
+  * targeted  - to=event_rooms(state, skills), as events.py does now
+"""
+import random
+import sys
+import time
+
+import socketio
+
+from app.utils.socket_rooms import event_rooms
+
+CLIENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+CHANGES = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+STATES = [f"S{i:02d}" for i in range(50)]
+SKILLS = list(range(1, 31))
+
+random.seed(41)
+server = socketio.Server(async_mode="threading")
+sent = {"n": 0}
+
+
+def count(eio_sid, pkt):
+    sent["n"] += 1
+
+
+server._send_eio_packet = count
+mgr = server.manager
+for i in range(CLIENTS):
+    sid = mgr.connect(f"eio-{i}", "/")
+    role = "ADMIN" if i % 200 == 0 else "VOLUNTEER"
+    rooms = [str(i), f"role:{role}", f"state:{random.choice(STATES)}"]
+    rooms += [f"skill:{s}" for s in random.sample(SKILLS, random.randint(1, 4))]
+    for room in rooms:
+        mgr.enter_room(sid, "/", room, eio_sid=f"eio-{i}")
+
+changes = [(random.choice(STATES), random.sample(SKILLS, random.randint(1, 3))) for _ in range(CHANGES)]
+payload = [{"event_id": 1, "name": "Bench", "message": "x" * 200}]
+
+
+def run(label, target):
+    sent["n"] = 0
+    started = time.perf_counter()
+    for state, skills in changes:
+        server.emit("event_update_batch", payload, to=target(state, skills))
+    seconds = time.perf_counter() - started
+    print(f"{label:>9}: {sent['n'] / CHANGES:8.1f} packets/change | {seconds / CHANGES * 1000:6.2f} ms/change")
+    return sent["n"]
+
+
+print(f"{CLIENTS} clients, {CHANGES} changes")
+broadcast = run("broadcast", lambda state, skills: None)
+targeted = run("targeted", lambda state, skills: event_rooms(state, skills))
+print(f"targeted sends {targeted / broadcast:.1%} of the broadcast packets")
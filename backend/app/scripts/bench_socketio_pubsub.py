@@ -0,0 +1,71 @@
+"""Cross-worker Socket.IO throughput over Postgres LISTEN/NOTIFY.
+
+    python -m app.scripts.bench_socketio_pubsub [emits] [clients_per_worker]
+
+Two in-process Socket.IO servers share a PostgresManager channel, standing in
+for two gunicorn workers. Each gets `clients_per_worker` fake clients, each in
+its own user room. The script measures emits/s published by worker A and
+how long until worker B has delivered all of them:
+  * broadcast – every emit goes to every client on B
+  * per-room  – every emit targets one user room on B
+"""
+import random
+import sys
+import time
+import uuid
+
+import socketio
+
+from app import create_app
+from app.utils.socket_manager import PostgresManager
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+CLIENTS = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+app = create_app()
+DSN = app.config["SQLALCHEMY_DATABASE_URI"]
+CHANNEL = f"bench_{uuid.uuid4().hex[:8]}"
+
+
+def worker():
+    mgr = PostgresManager(DSN, channel=CHANNEL, poll_timeout=0.5)
+    server = socketio.Server(async_mode="threading", client_manager=mgr)
+    counter = {"n": 0}
+
+    def send(eio_sid, pkt):
+        counter["n"] += 1
+    server._send_eio_packet = send
+    return server, mgr, counter
+
+
+a, mgr_a, _ = worker()
+b, mgr_b, delivered = worker()
+mgr_b.initialize()
+for i in range(CLIENTS):
+    sid = mgr_b.connect(f"eio-{i}", "/")
+    mgr_b.enter_room(sid, "/", f"user:{i}", eio_sid=f"eio-{i}")
+
+# wait for B's LISTEN to be live
+while delivered["n"] == 0:
+    a.emit("probe", {}, to="user:0")
+    time.sleep(0.05)
+
+
+def run(label, target, expected_per_emit):
+    delivered["n"] = 0
+    payload = {"event_id": 1, "name": "Bench", "message": "x" * 200}
+    started = time.perf_counter()
+    for _ in range(N):
+        a.emit("event_update", payload, to=target())
+    published = time.perf_counter() - started
+    expected = N * expected_per_emit
+    while delivered["n"] < expected and time.perf_counter() - started < 120:
+        time.sleep(0.005)
+    total = time.perf_counter() - started
+    print(f"{label:>10}: publish {N / published:8.0f} emits/s | "
+          f"delivered {delivered['n']}/{expected} packets on B in {total:.2f}s "
+          f"({N / total:.0f} emits/s end-to-end)")
+
+
+run("broadcast", lambda: None, CLIENTS)
+run("per-room", lambda: f"user:{random.randrange(CLIENTS)}", 1)
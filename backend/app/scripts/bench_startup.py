@@ -0,0 +1,53 @@
+"""Cold-start cost of `import app` and `create_app()`.
+
+    python -m app.scripts.bench_startup [top_n]
+
+Runs each step in a fresh interpreter under `python -X importtime` and prints
+wall time plus the most expensive top-level imports. tests/test_startup.py
+uses `importtime_report` to keep heavy modules off the startup path.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+
+BACKEND = Path(__file__).resolve().parents[2]
+
+STEPS = {
+    "import app": "import app",
+    "create_app()": "from app import create_app; create_app('app.config.TestConfig')",
+}
+
+
+def importtime_report(code: str) -> tuple[float, dict[str, tuple[int, int, int]]]:
+    """Run `code` in a fresh interpreter.
+
+    Returns (wall seconds, {module: (cumulative_us, self_us, depth)}).
+    """
+    started = perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND, env=os.environ.copy(), capture_output=True, text=True, check=True,
+    )
+    wall = perf_counter() - started
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (int(cumulative_us), int(self_us), depth)
+    return wall, modules
+
+
+if __name__ == "__main__":
+    top_n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for label, code in STEPS.items():
+        wall, modules = importtime_report(code)
+        total = sum(self_us for _, self_us, _ in modules.values()) / 1000
+        print(f"{label}: {wall * 1000:.0f} ms wall, {total:.0f} ms importing {len(modules)} modules")
+        top = sorted(((c, n) for n, (c, _, d) in modules.items() if d <= 1), reverse=True)[:top_n]
+        for cumulative_us, name in top:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
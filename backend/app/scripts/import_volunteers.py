@@ -0,0 +1,33 @@
+"""Import volunteers from a CSV file.
+
+    python -m app.scripts.import_volunteers volunteers.csv [base_url]
+
+`base_url` is the public backend origin used in confirmation links
+(default: $BACKEND_ORIGIN or http://localhost:5000). See
+app/utils/bulk_import.py for the expected columns.
+"""
+import json
+import os
+import sys
+
+from app import create_app
+from app.utils.bulk_import import import_volunteers
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+path = sys.argv[1]
+base_url = sys.argv[2] if len(sys.argv) > 2 else os.environ.get("BACKEND_ORIGIN", "http://localhost:5000")
+
+with open(path, encoding="utf-8-sig", newline="") as f:
+    csv_text = f.read()
+
+app = create_app()
+with app.test_request_context(base_url=base_url):
+    report = import_volunteers(csv_text)
+
+skipped, errors = report.pop("skipped_existing"), report.pop("errors")
+print(json.dumps(report, indent=2))
+print(f"skipped {len(skipped)} existing email(s), {len(errors)} invalid row(s)")
+for err in errors[:20]:
+    print(f"  line {err['line']}: {err['error']}")
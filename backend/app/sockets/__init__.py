@@ -0,0 +1,55 @@
+from app.imports import *
+from app import socketio
+from flask_jwt_extended import decode_token
+from jwt import PyJWTError
+from flask_jwt_extended.exceptions import JWTExtendedException
+from flask import session
+from app.utils import notification_log
+from app.utils.socket_rooms import join_connection_rooms
+
+# Connections authenticate with the access token in the handshake
+# (`io(url, { auth: { token } })`) and are placed in their rooms here; there
+# is no client-chosen room anymore.
+
+@socketio.on("connect")
+def handle_connect(auth=None):
+    token = (auth or {}).get("token") if isinstance(auth, dict) else None
+    if not token:
+        return False  # refuse anonymous sockets
+    try:
+        claims = decode_token(token)
+    except (PyJWTError, JWTExtendedException):
+        return False
+    if claims.get("type") != "access":
+        return False
+    session["user_id"] = int(claims["sub"])  # per-socket session (Flask-SocketIO)
+    rooms = join_connection_rooms(session["user_id"], claims.get("role"))
+    socketio.log.info("socket.connect", user=claims["sub"], rooms=len(rooms))
+
+@socketio.on("join")
+def handle_join(user_id=None):
+    # Kept for older clients: rooms are joined on connect, so this is a no-op
+    # and can no longer be used to listen in on another user's room.
+    pass
+
+@socketio.on("replay")
+def handle_replay():
+    # sent by the client right after (re)connecting
+    return notification_log.replay(session["user_id"], to=request.sid)
+
+@socketio.on("ack")
+def handle_ack(seq):
+    if isinstance(seq, int) and seq > 0:
+        notification_log.ack(session["user_id"], seq)
+
+@socketio.on("disconnect")
+def handle_disconnect():
+    socketio.log.info("socket.disconnect", user=session.get("user_id"))
+
+# event_created / event_update / event_assigned / event_reminder are emitted by
+# the server only; clients can no longer relay them to everyone else.
+
+@socketio.on("ping_test")
+def handle_ping_test(data):
+    socketio.log.info("socket.ping_test", user=session.get("user_id"))
+    socketio.emit("pong_test", {"msg": "Pong from backend ⚡"})
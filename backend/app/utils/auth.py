@@ -1,22 +1,109 @@
+from collections import OrderedDict
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from threading import Lock
+from time import monotonic
+
+from flask import current_app, jsonify, request
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 
 from app.imports import db
 from app.models.userCredentials import UserCredentials, User_Roles
 
 
+class _RoleVersionCache:
+    """Tiny per-process TTL cache of user_id -> role_version.
+
+    Lets `roles_required` trust the signed `role` claim while still noticing
+    demotions within `AUTH_ROLE_CACHE_TTL` seconds (immediately in the process
+    that made the change, see `invalidate_role_cache`).
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._data: "OrderedDict[int, tuple[int | None, float]]" = OrderedDict()
+        self._lock = Lock()
+        self._max = max_entries
+
+    def get(self, uid: int, ttl: float) -> int | None:
+        now = monotonic()
+        with self._lock:
+            hit = self._data.get(uid)
+            if hit and hit[1] > now:
+                self._data.move_to_end(uid)
+                return hit[0]
+
+        version = (
+            db.session.query(UserCredentials.role_version)
+            .filter(UserCredentials.user_id == uid)
+            .scalar()
+        )
+        with self._lock:
+            self._data[uid] = (version, now + ttl)
+            self._data.move_to_end(uid)
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+        return version
+
+    def invalidate(self, uid: int | None = None) -> None:
+        with self._lock:
+            if uid is None:
+                self._data.clear()
+            else:
+                self._data.pop(uid, None)
+
+
+_role_versions = _RoleVersionCache()
+
+
+def invalidate_role_cache(uid: int | None = None) -> None:
+    """Drop cached role versions (one user, or everyone when uid is None)."""
+    _role_versions.invalidate(uid)
+
+
 def roles_required(*roles: User_Roles):
+    allowed = {r.value for r in roles}
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             verify_jwt_in_request()
-            uid = get_jwt_identity()
-            user = db.session.get(UserCredentials, uid)
-            if not user:
+            claims = get_jwt()
+            try:
+                uid = int(get_jwt_identity())
+            except (TypeError, ValueError):
+                return jsonify({"error": "unauthorized"}), 401
+
+            role = claims.get("role")
+            if role is None:
                 return jsonify({"error": "unauthorized"}), 401
-            if user.role not in roles:
+
+            # Role changes bump role_version; tokens minted before that are stale.
+            ttl = current_app.config.get("AUTH_ROLE_CACHE_TTL", 30)
+            current = _role_versions.get(uid, ttl)
+            if current is None:
+                return jsonify({"error": "unauthorized"}), 401
+            if claims.get("rv", 0) != current:
+                return jsonify({"error": "token_stale", "message": "Your permissions changed. Please sign in again."}), 401
+
+            if role not in allowed:
                 return jsonify({"error": "forbidden", "message": "Insufficient permissions."}), 403
             return fn(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+LOOPBACK = {"127.0.0.1", "::1"}
+
+
+def local_only(fn):
+    """Only answer requests made from this host (metrics scrapers, ops shells).
+
+    Anything that came through a proxy (X-Forwarded-For set) is treated as
+    remote even though the proxy itself connects over loopback. Others get a
+    404, as if the route did not exist.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if request.remote_addr not in LOOPBACK or "X-Forwarded-For" in request.headers:
+            return jsonify({"error": "not_found"}), 404
+        return fn(*args, **kwargs)
+    return wrapper
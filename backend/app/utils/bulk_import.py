@@ -0,0 +1,198 @@
+"""Bulk volunteer import from CSV.
+
+Registering a partner organisation through `/auth/register` costs one hash,
+one commit and one outbox row per user. `import_volunteers` does the same work
+set-wise:
+
+  1. parse + validate every row up front (one query for the state list),
+  2. hash all passwords in a process pool (`BULK_IMPORT_HASH_PROCESSES`;
+     hashing is CPU-bound, so processes rather than the request thread pool),
+  3. insert credentials, profiles and confirmation mails with multi-row
+     INSERTs, `BULK_IMPORT_CHUNK_SIZE` rows at a time, in one transaction.
+
+Existing emails (case-insensitive) are skipped via ON CONFLICT, never updated.
+
+Expected CSV header (extra columns are ignored):
+
+    email,password,full_name,address1,address2,city,state,zipcode,preferences
+
+Only email and password are required; a profile is created when all of
+full_name, address1, city, state and zipcode are present.
+
+The admin endpoint runs this inside the request, so it only takes files up
+to `BULK_IMPORT_MAX_HTTP_ROWS` rows and hashes them inline (no process pool
+forked from the web server). Larger files go through
+`python -m app.scripts.import_volunteers`, which uses the process pool.
+"""
+import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from time import perf_counter
+from typing import Iterable
+
+from flask import current_app, url_for
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from werkzeug.security import generate_password_hash
+
+from app.imports import db
+from app.models.emailOutbox import EmailOutbox
+from app.models.state import States
+from app.models.userCredentials import UserCredentials, User_Roles
+from app.models.userProfiles import UserProfiles
+from app.utils.mailer import confirmation_email
+from app.utils.profile_validation import normalize_zip
+from app.utils.tokens import generate_email_token
+
+REQUIRED_COLUMNS = ("email", "password")
+PROFILE_COLUMNS = ("full_name", "address1", "city", "state", "zipcode")
+
+
+class ImportTooLarge(ValueError):
+    """More rows than the caller allows (`max_rows`)."""
+
+
+def _hash_chunk(method: str, passwords: list[str]) -> list[str]:
+    # module-level so ProcessPoolExecutor can pickle it
+    return [generate_password_hash(pw, method) for pw in passwords]
+
+
+def hash_passwords(passwords: list[str], method: str, processes: int, chunk_size: int) -> list[str]:
+    """Hash `passwords` in order, spread over `processes` worker processes."""
+    chunks = [passwords[i:i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+    if processes <= 1 or len(chunks) <= 1:
+        return [h for chunk in chunks for h in _hash_chunk(method, chunk)]
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as pool:
+        hashed = pool.map(_hash_chunk, [method] * len(chunks), chunks)
+        return [h for chunk in hashed for h in chunk]
+
+
+def _clean(row: dict, key: str) -> str:
+    return (row.get(key) or "").strip()
+
+
+def _parse(rows: Iterable[dict], state_ids: set[str]) -> tuple[list[dict], list[dict]]:
+    """Validate rows. Returns (accepted, errors); line numbers count the header as 1."""
+    accepted, errors, seen = [], [], set()
+    for line, row in enumerate(rows, start=2):
+        email = _clean(row, "email").lower()
+        password = row.get("password") or ""
+        if not email or not password:
+            errors.append({"line": line, "error": "Email and password are required."})
+            continue
+        if "@" not in email or len(email) > 120:
+            errors.append({"line": line, "email": email, "error": "Invalid email."})
+            continue
+        if email in seen:
+            errors.append({"line": line, "email": email, "error": "Duplicate email in file."})
+            continue
+
+        profile = None
+        if all(_clean(row, c) for c in PROFILE_COLUMNS):
+            state = _clean(row, "state").upper()
+            if state not in state_ids:
+                errors.append({"line": line, "email": email, "error": "Unknown state code."})
+                continue
+            try:
+                zipcode = normalize_zip(_clean(row, "zipcode"))
+            except ValueError as exc:
+                errors.append({"line": line, "email": email, "error": str(exc)})
+                continue
+            profile = {
+                "full_name": _clean(row, "full_name")[:50],
+                "address1": _clean(row, "address1")[:100],
+                "address2": _clean(row, "address2")[:100] or None,
+                "city": _clean(row, "city")[:100],
+                "state_id": state,
+                "zipcode": zipcode,
+                "preferences": _clean(row, "preferences") or None,
+            }
+
+        seen.add(email)
+        accepted.append({"line": line, "email": email, "password": password, "profile": profile})
+    return accepted, errors
+
+
+def import_volunteers(csv_text: str, max_rows: int | None = None, processes: int | None = None) -> dict:
+    """Create confirmed-pending volunteers from `csv_text`; commits once.
+
+    Confirmation links are built with `url_for(..., _external=True)`, so call
+    this inside a request context (scripts use `app.test_request_context`).
+    Raises `ImportTooLarge` above `max_rows` data rows, before any hashing.
+    `processes` overrides BULK_IMPORT_HASH_PROCESSES (1 = hash inline).
+    Returns a report with counts, per-line errors and throughput.
+    """
+    cfg = current_app.config
+    started = perf_counter()
+
+    reader = csv.DictReader(io.StringIO(csv_text))
+    missing = [c for c in REQUIRED_COLUMNS if c not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}.")
+
+    rows = list(reader)
+    if max_rows is not None and len(rows) > max_rows:
+        raise ImportTooLarge(
+            f"{len(rows)} rows; at most {max_rows} per upload. "
+            "Use `python -m app.scripts.import_volunteers` for larger files."
+        )
+
+    state_ids = set(db.session.execute(select(States.state_id)).scalars())
+    accepted, errors = _parse(rows, state_ids)
+    total_rows = len(accepted) + len(errors)
+
+    t_hash = perf_counter()
+    hashes = hash_passwords(
+        [r["password"] for r in accepted],
+        cfg.get("PASSWORD_HASH_METHOD", "scrypt"),
+        processes if processes is not None else cfg.get("BULK_IMPORT_HASH_PROCESSES", 1),
+        cfg.get("BULK_IMPORT_CHUNK_SIZE", 500),
+    )
+    hash_seconds = perf_counter() - t_hash
+
+    chunk = cfg.get("BULK_IMPORT_CHUNK_SIZE", 500)
+    now = datetime.utcnow()
+    created: list[tuple[int, str, int]] = []
+    for i in range(0, len(accepted), chunk):
+        batch = accepted[i:i + chunk]
+        stmt = (
+            pg_insert(UserCredentials)
+            .values([
+                {"email": r["email"], "password_hash": h, "role": User_Roles.VOLUNTEER,
+                 "created_at": now, "updated_at": now}
+                for r, h in zip(batch, hashes[i:i + chunk])
+            ])
+            .on_conflict_do_nothing(index_elements=[func.lower(UserCredentials.email)])
+            .returning(UserCredentials.user_id, UserCredentials.email, UserCredentials.confirmation_token_version)
+        )
+        created.extend(db.session.execute(stmt).all())
+
+    by_email = {r["email"]: r for r in accepted}
+    profiles = [{"user_id": uid, **by_email[email]["profile"]}
+                for uid, email, _ in created if by_email[email]["profile"]]
+    mails = []
+    for uid, email, token_version in created:
+        # same token as /auth/register issues for this row
+        token = generate_email_token(uid, email, User_Roles.VOLUNTEER.value.lower(), token_version)
+        subject, body, html = confirmation_email(url_for("register_user.confirm_email", token=token, _external=True))
+        mails.append({"to_email": email, "subject": subject, "body": body, "html": html})
+
+    for i in range(0, len(profiles), chunk):
+        db.session.execute(insert(UserProfiles).values(profiles[i:i + chunk]))
+    for i in range(0, len(mails), chunk):
+        db.session.execute(insert(EmailOutbox).values(mails[i:i + chunk]))
+    db.session.commit()
+
+    created_emails = {email for _, email, _ in created}
+    seconds = perf_counter() - started
+    return {
+        "rows": total_rows,
+        "created": len(created),
+        "profiles": len(profiles),
+        "skipped_existing": [r["email"] for r in accepted if r["email"] not in created_emails],
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "hash_seconds": round(hash_seconds, 3),
+        "rows_per_second": round(total_rows / seconds, 1) if seconds else None,
+    }
@@ -0,0 +1,113 @@
+"""Email digests for edits to events volunteers are signed up for.
+
+`update_event` only records *that* an event changed (`record_event_change`).
+`flush_event_digests` runs periodically; once the first recorded edit of an
+event is older than `EVENT_DIGEST_WINDOW_SECONDS` it gathers every affected
+volunteer, renders one email per volunteer covering all of their changed
+events and queues them in the outbox, which delivers them in bulk over one
+SMTP connection.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from flask import current_app
+from markupsafe import escape
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.imports import db
+from app.models.events import Events
+from app.models.pendingEventChange import PendingEventChange
+from app.models.userCredentials import UserCredentials
+from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
+from app.utils.mailer import queue_email
+
+# statuses that mean "this volunteer is still expected at the event"
+ACTIVE_STATUSES = (ParticipationStatusEnum.ASSIGNED, ParticipationStatusEnum.REGISTERED)
+
+
+def record_event_change(event_id: int) -> None:
+    """Mark an event as changed on the current session (caller commits)."""
+    now = datetime.utcnow()
+    stmt = pg_insert(PendingEventChange).values(
+        event_id=event_id, first_changed_at=now, last_changed_at=now, change_count=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PendingEventChange.event_id],
+        set_={
+            "last_changed_at": stmt.excluded.last_changed_at,
+            "change_count": PendingEventChange.change_count + 1,
+        },
+    )
+    db.session.execute(stmt)
+
+
+def _render(events: list[Events]) -> tuple[str, str, str]:
+    if len(events) == 1:
+        subject = f"Event updated: {events[0].name}"
+    else:
+        subject = f"{len(events)} of your events were updated"
+
+    origin = current_app.config.get("FRONTEND_ORIGIN", "")
+    lines, items = [], []
+    for ev in events:
+        where = ", ".join(p for p in (ev.address, ev.city, ev.state_id) if p)
+        when = ev.date.strftime("%a %b %d, %Y %H:%M")
+        lines.append(f"- {ev.name}: {when}, {where}")
+        # names and addresses are admin-entered: never markup in the HTML part
+        items.append(f"<li><strong>{escape(ev.name)}</strong> - {escape(when)}, {escape(where)}</li>")
+
+    body = (
+        "The following events you're signed up for have changed:\n\n"
+        + "\n".join(lines)
+        + f"\n\nSee the latest details at {origin}/volunteer/task"
+    )
+    html = (
+        "<p>The following events you're signed up for have changed:</p>"
+        f"<ul>{''.join(items)}</ul>"
+        f'<p><a href="{escape(origin)}/volunteer/task">View your tasks</a></p>'
+    )
+    return subject, body, html
+
+
+def flush_event_digests(now: datetime | None = None) -> int:
+    """Queue digests for changes older than the window. Returns emails queued."""
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(seconds=current_app.config["EVENT_DIGEST_WINDOW_SECONDS"])
+
+    due = (
+        db.session.query(PendingEventChange.event_id)
+        .filter(PendingEventChange.first_changed_at <= cutoff)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    event_ids = [eid for (eid,) in due]
+    if not event_ids:
+        db.session.commit()
+        return 0
+
+    # every (volunteer email, event) pair in one round-trip
+    rows = (
+        db.session.query(UserCredentials.email, Events)
+        .join(VolunteerHistory, VolunteerHistory.user_id == UserCredentials.user_id)
+        .join(Events, Events.event_id == VolunteerHistory.event_id)
+        .filter(
+            Events.event_id.in_(event_ids),
+            Events.date >= now,  # nobody needs news about a past event
+            VolunteerHistory.participation_status.in_(ACTIVE_STATUSES),
+        )
+        .order_by(UserCredentials.email, Events.date)
+        .all()
+    )
+
+    per_user: dict[str, list[Events]] = defaultdict(list)
+    for email, ev in rows:
+        per_user[email].append(ev)
+
+    for email, events in per_user.items():
+        queue_email(email, *_render(events))
+
+    db.session.query(PendingEventChange).filter(
+        PendingEventChange.event_id.in_(event_ids)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return len(per_user)
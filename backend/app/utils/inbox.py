@@ -0,0 +1,164 @@
+"""Persistent notification inbox (`notifications`) with counter-backed unread totals.
+
+Every socket notification also lands here, written set-wise in the same
+transaction as the change that caused it:
+
+  * known recipients (assignments, reminders): `add_to_inbox(rows)`, one
+    multi-row INSERT;
+  * event created / updated: `add_event_to_inbox(...)`, one INSERT ... SELECT
+    over the volunteers that could care (profile state or a shared skill, plus
+    anyone assigned), the same audience the socket rooms target.
+
+Both are a single statement that also bumps `notification_cursors.unread_count`
+by the number of rows actually inserted. A volunteer keeps at most one unread
+"updated" entry per event (partial unique index): a further edit refreshes
+its message and time in place and does not count as a new unread item.
+
+    WITH ins AS (INSERT INTO notifications ...
+                 ON CONFLICT (user_id, event_id) WHERE read_at IS NULL AND kind = 'event_update'
+                 DO UPDATE SET message = excluded.message, created_at = excluded.created_at
+                 RETURNING user_id, xmax = 0 AS inserted)
+    INSERT INTO notification_cursors (user_id, ..., unread_count)
+    SELECT user_id, ..., count(*) FROM ins WHERE inserted GROUP BY user_id
+    ON CONFLICT (user_id) DO UPDATE SET unread_count = unread_count + excluded.unread_count
+
+Marking read is the mirror image (UPDATE ... RETURNING feeding a decrement).
+None of these commit.
+"""
+import base64
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, column, func, literal, literal_column, or_, select, tuple_, union, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.imports import db
+from app.models.eventToSkill import EventToSkill
+from app.models.notification import Notification
+from app.models.notificationLog import NotificationCursor
+from app.models.userCredentials import UserCredentials, User_Roles
+from app.models.userProfiles import UserProfiles
+from app.models.userToSkill import UserToSkill
+from app.models.volunteerHistory import VolunteerHistory
+
+_COLUMNS = ["user_id", "kind", "event_id", "message", "created_at"]
+
+
+def _insert_counted(source) -> int:
+    """INSERT `source` (selecting _COLUMNS) into the inbox and bump unread counters."""
+    ins = pg_insert(Notification).from_select(_COLUMNS, source)
+    ins = (
+        ins.on_conflict_do_update(  # an unread "updated" entry for the same event
+            index_elements=[Notification.user_id, Notification.event_id],
+            index_where=Notification.read_at.is_(None) & (Notification.kind == "event_update"),
+            set_={"message": ins.excluded.message, "created_at": ins.excluded.created_at},
+        )
+        .returning(Notification.user_id, literal_column("xmax = 0").label("inserted"))  # false when updated
+        .cte("ins")
+    )
+    per_user = (
+        select(ins.c.user_id, literal(0), literal(0), func.count().cast(Integer))
+        .where(ins.c.inserted)
+        .group_by(ins.c.user_id)
+    )
+    bump = pg_insert(NotificationCursor).from_select(
+        ["user_id", "last_seq", "acked_seq", "unread_count"], per_user
+    )
+    bump = bump.on_conflict_do_update(
+        index_elements=[NotificationCursor.user_id],
+        set_={"unread_count": NotificationCursor.unread_count + bump.excluded.unread_count},
+    ).returning(NotificationCursor.unread_count)
+    return len(db.session.execute(bump).all())
+
+
+def add_to_inbox(rows: list[dict]) -> int:
+    """Insert {user_id, kind, event_id, message} rows; returns how many users were touched."""
+    if not rows:
+        return 0
+    now = datetime.utcnow()
+    data = values(
+        column("user_id", Integer), column("kind", String), column("event_id", Integer),
+        column("message", String), column("created_at", DateTime),
+        name="n",
+    ).data([(r["user_id"], r["kind"], r.get("event_id"), r["message"][:255], now) for r in rows])
+    return _insert_counted(select(*data.c))
+
+
+def add_event_to_inbox(event_id: int, state_id: str | None, kind: str, message: str) -> int:
+    """Inbox entry for every volunteer interested in / assigned to the event (one statement)."""
+    shares_skill = (
+        select(UserToSkill.user_id)
+        .join(EventToSkill, EventToSkill.skill_code == UserToSkill.skill_id)
+        .where(EventToSkill.event_id == event_id)
+    )
+    interested = (
+        select(UserCredentials.user_id)
+        .outerjoin(UserProfiles, UserProfiles.user_id == UserCredentials.user_id)
+        .where(UserCredentials.role == User_Roles.VOLUNTEER)
+        .where(or_(UserProfiles.state_id == state_id, UserCredentials.user_id.in_(shares_skill)))
+    )
+    assigned = select(VolunteerHistory.user_id).where(VolunteerHistory.event_id == event_id)
+    audience = union(interested, assigned).subquery("audience")
+
+    source = select(
+        audience.c.user_id, literal(kind), literal(event_id), literal(message[:255]),
+        literal(datetime.utcnow(), DateTime),
+    )
+    return _insert_counted(source)
+
+
+def unread_count(user_id: int) -> int:
+    return db.session.execute(
+        select(NotificationCursor.unread_count).where(NotificationCursor.user_id == user_id)
+    ).scalar() or 0
+
+
+def mark_read(user_id: int, ids: list[int] | None = None) -> int:
+    """Mark `ids` (or everything) read; returns the new unread count."""
+    marked = (
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.read_at.is_(None))
+        .values(read_at=datetime.utcnow())
+        .returning(Notification.notification_id)
+    )
+    if ids is not None:
+        marked = marked.where(Notification.notification_id.in_(ids))
+    marked = marked.cte("marked")
+    stmt = (
+        update(NotificationCursor)
+        .where(NotificationCursor.user_id == user_id)
+        .values(unread_count=func.greatest(
+            NotificationCursor.unread_count - select(func.count()).select_from(marked).scalar_subquery(), 0,
+        ))
+        .returning(NotificationCursor.unread_count)
+    )
+    return db.session.execute(stmt).scalar() or 0
+
+
+# -- keyset pagination --------------------------------------------------------
+def encode_cursor(row: Notification) -> str:
+    raw = f"{row.created_at.isoformat()}|{row.notification_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Raises ValueError for anything we did not hand out."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, notification_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(notification_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+
+
+def list_page(user_id: int, cursor: str | None, limit: int) -> tuple[list[Notification], str | None]:
+    """Newest-first page after `cursor`; returns (rows, next_cursor or None)."""
+    q = select(Notification).where(Notification.user_id == user_id)
+    if cursor:
+        created_at, notification_id = decode_cursor(cursor)
+        q = q.where(tuple_(Notification.created_at, Notification.notification_id) < (created_at, notification_id))
+    rows = db.session.execute(
+        q.order_by(Notification.created_at.desc(), Notification.notification_id.desc()).limit(limit + 1)
+    ).scalars().all()
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return rows, (encode_cursor(rows[-1]) if more else None)
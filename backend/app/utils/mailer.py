@@ -2,6 +2,9 @@ from flask import current_app
 from flask_mail import Message
 from logging import getLogger
 
+from app.imports import db
+from app.models.emailOutbox import EmailOutbox
+
 logger = getLogger(__name__)
 
 mail = None  # will be initialized in app factory
@@ -14,7 +17,19 @@ def init_mail(app):
     return mail
 
 
-def send_email_confirmation(to_email: str, confirm_url: str):
+def queue_email(to_email: str, subject: str, body: str, html: str | None = None) -> EmailOutbox:
+    """Add a message to the outbox on the current session.
+
+    Nothing is sent here: the row is committed together with the caller's
+    changes and delivered later by `app.utils.outbox.drain_outbox`.
+    """
+    row = EmailOutbox(to_email=to_email, subject=subject, body=body, html=html)
+    db.session.add(row)
+    return row
+
+
+def confirmation_email(confirm_url: str) -> tuple[str, str, str]:
+    """Return (subject, body, html) for the account confirmation mail."""
     subject = "Confirm your account"
     body = f"Please confirm your email by clicking the link: {confirm_url}\nIf you did not create an account, you can ignore this email."
     html = f"""
@@ -23,17 +38,9 @@ def send_email_confirmation(to_email: str, confirm_url: str):
     <p><a href="{confirm_url}" style="padding:10px 18px;background:#52796f;color:#fff;text-decoration:none;border-radius:4px;">Confirm Email</a></p>
     <p>If the button doesn't work, copy & paste this link into your browser:<br>{confirm_url}</p>
     """
-    if mail is None:
-        logger.warning("Mailer not initialized; printing email to console.")
-        print("=== EMAIL (DEV) ===")
-        print("To:", to_email)
-        print("Subject:", subject)
-        print(body)
-        print("=== END EMAIL ===")
-        return
-
-    msg = Message(subject=subject, recipients=[to_email], body=body, html=html)
-    try:
-        mail.send(msg)
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Failed to send email: %s", exc)
\ No newline at end of file
+    return subject, body, html
+
+
+def queue_email_confirmation(to_email: str, confirm_url: str) -> EmailOutbox:
+    subject, body, html = confirmation_email(confirm_url)
+    return queue_email(to_email, subject, body, html)
@@ -0,0 +1,120 @@
+"""Per-user socket notifications that survive a dropped connection.
+
+Every `event_assigned` / `event_reminder` is written to `notification_log`
+with the user's next sequence number before it is emitted, and the emitted
+payload carries that `seq`. The client acks what it has handled; after a
+(re)connect it asks for a replay and gets everything after the last ack, in
+order:
+
+    client                               server
+    ------                               ------
+    connect (token)                 →    joins rooms
+    "replay"                        →    emits logged notifications with seq > acked
+    "ack" 17                        →    acked_seq = 17
+
+The log is a ring of the newest `NOTIFICATION_LOG_RETENTION` rows per user.
+If the client is further behind than that, it gets one `notifications_gap`
+instead of a partial replay and should re-fetch /tasks and /events.
+
+Writing the log happens in the caller's transaction (reminders log in the
+same commit as their ledger row), so a notification that was committed but
+never emitted is still delivered on the next replay.
+"""
+from collections import Counter
+from typing import Iterable
+
+from flask import current_app
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.imports import db
+from app.models.notificationLog import NotificationCursor, NotificationLog
+
+
+def record_notifications(items: Iterable[tuple[int, str, dict]]) -> list[tuple[int, str, dict]]:
+    """Log (user_id, event, payload) items; returns them with `seq` added to each payload.
+
+    Three statements regardless of how many items: bump every user's counter,
+    insert the rows, trim each user's ring. Does not commit.
+    """
+    items = list(items)
+    if not items:
+        return []
+    per_user = Counter(user_id for user_id, _, _ in items)
+
+    bump = pg_insert(NotificationCursor).values(
+        [{"user_id": uid, "last_seq": n, "acked_seq": 0} for uid, n in per_user.items()]
+    )
+    bump = bump.on_conflict_do_update(
+        index_elements=[NotificationCursor.user_id],
+        set_={"last_seq": NotificationCursor.last_seq + bump.excluded.last_seq},
+    ).returning(NotificationCursor.user_id, NotificationCursor.last_seq)
+    next_seq = {uid: last - per_user[uid] + 1 for uid, last in db.session.execute(bump).all()}
+
+    recorded, rows = [], []
+    for user_id, event, payload in items:
+        seq = next_seq[user_id]
+        next_seq[user_id] += 1
+        payload = {**payload, "seq": seq}
+        recorded.append((user_id, event, payload))
+        rows.append({"user_id": user_id, "seq": seq, "event": event, "payload": payload})
+    db.session.execute(insert(NotificationLog).values(rows))
+
+    keep = current_app.config.get("NOTIFICATION_LOG_RETENTION", 100)
+    db.session.execute(
+        delete(NotificationLog)
+        .where(NotificationLog.user_id == NotificationCursor.user_id)
+        .where(NotificationCursor.user_id.in_(list(per_user)))
+        .where(NotificationLog.seq <= NotificationCursor.last_seq - keep)
+    )
+    return recorded
+
+
+def emit_recorded(recorded: list[tuple[int, str, dict]]) -> None:
+    """Emit logged notifications to each user's room (call after commit)."""
+    from app import socketio
+
+    for user_id, event, payload in recorded:
+        socketio.emit(event, payload, to=str(user_id))
+
+
+def notify_user(user_id: int, event: str, payload: dict) -> dict:
+    """Log, commit and emit a single notification; returns the emitted payload."""
+    recorded = record_notifications([(user_id, event, payload)])
+    db.session.commit()
+    emit_recorded(recorded)
+    return recorded[0][2]
+
+
+def replay(user_id: int, to: str) -> int:
+    """Re-emit to `to` (a socket sid) everything after the user's last ack.
+
+    Returns how many notifications were replayed (0 on a gap).
+    """
+    from app import socketio
+
+    cursor = db.session.get(NotificationCursor, user_id)
+    if cursor is None or cursor.last_seq <= cursor.acked_seq:
+        return 0
+    rows = db.session.execute(
+        select(NotificationLog.seq, NotificationLog.event, NotificationLog.payload)
+        .where(NotificationLog.user_id == user_id, NotificationLog.seq > cursor.acked_seq)
+        .order_by(NotificationLog.seq)
+    ).all()
+    if not rows or rows[0].seq != cursor.acked_seq + 1:
+        # older entries already rotated out of the ring
+        socketio.emit("notifications_gap", {"acked_seq": cursor.acked_seq, "last_seq": cursor.last_seq}, to=to)
+        return 0
+    for row in rows:
+        socketio.emit(row.event, row.payload, to=to)
+    return len(rows)
+
+
+def ack(user_id: int, seq: int) -> None:
+    """Move the user's ack forward (never backwards, never past what was issued). Commits."""
+    db.session.execute(
+        update(NotificationCursor)
+        .where(NotificationCursor.user_id == user_id, NotificationCursor.last_seq >= seq)
+        .values(acked_seq=func.greatest(NotificationCursor.acked_seq, seq))
+    )
+    db.session.commit()
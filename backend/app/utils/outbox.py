@@ -0,0 +1,95 @@
+"""Background delivery for the email outbox.
+
+`drain_outbox` claims a batch of due rows (`FOR UPDATE SKIP LOCKED`, so
+several workers never send the same row), pushes them through a single SMTP
+connection and records the outcome. Failures are retried with exponential
+backoff until `MAIL_OUTBOX_MAX_ATTEMPTS`, then marked FAILED.
+"""
+from datetime import datetime, timedelta
+from logging import getLogger
+
+from flask import current_app
+from flask_mail import Message
+
+from app.imports import db
+from app.models.emailOutbox import EmailOutbox, OutboxStatusEnum
+from app.utils import mailer
+
+logger = getLogger(__name__)
+
+
+def _claim_batch(limit: int) -> list[EmailOutbox]:
+    return (
+        db.session.query(EmailOutbox)
+        .filter(
+            EmailOutbox.status == OutboxStatusEnum.PENDING,
+            EmailOutbox.next_attempt_at <= datetime.utcnow(),
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+def _mark_failed_attempt(row: EmailOutbox, exc: Exception) -> None:
+    cfg = current_app.config
+    row.attempts += 1
+    row.last_error = str(exc)[:1000]
+    if row.attempts >= cfg["MAIL_OUTBOX_MAX_ATTEMPTS"]:
+        row.status = OutboxStatusEnum.FAILED
+        logger.error("Giving up on outbox mail %s to %s: %s", row.outbox_id, row.to_email, exc)
+        return
+    delay = min(cfg["MAIL_OUTBOX_BACKOFF_SECONDS"] * 2 ** (row.attempts - 1), 6 * 3600)
+    row.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+
+
+def _mark_sent(row: EmailOutbox) -> None:
+    row.status = OutboxStatusEnum.SENT
+    row.sent_at = datetime.utcnow()
+    row.attempts += 1
+    row.last_error = None
+
+
+def drain_outbox(batch_size: int | None = None) -> int:
+    """Send one batch of due mail. Returns the number of messages delivered."""
+    rows = _claim_batch(batch_size or current_app.config["MAIL_OUTBOX_BATCH_SIZE"])
+    if not rows:
+        db.session.commit()  # end the (empty) FOR UPDATE transaction
+        return 0
+
+    sent = 0
+    if mailer.mail is None:
+        logger.warning("Mailer not initialized; printing %d outbox email(s) to console.", len(rows))
+        for row in rows:
+            print("=== EMAIL (DEV) ===")
+            print("To:", row.to_email)
+            print("Subject:", row.subject)
+            print(row.body)
+            print("=== END EMAIL ===")
+            _mark_sent(row)
+            sent += 1
+        db.session.commit()
+        return sent
+
+    remaining = list(rows)
+    try:
+        with mailer.mail.connect() as conn:  # one SMTP handshake for the whole batch
+            while remaining:
+                row = remaining[0]
+                msg = Message(subject=row.subject, recipients=[row.to_email], body=row.body, html=row.html)
+                try:
+                    conn.send(msg)
+                except Exception as exc:  # noqa: BLE001
+                    _mark_failed_attempt(row, exc)
+                else:
+                    _mark_sent(row)
+                    sent += 1
+                remaining.pop(0)
+    except Exception as exc:  # noqa: BLE001 - connect / quit failed
+        logger.exception("Outbox SMTP connection failed: %s", exc)
+        for row in remaining:
+            _mark_failed_attempt(row, exc)
+
+    db.session.commit()
+    return sent
@@ -0,0 +1,93 @@
+"""Password hashing that stays off the request thread.
+
+`generate_password_hash` / `check_password_hash` are CPU-bound (scrypt or
+pbkdf2). Run inline under eventlet they stall every connected socket, so the
+work is handed to a small pool of real OS threads (hashlib releases the GIL)
+and callers just block their own green thread / request thread on the result.
+
+The pool is bounded: once `PASSWORD_HASH_MAX_PENDING` hashes are queued or
+running, new calls raise `HashPoolBusy` instead of piling up.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import BoundedSemaphore, Lock
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HashPoolBusy(RuntimeError):
+    """Too many hashes already queued; the caller should answer 503."""
+
+
+_lock = Lock()
+_pool: ThreadPoolExecutor | None = None
+_slots: BoundedSemaphore | None = None
+
+
+def _eventlet_patched() -> bool:
+    try:
+        from eventlet import patcher
+    except ImportError:
+        return False
+    return patcher.is_monkey_patched("thread")
+
+
+def _init_pool():
+    global _pool, _slots
+    with _lock:
+        if _slots is None:
+            workers = current_app.config.get("PASSWORD_HASH_WORKERS", 4)
+            _slots = BoundedSemaphore(current_app.config.get("PASSWORD_HASH_MAX_PENDING", 32))
+            if workers > 0 and not _eventlet_patched():
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwhash")
+    return _pool, _slots
+
+
+def _run(fn, *args):
+    pool, slots = _init_pool() if _slots is None else (_pool, _slots)
+    if not slots.acquire(blocking=False):
+        raise HashPoolBusy()
+    try:
+        if pool is not None:
+            return pool.submit(fn, *args).result()
+        if _eventlet_patched():
+            # threading is green here, so use eventlet's native thread pool
+            from eventlet import tpool
+            return tpool.execute(fn, *args)
+        return fn(*args)  # PASSWORD_HASH_WORKERS = 0 → inline
+    finally:
+        slots.release()
+
+
+def shutdown_pool() -> None:
+    """Drop the pool so the next call re-reads the config (tests, benchmarks)."""
+    global _pool, _slots
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool, _slots = None, None
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+def hash_password(password: str) -> str:
+    method = current_app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+    return _run(generate_password_hash, password, method)
+
+
+def verify_password(pwhash: str, password: str) -> bool:
+    return _run(check_password_hash, pwhash, password)
+
+
+@lru_cache(maxsize=8)
+def _canonical_method(method: str) -> str:
+    # werkzeug expands defaults ("scrypt" → "scrypt:32768:8:1"); ask it once.
+    return generate_password_hash("", method=method, salt_length=1).split("$", 1)[0]
+
+
+def needs_rehash(pwhash: str) -> bool:
+    """True when `pwhash` was produced with a different method/cost than configured."""
+    method = current_app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+    return pwhash.split("$", 1)[0] != _canonical_method(method)
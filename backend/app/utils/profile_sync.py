@@ -0,0 +1,52 @@
+"""Diff-based writes for a profile's skills and availability dates.
+
+Saving a profile used to delete every `user_to_skill` / `user_availability`
+row and insert them again, so even an unchanged save rewrote both tables
+(and their indexes). Here each set is read once, compared with what the
+payload asks for, and only the difference is written:
+
+    INSERT INTO user_to_skill (user_id, skill_id) VALUES ... ON CONFLICT DO NOTHING
+    DELETE FROM user_to_skill WHERE user_id = :uid AND skill_id = ANY(:removed)
+
+An unchanged save is two SELECTs and no writes. None of these commit.
+"""
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import any_, bindparam, delete, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+
+from app.imports import db
+from app.models.userAvailability import UserAvailability
+from app.models.userToSkill import UserToSkill
+
+
+def _sync(model, owner_col, value_col, owner_id: int, wanted: Iterable) -> tuple[int, int]:
+    """Make `value_col` rows for `owner_id` equal `wanted`; returns (added, removed)."""
+    wanted = set(wanted)
+    current = set(db.session.execute(select(value_col).where(owner_col == owner_id)).scalars())
+    added, removed = wanted - current, current - wanted
+
+    if removed:
+        db.session.execute(
+            delete(model)
+            .where(owner_col == owner_id)
+            .where(value_col == any_(bindparam("removed", sorted(removed), type_=ARRAY(value_col.type))))
+        )
+    if added:
+        db.session.execute(
+            pg_insert(model)
+            .values([{owner_col.key: owner_id, value_col.key: v} for v in sorted(added)])
+            .on_conflict_do_nothing()  # a concurrent save got there first
+        )
+    return len(added), len(removed)
+
+
+def sync_skills(user_id: int, skill_ids: Iterable[int]) -> tuple[int, int]:
+    return _sync(UserToSkill, UserToSkill.user_id, UserToSkill.skill_id, user_id, skill_ids)
+
+
+def sync_availability(user_id: int, dates: Iterable[str | date]) -> tuple[int, int]:
+    """`dates` as date objects or ISO YYYY-MM-DD strings."""
+    wanted = (d if isinstance(d, date) else date.fromisoformat(d) for d in dates)
+    return _sync(UserAvailability, UserAvailability.user_id, UserAvailability.available_date, user_id, wanted)
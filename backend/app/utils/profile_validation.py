@@ -4,9 +4,7 @@ from typing import Iterable, Tuple
 
 from flask import current_app
 
-from app.imports import db
-from app.models.state import States
-from app.models.skill import Skill
+from app.utils.reference_cache import reference_cache
 
 # Precompiled regex for numeric ZIP (5 or 9 digits, optionally with dash)
 ZIP_RE = re.compile(r"^(\d{5})(?:-?\d{4})?$")
@@ -26,7 +24,7 @@ def validate_state_code(code: str) -> str:
     if not code or len(code) != 2:
         raise ValueError("State code required (2 characters).")
     code = code.upper()
-    if not db.session.get(States, code):
+    if code not in reference_cache.get().state_codes:
         raise ValueError("Unknown state code.")
     return code
 
@@ -35,7 +33,7 @@ def validate_skill_ids(ids: Iterable[int]) -> Tuple[int, ...]:
     ids = tuple(int(s) for s in ids if str(s).strip() != "")
     if not ids:
         raise ValueError("At least one skill required.")
-    found = {s.skill_id for s in db.session.query(Skill.skill_id).filter(Skill.skill_id.in_(ids))}
+    found = reference_cache.get().skill_ids
     missing = [i for i in ids if i not in found]
     if missing:
         raise ValueError(f"Invalid skill id(s): {missing}.")
@@ -1,61 +1,270 @@
-from app.imports import *
-from sqlalchemy import asc, desc
+"""Whitelisted list queries: filters, sorting and pagination from request args.
 
-def query_handler(model, filters_dict = {}, filters=None, date_column=None):
+A list endpoint describes what callers may filter and sort on once, as a
+`ListSpec`, and runs request args through `query_handler(spec, args)`:
+
+    USERS = ListSpec(
+        UserCredentials,
+        filters={
+            "role": Filter(UserCredentials.role),                  # = value
+            "email": Filter(UserCredentials.email, "prefix"),      # lower(col) LIKE 'x%'
+            "q": Filter(UserProfiles.full_name, "contains"),       # ILIKE '%x%' (trigram index)
+            "start_date": Filter(UserCredentials.created_at, "min", parse=parse_date),
+        },
+        sorts={"user_id": UserCredentials.user_id, "created_at": UserCredentials.created_at},
+        joins=[(UserProfiles, UserProfiles.user_id == UserCredentials.user_id)],
+    )
+    page = query_handler(USERS, request.args)   # -> Page(items, next_cursor)
+    page = query_handler(USERS, request.args,
+                         columns=[UserCredentials.user_id, UserProfiles.full_name])  # items are dicts
+    page = query_handler(TASKS, request.args,
+                         where=[VolunteerHistory.user_id == uid])  # fixed by the route, not the caller
+
+Only names in the spec are accepted; anything else raises `QueryError`
+(a ValueError, so routes turn it into a 400). Matching is exact or prefix
+unless a filter asks for "contains", and that should only be declared on
+columns with a pg_trgm index - a leading wildcard cannot use a B-tree.
+
+Pagination is keyset by default: every page is ordered by the sort column
+and then the primary key, and `next_cursor` encodes the last row's
+(sort value, key), so the next page is a range scan instead of an ever
+larger OFFSET. `offset` is still accepted (it is applied before `limit`)
+but cannot be combined with `cursor`.
+"""
+import base64
+import enum
+import json
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Date, DateTime, Enum, Integer, func, select, tuple_
+
+from app.database import db
+
+RESERVED = ("sort", "order", "limit", "offset", "cursor")
+MATCHES = ("exact", "prefix", "contains", "min", "max", "before")
+
+
+class QueryError(ValueError):
+    """Rejected list-query parameters (unknown name, bad value)."""
+
+
+def parse_date(value: str) -> datetime:
+    """MM-DD-YYYY (the original admin format) or ISO YYYY-MM-DD."""
+    for fmt in ("%m-%d-%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise QueryError(f"Invalid date {value!r}; use MM-DD-YYYY or YYYY-MM-DD.")
+
+
+def parse_end_date(value: str) -> datetime:
+    """End of a date range, inclusive of that whole day (use with match="before")."""
+    return parse_date(value) + timedelta(days=1)
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class Filter:
+    """One accepted filter parameter.
+
+    match: exact | prefix | contains | min (>=) | max (<=) | before (<)
+    parse: str -> value; defaults to the enum member name for Enum columns,
+           int() for integer columns, and the raw string otherwise.
     """
-    Generic query handler for retrieving data from the database.
-    
-    :param query: SQLAlchemy query object
-    :param model: SQLAlchemy model class
-    :param filters: Optional filters to apply to the query
-    :param order_by: Optional ordering for the results
-    :return: List of results or empty list if no results found
+
+    def __init__(self, column, match: str = "exact", parse=None):
+        if match not in MATCHES:
+            raise ValueError(f"Unknown match {match!r}; expected one of {MATCHES}.")
+        self.column = column
+        self.match = match
+        self.parse = parse
+
+    def _value(self, name: str, raw: str):
+        if self.parse is not None:
+            try:
+                return self.parse(raw)
+            except QueryError:
+                raise
+            except (ValueError, KeyError) as exc:
+                raise QueryError(f"Invalid value for {name!r}.") from exc
+        enum_class = getattr(self.column.type, "enum_class", None)
+        if enum_class is not None:
+            try:
+                return enum_class[raw.upper()]
+            except KeyError:
+                allowed = ", ".join(m.name for m in enum_class)
+                raise QueryError(f"Invalid value for {name!r}; expected one of {allowed}.") from None
+        if self.column.type.python_type is int:
+            try:
+                return int(raw)
+            except ValueError:
+                raise QueryError(f"Invalid value for {name!r}; expected an integer.") from None
+        return raw
+
+    def clause(self, name: str, raw: str):
+        if self.match == "prefix":
+            # served by an index on lower(col) text_pattern_ops
+            return func.lower(self.column).like(escape_like(raw.lower()) + "%", escape="\\")
+        if self.match == "contains":
+            return self.column.ilike("%" + escape_like(raw) + "%", escape="\\")
+        value = self._value(name, raw)
+        if self.match == "min":
+            return self.column >= value
+        if self.match == "max":
+            return self.column <= value
+        if self.match == "before":
+            return self.column < value
+        return self.column == value
+
+
+class ListSpec:
+    """What a list endpoint accepts: filters, sort keys, joins and page sizes."""
+
+    def __init__(self, model, filters: dict, sorts: dict, default_sort: str | None = None,
+                 joins=(), key=None, default_limit: int = 50, max_limit: int = 200,
+                 default_order: str = "asc"):
+        self.model = model
+        self.filters = filters
+        self.sorts = sorts
+        self.default_sort = default_sort or next(iter(sorts))
+        self.default_order = default_order
+        self.joins = list(joins)  # (target, onclause) pairs, outer-joined
+        self.key = key if key is not None else model.__mapper__.primary_key[0]
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+
+class Page:
+    def __init__(self, items: list, next_cursor: str | None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def _int_arg(args, name: str, default: int | None = None) -> int | None:
+    raw = args.get(name)
+    if raw in (None, ""):
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise QueryError(f"{name!r} must be an integer.") from None
+    if value < 0:
+        raise QueryError(f"{name!r} must not be negative.")
+    return value
+
+
+def _jsonable(value):
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(expr, value):
+    if value is None:
+        return None
+    sql_type = expr.type
+    if isinstance(sql_type, Enum) and sql_type.enum_class is not None:
+        return sql_type.enum_class[value]
+    if isinstance(sql_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(sql_type, Date):
+        return date.fromisoformat(value)
+    if isinstance(sql_type, Integer) and not isinstance(value, int):
+        raise ValueError(value)
+    return value
+
+
+def encode_cursor(sort: str, order: str, value, key) -> str:
+    raw = json.dumps([sort, order, _jsonable(value), key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort, order, value, key = json.loads(raw)
+        return sort, order, value, key
+    except (ValueError, TypeError, UnicodeDecodeError) as exc:
+        raise QueryError("Invalid cursor.") from exc
+
+
+def query_handler(spec: ListSpec, args, columns=None, options=(), where=()) -> Page:
+    """Run `args` (e.g. request.args) through `spec`; returns one `Page`.
+
+    `where` holds criteria the route always applies (the current user, a
+    date window); callers cannot remove them.
+
+    By default the page holds `spec.model` instances; `options` are loader
+    options for them (joinedload, lazyload, load_only, ...). With `columns`
+    the query selects just those columns (from the spec's joins) and the
+    page holds one dict per row, keyed by column name - nothing to lazy-load.
     """
-    filters_dict = filters_dict or {}
-    filters = filters or []
-    query = model.query
+    args = dict(args.items()) if hasattr(args, "items") else dict(args or {})
+    unknown = sorted(set(args) - set(spec.filters) - set(RESERVED))
+    if unknown:
+        raise QueryError(f"Unknown filter {unknown[0]!r}.")
 
-    for key, value in filters_dict.items():
-        if value in ["start_date", "end_date", "limit", "offset", "sort", "order"]:
-            continue
+    sort = args.get("sort") or spec.default_sort
+    if sort not in spec.sorts:
+        raise QueryError(f"Cannot sort by {sort!r}; expected one of {', '.join(spec.sorts)}.")
+    order = (args.get("order") or spec.default_order).lower()
+    if order not in ("asc", "desc"):
+        raise QueryError("'order' must be 'asc' or 'desc'.")
+    limit = min(_int_arg(args, "limit", spec.default_limit) or spec.default_limit, spec.max_limit)
+    offset = _int_arg(args, "offset")
+    cursor = args.get("cursor")
+    if cursor and offset:
+        raise QueryError("Use either 'cursor' or 'offset', not both.")
+
+    sort_expr, key = spec.sorts[sort], spec.key
+    if columns:
+        stmt = select(*columns).select_from(spec.model)
+        names = [c["name"] for c in stmt.column_descriptions]
+    else:
+        stmt = select(spec.model).options(*options)
+        names = None
+    for target, onclause in spec.joins:
+        stmt = stmt.outerjoin(target, onclause)
+    for criterion in where:
+        stmt = stmt.where(criterion)
+    for name, flt in spec.filters.items():
+        raw = args.get(name)
+        if raw not in (None, ""):
+            stmt = stmt.where(flt.clause(name, raw))
+
+    if cursor:
+        c_sort, c_order, c_value, c_key = decode_cursor(cursor)
+        if (c_sort, c_order) != (sort, order):
+            raise QueryError("Cursor does not match 'sort' / 'order'.")
+        try:
+            bound = (_from_json(sort_expr, c_value), _from_json(key, c_key))
+        except (KeyError, ValueError, TypeError) as exc:
+            raise QueryError("Invalid cursor.") from exc
+        after = tuple_(sort_expr, key)
+        stmt = stmt.where(after > bound if order == "asc" else after < bound)
+
+    direction = (lambda c: c.asc()) if order == "asc" else (lambda c: c.desc())
+    stmt = (
+        stmt.add_columns(sort_expr.label("_sort"), key.label("_key"))
+        .order_by(direction(sort_expr), direction(key))
+    )
+    if offset:
+        stmt = stmt.offset(offset)
+    rows = db.session.execute(stmt.limit(limit + 1)).all()
 
-        if hasattr(model, key) and value is not None:
-            col = getattr(model, key)
-            if isinstance(value, str) and col.type.python_type == str:
-                filters.append(col.ilike(f"%{value}%"))
-            else:
-                filters.append(col == value)
-
-    # Date range filtering
-    if date_column and hasattr(model, date_column):
-        col = getattr(model, date_column)
-        start = filters_dict.get("start_date")
-        end = filters_dict.get("end_date")
-
-        if start:
-            filters.append(col >= datetime.strptime(start, "%m-%d-%Y"))
-        if end:
-            filters.append(col <= datetime.strptime(end, "%m-%d-%Y"))
-
-        # Apply filters
-        if filters:
-            query = query.filter(*filters)
-
-        # Sorting
-        sort_col = filters_dict.get("sort")
-        order = filters_dict.get("order", "asc").lower()
-
-        if sort_col and hasattr(model, sort_col):
-            sort_attr = getattr(model, sort_col)
-            query = query.order_by(asc(sort_attr) if order == "asc" else desc(sort_attr))
-
-        # Pagination
-        limit = int(filters_dict.get("limit", 0)) if filters_dict.get("limit") else None
-        offset = int(filters_dict.get("offset", 0)) if filters_dict.get("offset") else None
-
-        if isinstance(limit, int) and limit > 0:
-            query = query.limit(limit)
-        if isinstance(offset, int) and offset >= 0:
-            query = query.offset(offset)
-
-        return query.all()
\ No newline at end of file
+    more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(sort, order, rows[-1]._sort, rows[-1]._key) if more else None
+    items = [dict(zip(names, row)) if names else row[0] for row in rows]
+    return Page(items, next_cursor)
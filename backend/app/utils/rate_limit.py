@@ -0,0 +1,161 @@
+"""Token-bucket rate limiting for the /auth blueprints.
+
+Each limited request spends one token from a per-IP bucket and (when the body
+carries an email) a per-email bucket. Buckets refill continuously at
+`capacity / period` tokens per second. Checks run in `before_request`, so a
+rejected request never reaches password hashing, the DB or SMTP.
+
+Storage:
+  * "memory"   – per-process dict, O(log n) per check; a bucket is dropped as
+                 soon as it would be full again.
+  * "postgres" – shared UNLOGGED table, one upsert per bucket; use this when
+                 several gunicorn workers must share one budget.
+
+Behind a reverse proxy every request comes from the proxy's address; set
+RATE_LIMIT_PROXY_HOPS (see `client_ip`) so clients get their own buckets.
+"""
+import heapq
+import math
+from threading import Lock
+from time import monotonic
+
+from flask import current_app, jsonify, request
+from sqlalchemy import text
+
+from app.imports import db
+
+# endpoints guarded by `enforce_auth_rate_limit`
+LIMITED_ENDPOINTS = {
+    "login_user.login",
+    "login_user.resend_confirmation",
+    "register_user.register_user",
+}
+
+
+class MemoryBucketStore:
+    def __init__(self):
+        self._buckets: dict[str, list[float]] = {}  # key -> [tokens, last_ts, full_after]
+        # (full_after, key) min-heap; an entry is stale once its bucket was
+        # touched again, so every take() pushes a new one and the old is skipped
+        self._expiry: list[tuple[float, str]] = []
+        self._lock = Lock()
+
+    def take(self, key: str, capacity: int, period: float) -> float:
+        """Spend one token. Returns 0 when allowed, else seconds until retry."""
+        rate = capacity / period
+        now = monotonic()
+        with self._lock:
+            self._expire(now)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = float(capacity)
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            full_after = now + (capacity - tokens) / rate
+            self._buckets[key] = [tokens, now, full_after]
+            heapq.heappush(self._expiry, (full_after, key))
+            if len(self._expiry) > 2 * len(self._buckets) + 64:
+                self._compact()
+            return wait
+
+    def _expire(self, now: float) -> None:
+        # Once a bucket would be full again it carries no state and can go,
+        # whatever the buckets around it are doing.
+        while self._expiry and self._expiry[0][0] <= now:
+            full_after, key = heapq.heappop(self._expiry)
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket[2] == full_after:
+                del self._buckets[key]
+
+    def _compact(self) -> None:
+        # drop stale entries left behind by keys that are hit over and over
+        self._expiry = [(b[2], key) for key, b in self._buckets.items()]
+        heapq.heapify(self._expiry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._expiry.clear()
+
+
+class PostgresBucketStore:
+    _TAKE = text(
+        """
+        INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+        VALUES (:key, :capacity - 1, true, clock_timestamp())
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * :rate)
+                     - CASE WHEN LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * :rate) >= 1
+                            THEN 1 ELSE 0 END,
+            allowed = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * :rate) >= 1,
+            updated_at = clock_timestamp()
+        RETURNING tokens, allowed
+        """
+    )
+
+    def take(self, key: str, capacity: int, period: float) -> float:
+        rate = capacity / period
+        # own short transaction – never mixes with the request's session
+        with db.engine.begin() as conn:
+            tokens, allowed = conn.execute(self._TAKE, {"key": key, "capacity": capacity, "rate": rate}).one()
+        return 0.0 if allowed else (1 - tokens) / rate
+
+    def clear(self) -> None:
+        with db.engine.begin() as conn:
+            conn.execute(text("TRUNCATE rate_limit_buckets"))
+
+
+_stores = {"memory": MemoryBucketStore(), "postgres": PostgresBucketStore()}
+
+
+def get_store():
+    return _stores[current_app.config.get("RATE_LIMIT_STORAGE", "memory")]
+
+
+def client_ip() -> str:
+    """The address the per-IP bucket is keyed on.
+
+    With RATE_LIMIT_PROXY_HOPS = n (n reverse proxies in front of the app, each
+    appending to X-Forwarded-For) it is the n-th address from the right - the
+    one our outermost proxy saw. Entries left of it are client-supplied and
+    ignored. With 0, `request.remote_addr`, which is already the client when
+    the app is wrapped in werkzeug's ProxyFix.
+    """
+    hops = current_app.config.get("RATE_LIMIT_PROXY_HOPS", 0)
+    if hops > 0:
+        forwarded = [a.strip() for a in request.headers.get("X-Forwarded-For", "").split(",") if a.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.remote_addr or "unknown"
+
+
+def enforce_auth_rate_limit():
+    """`before_request` hook for the login / registration blueprints."""
+    cfg = current_app.config
+    if not cfg.get("RATE_LIMIT_ENABLED", True) or request.endpoint not in LIMITED_ENDPOINTS:
+        return None
+
+    store = get_store()
+    checks = [("ip", client_ip(), cfg["RATE_LIMIT_AUTH_PER_IP"])]
+    data = request.get_json(silent=True) or {}
+    email = (data.get("email") or "").strip().lower() if isinstance(data, dict) else ""
+    if email:
+        checks.append(("email", email, cfg["RATE_LIMIT_AUTH_PER_EMAIL"]))
+
+    wait = 0.0
+    for kind, value, (capacity, period) in checks:
+        wait = max(wait, store.take(f"{request.endpoint}:{kind}:{value}", capacity, period))
+
+    if wait > 0:
+        return (
+            jsonify({"error": "rate_limited", "message": "Too many requests. Please try again later."}),
+            429,
+            {"Retry-After": str(math.ceil(wait))},
+        )
+    return None
@@ -0,0 +1,119 @@
+"""In-process cache of the reference tables (states, skills).
+
+Both tables change a few times a year but were read on every profile save
+(state / skill validation) and re-queried and re-serialized by every
+`GET /states/` and `GET /skills/`. This process keeps one immutable
+`ReferenceSnapshot` instead:
+
+  * the set of valid state codes and skill ids, for validation;
+  * the `/states/` and `/skills/` response bodies, JSON-encoded once.
+
+Freshness: every write to either table bumps its row in `reference_versions`
+(a trigger, see app/models/referenceVersion.py). At most every
+`REFERENCE_CACHE_TTL` seconds a lookup reads those versions - one tiny
+query - and reloads the snapshot if they differ from the ones it was built
+from. A commit that wrote States or Skill in this process drops the
+snapshot as soon as it lands; a rolled-back write drops nothing. While a
+session has such a write pending, its lookups get a private snapshot of
+what it can see, so the shared one is never built from uncommitted rows.
+TTL 0 checks the version on every lookup.
+"""
+import json
+from threading import Lock
+from time import monotonic
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.imports import db
+from app.models.referenceVersion import ReferenceVersion
+from app.models.skill import Skill
+from app.models.state import States
+
+
+class ReferenceSnapshot:
+    def __init__(self, version: tuple, states: list, skills: list):
+        self.version = version
+        self.state_codes = frozenset(s.state_id for s in states)
+        self.skill_ids = frozenset(s.skill_id for s in skills)
+        self.states_json = _encode({"states": [{"code": s.state_id, "name": s.name} for s in states]})
+        self.skills_json = _encode({"skills": [
+            {"id": s.skill_id, "name": s.skill_name, "level": s.level.name} for s in skills
+        ]})
+
+
+def _encode(body: dict) -> bytes:
+    return (json.dumps(body, separators=(",", ":")) + "\n").encode()
+
+
+def _current_version() -> tuple:
+    return tuple(db.session.execute(
+        select(ReferenceVersion.name, ReferenceVersion.version).order_by(ReferenceVersion.name)
+    ).all())
+
+
+def _load(version: tuple | None) -> ReferenceSnapshot:
+    return ReferenceSnapshot(
+        version,
+        db.session.execute(select(States).order_by(States.name)).scalars().all(),
+        db.session.execute(select(Skill).order_by(Skill.skill_name)).scalars().all(),
+    )
+
+
+class ReferenceCache:
+    def __init__(self):
+        self._lock = Lock()
+        self._snapshot: ReferenceSnapshot | None = None
+        self._checked_at = 0.0
+        self.loads = 0
+
+    def get(self) -> ReferenceSnapshot:
+        """The current snapshot (call inside an app context)."""
+        if db.session.info.get("reference_written"):
+            return _load(None)  # this transaction's own view; not shared
+        snapshot, now = self._snapshot, monotonic()
+        ttl = current_app.config.get("REFERENCE_CACHE_TTL", 60)
+        if snapshot is not None and now < self._checked_at + ttl:
+            return snapshot
+
+        version = _current_version()
+        if snapshot is None or snapshot.version != version:
+            snapshot = _load(version)
+        with self._lock:
+            if snapshot is not self._snapshot:
+                self.loads += 1
+            self._snapshot, self._checked_at = snapshot, now
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+reference_cache = ReferenceCache()
+
+
+def invalidate_reference_cache() -> None:
+    reference_cache.invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def _note_reference_write(session, flush_context):
+    # only remember it: the write is not visible to other sessions (or real)
+    # until the transaction commits
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (States, Skill)):
+            session.info["reference_written"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_on_reference_commit(session):
+    if session.info.pop("reference_written", False):
+        reference_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_write(session):
+    session.info.pop("reference_written", None)
@@ -0,0 +1,381 @@
+"""Socket reminders that an assigned event starts soon.
+
+Each event gets one reminder per offset in `REMINDER_OFFSETS_MINUTES`
+(24h, 1h, 10m by default). Offsets form bands: the 1h reminder is due while
+the event starts in (10m, 60m], so a volunteer assigned 30 minutes before an
+event gets the 1h reminder only, not 24h + 1h at once.
+
+Sending is set-based. One statement finds every due (volunteer, event, offset),
+records it in `reminder_ledger` and hands back only the rows that were not
+recorded before:
+
+    WITH sent AS (
+        INSERT INTO reminder_ledger (user_id, event_id, offset_minutes, sent_at)
+        SELECT vh.user_id, vh.event_id, band.offset_minutes, :now
+          FROM volunteer_history vh JOIN events e USING (event_id)
+          JOIN (VALUES (1440, 60), (60, 10), (10, 0)) band ON ...
+         WHERE vh.participation_status = 'ASSIGNED'
+        ON CONFLICT DO NOTHING
+        RETURNING user_id, event_id, offset_minutes
+    )
+    SELECT ... FROM sent JOIN events e ...
+
+The ledger row is committed, together with the reminder's entry in the
+user's notification log, before anything is emitted; a crash between the two
+never repeats a reminder, and the client gets it on its next replay.
+
+*When* to run that statement is decided by `ReminderQueue`: a heap of fire
+times (event start - offset) and a thread that sleeps until the earliest one.
+Event create / update / assignment push entries through
+`schedule_event_reminders`, which works from any process: it NOTIFYs
+`REMINDER_CHANNEL` in the caller's transaction, and every process running a
+queue LISTENs on it (`ReminderListener`) and pushes the entries into its heap.
+Only the scheduler leader sends, so a change made in a non-leader worker
+still reaches it. The other processes drop entries as they fall due. A newly
+elected leader clears its heap and reloads it from the database
+(`take_over`) rather than firing a stale backlog. A low-frequency `resync`
+does the same reload as a backstop. Between deadlines the queue does no queries at all.
+"""
+import heapq
+import json
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from logging import getLogger
+from select import select as wait_readable
+from threading import Condition, Thread
+from typing import Callable, Iterable
+
+import psycopg2
+from psycopg2 import sql
+from flask import current_app
+from sqlalchemy import Integer, column, func, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.imports import db
+from app.models.events import Events
+from app.models.reminderLedger import ReminderLedger
+from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
+from app.utils.inbox import add_to_inbox
+from app.utils.notification_log import emit_recorded, record_notifications
+
+logger = getLogger(__name__)
+
+DEFAULT_OFFSETS_MINUTES = (1440, 60, 10)
+DEFAULT_CHANNEL = "event_reminders"
+
+
+def _offsets() -> tuple[int, ...]:
+    return tuple(sorted(current_app.config.get("REMINDER_OFFSETS_MINUTES", DEFAULT_OFFSETS_MINUTES), reverse=True))
+
+
+def _bands(offsets: tuple[int, ...]) -> list[tuple[int, int]]:
+    """[(offset, floor)]: offset N is due while the event starts in (floor, N] minutes."""
+    return list(zip(offsets, offsets[1:] + (0,)))
+
+
+def _human(minutes: int) -> str:
+    if minutes % 60:
+        return f"{minutes} minutes"
+    hours = minutes // 60
+    return "1 hour" if hours == 1 else f"{hours} hours"
+
+
+def _claim_due(now: datetime, offsets: tuple[int, ...], only: Iterable[int] | None, event_ids) -> list:
+    """Record due reminders in the ledger; return (user_id, event_id, offset, name) for new ones."""
+    bands = [b for b in _bands(offsets) if only is None or b[0] in only]
+    if not bands:
+        return []
+    band = values(column("offset_minutes", Integer), column("floor_minutes", Integer), name="band").data(bands)
+    minute = timedelta(minutes=1)
+
+    due = (
+        select(VolunteerHistory.user_id, VolunteerHistory.event_id, band.c.offset_minutes, db.literal(now))
+        .join(Events, Events.event_id == VolunteerHistory.event_id)
+        .join(
+            band,
+            (Events.date > db.literal(now) + band.c.floor_minutes * minute)
+            & (Events.date <= db.literal(now) + band.c.offset_minutes * minute),
+        )
+        .where(VolunteerHistory.participation_status == ParticipationStatusEnum.ASSIGNED)
+    )
+    if event_ids is not None:
+        due = due.where(VolunteerHistory.event_id.in_(list(event_ids)))
+
+    sent = (
+        pg_insert(ReminderLedger)
+        .from_select(["user_id", "event_id", "offset_minutes", "sent_at"], due)
+        .on_conflict_do_nothing()
+        .returning(ReminderLedger.user_id, ReminderLedger.event_id, ReminderLedger.offset_minutes)
+        .cte("sent")
+    )
+    stmt = (
+        select(sent.c.user_id, Events.event_id, sent.c.offset_minutes, Events.name)
+        .join(Events, Events.event_id == sent.c.event_id)
+    )
+    return db.session.execute(stmt).all()
+
+
+def send_due_reminders(
+    now: datetime | None = None,
+    offsets: Iterable[int] | None = None,
+    event_ids: Iterable[int] | None = None,
+) -> int:
+    """Emit one `event_reminder` per newly due (volunteer, event, offset); returns how many.
+
+    `offsets` / `event_ids` narrow the check (the queue passes what just fired);
+    by default every configured offset and every event is considered.
+    """
+    rows = _claim_due(now or datetime.utcnow(), _offsets(), offsets, event_ids)
+    # logged in the same transaction as the ledger: a reminder that is claimed
+    # but never emitted (crash, socket down) is replayed on reconnect
+    recorded = record_notifications(
+        (
+            user_id,
+            "event_reminder",
+            {
+                "user_id": user_id,
+                "event_id": event_id,
+                "name": name,
+                "offset_minutes": offset,
+                "message": f"⏰ Reminder: Your event '{name}' starts in less than {_human(offset)}!",
+            },
+        )
+        for user_id, event_id, offset, name in rows
+    )
+    add_to_inbox([
+        {"user_id": user_id, "kind": "event_reminder", "event_id": event_id,
+         "message": f"Reminder: Your event '{name}' starts in less than {_human(offset)}."}
+        for user_id, event_id, offset, name in rows
+    ])
+    db.session.commit()
+    emit_recorded(recorded)  # only the volunteer's own room
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Deadline queue
+# ---------------------------------------------------------------------------
+class ReminderQueue:
+    """Min-heap of (fire_at, event_id, offset) served by one sleeping thread.
+
+    Entries are never updated in place: a moved event just gets new entries,
+    and stale ones fire harmlessly because the send query re-checks the
+    event's current start time and the ledger.
+    """
+
+    def __init__(self, app, offsets: Iterable[int], horizon_seconds: int,
+                 is_active: Callable[[], bool] = lambda: True):
+        self.app = app
+        self.offsets = tuple(sorted(offsets, reverse=True))
+        self.horizon = timedelta(seconds=horizon_seconds)  # only keep entries this close
+        self.is_active = is_active  # e.g. "this process is the scheduler leader"
+        self._heap: list[tuple[datetime, int, int]] = []
+        self._queued: set[tuple[datetime, int, int]] = set()
+        self._immediate: set[tuple[int, int]] = set()
+        self._cv = Condition()
+        self._thread: Thread | None = None
+        self._stopped = False
+        self.listener: "ReminderListener | None" = None
+
+    # -- producers ------------------------------------------------------------
+    def schedule(self, event_id: int, starts_at: datetime | None = None) -> None:
+        """Queue reminders for one event. Without `starts_at`, check it right away
+        (used on assignment, when a band may already be open)."""
+        now = datetime.utcnow()
+        with self._cv:
+            for offset in self.offsets:
+                if starts_at is None:
+                    fire_at = now
+                elif starts_at <= now:
+                    continue
+                else:
+                    fire_at = max(now, starts_at - timedelta(minutes=offset))
+                    if fire_at > now + self.horizon:
+                        continue  # picked up by a later resync
+                if fire_at == now:
+                    # already-open band: one pending "check now" per (event, offset)
+                    if (event_id, offset) in self._immediate:
+                        continue
+                    self._immediate.add((event_id, offset))
+                elif (fire_at, event_id, offset) in self._queued:
+                    continue
+                key = (fire_at, event_id, offset)
+                self._queued.add(key)
+                heapq.heappush(self._heap, key)
+            self._cv.notify()
+
+    def resync(self) -> int:
+        """Reload entries for every event starting within the horizon (one query)."""
+        now = datetime.utcnow()
+        until = now + self.horizon + timedelta(minutes=self.offsets[0])
+        with self.app.app_context():
+            rows = db.session.execute(
+                select(Events.event_id, Events.date).where(Events.date > now, Events.date <= until)
+            ).all()
+        for event_id, starts_at in rows:
+            self.schedule(event_id, starts_at)
+        return len(rows)
+
+    def take_over(self) -> int:
+        """Leadership won: forget what was queued as a follower and reload
+        from the database, so nothing stale is replayed in a burst."""
+        with self._cv:
+            self._heap.clear()
+            self._queued.clear()
+            self._immediate.clear()
+        return self.resync()
+
+    def pending(self) -> int:
+        with self._cv:
+            return len(self._heap)
+
+    # -- consumer -------------------------------------------------------------
+    def start(self) -> "ReminderQueue":
+        self._thread = Thread(target=self._run, name="reminder-queue", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+        with self._cv:
+            self._stopped = True
+            self._cv.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def pop_due(self, now: datetime) -> list[tuple[datetime, int, int]]:
+        with self._cv:
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                key = heapq.heappop(self._heap)
+                self._queued.discard(key)
+                self._immediate.discard(key[1:])
+                due.append(key)
+            return due
+
+    def fire(self, due: list[tuple[datetime, int, int]]) -> int:
+        by_offset: dict[int, set[int]] = defaultdict(set)
+        for _, event_id, offset in due:
+            by_offset[offset].add(event_id)
+        sent = 0
+        with self.app.app_context():
+            for offset, event_ids in by_offset.items():
+                sent += send_due_reminders(offsets=[offset], event_ids=event_ids)
+        return sent
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._stopped:
+                    now = datetime.utcnow()
+                    if self._heap and self._heap[0][0] <= now:
+                        if self.is_active():
+                            break
+                        # not the leader: the leader fires these, and take_over()
+                        # reloads from the database if this process is elected
+                        self.pop_due(now)
+                        continue
+                    self._cv.wait((self._heap[0][0] - now).total_seconds() if self._heap else None)
+                if self._stopped:
+                    return
+            due = self.pop_due(datetime.utcnow())
+            if not due:
+                continue
+            try:
+                self.fire(due)
+            except Exception:  # noqa: BLE001 - keep the thread alive; resync re-queues
+                logger.exception("reminder queue: sending %d reminder(s) failed", len(due))
+
+
+class ReminderListener:
+    """LISTENs on the reminder channel and feeds `queue` (one daemon thread).
+
+    Uses its own autocommit psycopg2 connection, like the Socket.IO
+    PostgresManager; reconnects with backoff and resyncs the queue after a
+    reconnect, since notifications sent while disconnected are gone.
+    """
+
+    def __init__(self, dsn: str, channel: str, queue: ReminderQueue, poll_timeout: float = 5.0):
+        from app.utils.socket_manager import libpq_dsn
+
+        self.dsn = libpq_dsn(dsn)
+        self.channel = channel
+        self.queue = queue
+        self.poll_timeout = poll_timeout
+        self._stopped = False
+        self._thread: Thread | None = None
+
+    def handle(self, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            starts_at = datetime.fromisoformat(data["starts_at"]) if data.get("starts_at") else None
+            self.queue.schedule(int(data["event_id"]), starts_at)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("reminder listener: ignoring payload %r", payload)
+
+    def start(self) -> "ReminderListener":
+        self._thread = Thread(target=self._run, name="reminder-listener", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def _run(self) -> None:
+        retry_sleep, conn, connected_before = 1, None, False
+        while not self._stopped:
+            try:
+                if conn is None:
+                    conn = psycopg2.connect(self.dsn)
+                    conn.autocommit = True
+                    with conn.cursor() as cur:
+                        cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    if connected_before and self.queue.is_active():
+                        self.queue.resync()  # missed notifications while disconnected
+                    connected_before, retry_sleep = True, 1
+                wait_readable([conn], [], [], self.poll_timeout)
+                conn.poll()
+                while conn.notifies:
+                    self.handle(conn.notifies.pop(0).payload)
+            except psycopg2.Error:
+                logger.warning("reminder listener: connection lost, retrying in %ss", retry_sleep)
+                try:
+                    if conn is not None:
+                        conn.close()
+                except psycopg2.Error:
+                    pass
+                conn = None
+                time.sleep(retry_sleep)
+                retry_sleep = min(retry_sleep * 2, 60)
+        if conn is not None:
+            conn.close()
+
+
+_queue: ReminderQueue | None = None
+
+
+def start_reminder_queue(app, is_active: Callable[[], bool] = lambda: True) -> ReminderQueue:
+    """Start the deadline queue and its LISTEN thread for a serving process."""
+    global _queue
+    _queue = ReminderQueue(
+        app,
+        app.config.get("REMINDER_OFFSETS_MINUTES", DEFAULT_OFFSETS_MINUTES),
+        horizon_seconds=2 * app.config.get("REMINDER_RESYNC_SECONDS", 600),
+        is_active=is_active,
+    ).start()
+    _queue.listener = ReminderListener(
+        app.config["SQLALCHEMY_DATABASE_URI"], app.config.get("REMINDER_CHANNEL", DEFAULT_CHANNEL), _queue,
+    ).start()
+    return _queue
+
+
+def schedule_event_reminders(event_id: int, starts_at: datetime | None = None) -> None:
+    """Hook for event create / update / assignment, from any process.
+
+    NOTIFYs every reminder queue (the leader's included) in the caller's
+    transaction: call it before `commit()`; nothing is sent on rollback.
+    """
+    payload = json.dumps({"event_id": event_id, "starts_at": starts_at.isoformat() if starts_at else None})
+    db.session.execute(select(func.pg_notify(current_app.config.get("REMINDER_CHANNEL", DEFAULT_CHANNEL), payload)))
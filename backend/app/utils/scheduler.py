@@ -0,0 +1,143 @@
+"""Periodic jobs, run by exactly one process.
+
+Every process that starts the scheduler (gunicorn workers, the dev server)
+runs a cheap `leader` heartbeat. Leadership is a PostgreSQL session-level
+advisory lock held on a dedicated AUTOCOMMIT connection: the first process
+to `pg_try_advisory_lock` wins, everyone else keeps retrying. If the leader
+dies its connection closes, Postgres releases the lock and another process
+takes over on its next heartbeat (`SCHEDULER_LEADER_POLL_SECONDS`).
+
+The real jobs are scheduled in every process but return immediately unless
+this process currently holds the lock.
+"""
+import atexit
+from datetime import datetime
+from logging import getLogger
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = getLogger(__name__)
+
+
+class LeaderElection:
+    def __init__(self, engine, lock_key: int, on_elected=None):
+        self.engine = engine
+        self.lock_key = lock_key
+        self.on_elected = on_elected  # called once each time leadership is won
+        self.is_leader = False
+        self._conn = None
+
+    def heartbeat(self) -> bool:
+        """Acquire or re-check leadership; returns whether we are leader."""
+        try:
+            if self._conn is None:
+                self._conn = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            if self.is_leader:
+                self._conn.execute(text("SELECT 1"))  # lock lives as long as this connection
+            else:
+                acquired = self._conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+                ).scalar()
+                self.is_leader = bool(acquired)
+                if acquired:
+                    logger.info("scheduler: acquired leadership (lock %s)", self.lock_key)
+                    self._elected()
+        except SQLAlchemyError:
+            if self.is_leader:
+                logger.warning("scheduler: lost leadership connection", exc_info=True)
+            self._reset()
+        return self.is_leader
+
+    def _elected(self) -> None:
+        if self.on_elected is None:
+            return
+        try:
+            self.on_elected()
+        except Exception:  # noqa: BLE001 - a failing callback must not cost us the lock
+            logger.exception("scheduler: on_elected callback failed")
+
+    def release(self) -> None:
+        if self._conn is not None and self.is_leader:
+            try:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+            except SQLAlchemyError:
+                pass
+        self._reset()
+
+    def _reset(self) -> None:
+        self.is_leader = False
+        if self._conn is not None:
+            try:
+                self._conn.invalidate()  # don't hand a lock-holding connection back to the pool
+            except SQLAlchemyError:
+                pass
+            self._conn = None
+
+
+def init_scheduler(app) -> BackgroundScheduler:
+    """Start the leader heartbeat and periodic jobs for `app`."""
+    with app.app_context():
+        from app.imports import db
+        election = LeaderElection(db.engine, app.config["SCHEDULER_LOCK_KEY"])
+
+    # Reminders run off their own deadline heap; the scheduler only resyncs it.
+    from app.utils.reminders import start_reminder_queue
+    reminders = start_reminder_queue(app, is_active=lambda: election.is_leader)
+    election.on_elected = reminders.take_over
+
+    def leader_only(fn):
+        def job():
+            if not election.is_leader:
+                return
+            with app.app_context():
+                fn()
+        job.__name__ = fn.__name__
+        return job
+
+    def send_outbox_mail():
+        from app.utils.outbox import drain_outbox
+        while drain_outbox():  # keep draining until nothing is due
+            pass
+
+    def send_event_digests():
+        from app.utils.event_digest import flush_event_digests
+        flush_event_digests()
+
+    once = {"max_instances": 1, "coalesce": True}
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(
+        func=election.heartbeat,
+        trigger="interval",
+        seconds=app.config["SCHEDULER_LEADER_POLL_SECONDS"],
+        next_run_time=datetime.now(),
+        id="leader",
+        **once,
+    )
+    scheduler.add_job(
+        func=leader_only(reminders.resync),
+        trigger="interval",
+        seconds=app.config["REMINDER_RESYNC_SECONDS"],
+        **once,
+    )
+    scheduler.add_job(
+        func=leader_only(send_outbox_mail),
+        trigger="interval",
+        seconds=app.config["MAIL_OUTBOX_POLL_SECONDS"],
+        **once,
+    )
+    scheduler.add_job(func=leader_only(send_event_digests), trigger="interval", minutes=1, **once)
+    scheduler.start()
+
+    def _shutdown():
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+        reminders.stop()
+        election.release()
+
+    atexit.register(_shutdown)
+    app.extensions["scheduler"] = scheduler
+    app.extensions["scheduler_election"] = election
+    app.extensions["reminder_queue"] = reminders
+    return scheduler
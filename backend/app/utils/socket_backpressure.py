@@ -0,0 +1,176 @@
+"""Bounded per-connection outbound queues for Socket.IO emits.
+
+Engine.IO gives every connection an unbounded packet queue that its writer
+drains as fast as the network allows. A client on a bad connection stops
+draining, and every broadcast keeps adding to its queue until the worker runs
+out of memory.
+
+`BackpressureMixin` sits in the client manager, where an emit is fanned out to
+recipients, and looks at each recipient's queue depth before adding to it:
+
+  * chatter (`SOCKETIO_CHATTER_EVENTS`, e.g. pong_test) is dropped once the
+    queue is half full;
+  * at `SOCKETIO_MAX_QUEUE` packets the `SOCKETIO_SLOW_CLIENT_POLICY` applies:
+      drop_oldest - shed the oldest queued chatter, then the oldest normal
+                    packets, to make room;
+      disconnect  - disconnect the client; it reconnects and catches up through
+                    the notification replay (app/utils/notification_log.py);
+  * priority events (`SOCKETIO_PRIORITY_EVENTS`, reminders and assignments)
+    are never shed and may exceed the limit, up to twice the limit, after which
+    the client is disconnected either way.
+
+Packets the manager did not enqueue (Engine.IO pings, connect acks, close
+sentinels) count as priority and are never removed.
+
+Shedding removes packets from the live queue in place, holding the queue's
+own mutex, so the Engine.IO writer never sees it half done. Every put made
+through `_deliver` holds `_bp_lock`, as do the depth check and `_shed`, so
+concurrent emits to one client cannot race each other past the limit.
+Engine.IO's own packets (pings, noop, close) are put without `_bp_lock`, so
+one can still land between a depth check and the put that follows it; that
+only makes the count off by a ping.
+"""
+from contextlib import nullcontext
+from threading import RLock
+
+from engineio import packet as eio_packet
+from socketio import Manager, packet
+
+CHATTER, NORMAL, PRIORITY = 0, 1, 2
+POLICIES = ("drop_oldest", "disconnect")
+
+
+class BackpressureMixin(Manager):
+    max_queue = 200
+    policy = "drop_oldest"
+    priority_events: frozenset = frozenset({"event_reminder", "event_assigned", "notifications_gap"})
+    chatter_events: frozenset = frozenset({"pong_test"})
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # re-entrant: Socket.send() may close a timed-out client, and the
+        # disconnect handler can emit from the same thread
+        self._bp_lock = RLock()
+        self._bp_stats = {"dropped_chatter": 0, "shed_oldest": 0, "dropped_new": 0, "disconnected": 0}
+
+    def configure_backpressure(self, max_queue: int, policy: str,
+                               priority_events=None, chatter_events=None) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown slow-client policy {policy!r}; expected one of {POLICIES}.")
+        self.max_queue = max_queue
+        self.policy = policy
+        if priority_events is not None:
+            self.priority_events = frozenset(priority_events)
+        if chatter_events is not None:
+            self.chatter_events = frozenset(chatter_events)
+
+    def backpressure_stats(self) -> dict:
+        with self._bp_lock:
+            return {"max_queue": self.max_queue, "policy": self.policy, **self._bp_stats}
+
+    def _priority(self, event) -> int:
+        if event in self.priority_events:
+            return PRIORITY
+        if event in self.chatter_events:
+            return CHATTER
+        return NORMAL
+
+    def emit(self, event, data, namespace, room=None, skip_sid=None, callback=None, to=None, **kwargs):
+        # Same as Manager.emit for the no-callback case, with _deliver() in
+        # place of server._send_eio_packet(). Callbacks only address one client.
+        if callback:
+            return super().emit(event, data, namespace, room=room, skip_sid=skip_sid,
+                                callback=callback, to=to, **kwargs)
+        room = to or room
+        if namespace not in self.rooms:
+            return
+        if isinstance(data, tuple):
+            data = list(data)
+        elif data is not None:
+            data = [data]
+        else:
+            data = []
+        if not isinstance(skip_sid, list):
+            skip_sid = [skip_sid]
+        encoded = self.server.packet_class(packet.EVENT, namespace=namespace, data=[event] + data).encode()
+        if not isinstance(encoded, list):
+            encoded = [encoded]
+        priority = self._priority(event)
+        eio_pkts = []
+        for p in encoded:
+            pkt = eio_packet.Packet(eio_packet.MESSAGE, p)
+            pkt.priority = priority  # read back by _shed() while the packet is queued
+            eio_pkts.append(pkt)
+        for sid, eio_sid in self.get_participants(namespace, room):
+            if sid not in skip_sid:
+                for pkt in eio_pkts:
+                    if not self._deliver(sid, eio_sid, namespace, pkt, priority):
+                        break
+
+    def _deliver(self, sid, eio_sid, namespace, pkt, priority) -> bool:
+        """Queue `pkt` for one client unless the policy says otherwise.
+        Returns False when the client was disconnected."""
+        sock = self.server.eio.sockets.get(eio_sid)
+        queue = getattr(sock, "queue", None)
+        if queue is None:
+            self.server._send_eio_packet(eio_sid, pkt)
+            return True
+
+        with self._bp_lock:
+            depth = queue.qsize()
+            if priority == CHATTER and depth >= self.max_queue // 2:
+                self._bp_stats["dropped_chatter"] += 1
+                return True
+            over = depth >= (2 * self.max_queue if priority == PRIORITY else self.max_queue)
+            if over and (self.policy == "disconnect" or priority == PRIORITY):
+                self._bp_stats["disconnected"] += 1
+                disconnect = True
+            elif over:
+                shed = self._shed(queue, depth - self.max_queue + 1)
+                self._bp_stats["shed_oldest"] += shed
+                if depth - shed >= self.max_queue:  # only priority packets left to shed
+                    self._bp_stats["dropped_new"] += 1
+                    return True
+                disconnect = False
+            else:
+                disconnect = False
+            if not disconnect:
+                self.server._send_eio_packet(eio_sid, pkt)  # under the lock, see module docstring
+                return True
+        self.server.disconnect(sid, namespace=namespace)
+        return False
+
+    def _shed(self, queue, n: int) -> int:
+        """Remove up to `n` of the oldest chatter, then normal, packets; keeps order.
+        Caller holds `_bp_lock`."""
+        # Edit the queue's deque in place under the queue's own mutex, the one
+        # the writer's get() takes, so it never sees a half-shed queue.
+        # eventlet's green Queue has no mutex, and nothing here yields.
+        with getattr(queue, "mutex", nullcontext()):
+            items = queue.queue
+            drop = set()
+            for level in (CHATTER, NORMAL):
+                for i, item in enumerate(items):
+                    if len(drop) >= n:
+                        break
+                    if getattr(item, "priority", PRIORITY) == level:
+                        drop.add(i)
+            if drop:
+                kept = [item for i, item in enumerate(items) if i not in drop]
+                items.clear()
+                items.extend(kept)
+        for _ in drop:
+            queue.task_done()  # Socket.close() joins the queue
+        return len(drop)
+
+class BackpressureManager(BackpressureMixin):
+    """In-process client manager with bounded per-connection queues."""
+
+
+def configure_from_app(manager, app) -> None:
+    manager.configure_backpressure(
+        app.config.get("SOCKETIO_MAX_QUEUE", 200),
+        app.config.get("SOCKETIO_SLOW_CLIENT_POLICY", "drop_oldest"),
+        app.config.get("SOCKETIO_PRIORITY_EVENTS"),
+        app.config.get("SOCKETIO_CHATTER_EVENTS"),
+    )
@@ -0,0 +1,156 @@
+"""Socket.IO client manager that fans emits out over PostgreSQL LISTEN/NOTIFY.
+
+Without a message queue an emit only reaches clients connected to the worker
+that made it. `PostgresManager` plugs into python-socketio's `PubSubManager`:
+every emit / room change is handled locally and published with `pg_notify`;
+every other worker LISTENs on the same channel and replays it for its own
+clients. No extra infrastructure beyond the database we already run.
+
+NOTIFY payloads are capped at 8000 bytes, so larger messages are written to
+the UNLOGGED `socketio_spill` table and only `@<spill_id>` is notified.
+
+Connections are plain psycopg2 connections in autocommit mode, separate from
+the SQLAlchemy pool: one for publishing, one held by the listener. Under
+eventlet the listener waits on the socket through the hub (no monkey
+patching required).
+
+Enable with SOCKETIO_MESSAGE_QUEUE = "postgres".
+"""
+import select
+from threading import Lock
+
+import psycopg2
+from psycopg2 import sql
+from socketio import PubSubManager
+
+from app.utils.socket_backpressure import BackpressureManager, BackpressureMixin, configure_from_app
+
+SPILL_PREFIX = "@"
+MAX_NOTIFY_BYTES = 7900  # Postgres limit is 8000 including the channel name
+
+
+def libpq_dsn(url: str) -> str:
+    """SQLAlchemy URL → libpq URI (drops a `+driver` suffix)."""
+    scheme, sep, rest = url.partition("://")
+    return scheme.split("+", 1)[0] + sep + rest
+
+
+class PostgresManager(PubSubManager, BackpressureMixin):
+    # BackpressureMixin comes after PubSubManager so the local delivery of
+    # messages received from other workers goes through its bounded emit.
+    name = "postgres"
+
+    def __init__(self, dsn: str, channel: str = "flask_socketio", write_only: bool = False,
+                 logger=None, json=None, poll_timeout: float = 5.0, spill_ttl_seconds: int = 60):
+        super().__init__(channel=channel, write_only=write_only, logger=logger, json=json)
+        self.dsn = libpq_dsn(dsn)
+        self.poll_timeout = poll_timeout
+        self.spill_ttl_seconds = spill_ttl_seconds
+        self._pub_conn = None
+        self._pub_lock = Lock()
+        self._spills = 0
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn)
+        conn.autocommit = True  # NOTIFY goes out immediately, LISTEN sees it immediately
+        return conn
+
+    # -- publish ----------------------------------------------------------------
+    def _publish(self, data):
+        payload = self.json.dumps(data)
+        for retries_left in (1, 0):  # 2 attempts, like the redis manager
+            try:
+                with self._pub_lock:
+                    if self._pub_conn is None or self._pub_conn.closed:
+                        self._pub_conn = self._connect()
+                    with self._pub_conn.cursor() as cur:
+                        if len(payload.encode()) > MAX_NOTIFY_BYTES:
+                            payload = SPILL_PREFIX + str(self._spill(cur, payload))
+                        cur.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                return
+            except psycopg2.Error:
+                with self._pub_lock:
+                    self._drop_pub_conn()
+                self._get_logger().error(
+                    "Cannot publish to postgres... %s", "retrying" if retries_left else "giving up", exc_info=True
+                )
+
+    def _drop_pub_conn(self) -> None:
+        conn, self._pub_conn = self._pub_conn, None
+        try:
+            if conn is not None:
+                conn.close()
+        except psycopg2.Error:
+            pass
+
+    def _spill(self, cur, payload: str) -> int:
+        cur.execute("INSERT INTO socketio_spill (payload) VALUES (%s) RETURNING spill_id", (payload,))
+        spill_id = cur.fetchone()[0]
+        self._spills += 1
+        if self._spills % 100 == 1:  # prune occasionally, not on every large message
+            cur.execute(
+                "DELETE FROM socketio_spill WHERE created_at < now() - make_interval(secs => %s)",
+                (self.spill_ttl_seconds,),
+            )
+        return spill_id
+
+    # -- listen -----------------------------------------------------------------
+    def _wait_readable(self, conn) -> None:
+        if getattr(self.server, "async_mode", None) == "eventlet":
+            from eventlet.hubs import trampoline
+            try:
+                trampoline(conn.fileno(), read=True, timeout=self.poll_timeout)
+            except TimeoutError:
+                pass
+            except Exception as exc:  # eventlet.Timeout is not a TimeoutError subclass
+                if type(exc).__name__ != "Timeout":
+                    raise
+        else:
+            select.select([conn], [], [], self.poll_timeout)
+
+    def _postgres_listen_with_retries(self):
+        retry_sleep = 1
+        conn = None
+        while True:
+            try:
+                if conn is None:
+                    conn = self._connect()
+                    with conn.cursor() as cur:
+                        cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    retry_sleep = 1
+                self._wait_readable(conn)
+                conn.poll()
+                while conn.notifies:
+                    yield conn, conn.notifies.pop(0).payload
+            except psycopg2.Error:
+                self._get_logger().error("Cannot receive from postgres... retrying in %s secs", retry_sleep)
+                try:
+                    if conn is not None:
+                        conn.close()
+                except psycopg2.Error:
+                    pass
+                conn = None
+                self.server.sleep(retry_sleep)
+                retry_sleep = min(retry_sleep * 2, 60)
+
+    def _listen(self):
+        for conn, payload in self._postgres_listen_with_retries():
+            if payload.startswith(SPILL_PREFIX):
+                with conn.cursor() as cur:
+                    cur.execute("SELECT payload FROM socketio_spill WHERE spill_id = %s", (int(payload[1:]),))
+                    row = cur.fetchone()
+                if row is None:
+                    continue  # pruned before we got to it
+                payload = row[0]
+            yield payload
+
+
+def make_client_manager(app):
+    """Client manager for `socketio.init_app`, per SOCKETIO_MESSAGE_QUEUE (unset = in-process).
+    Both kinds bound each connection's outbound queue (socket_backpressure.py)."""
+    if app.config.get("SOCKETIO_MESSAGE_QUEUE") == "postgres":
+        manager = PostgresManager(app.config["SQLALCHEMY_DATABASE_URI"], channel=app.config["SOCKETIO_CHANNEL"])
+    else:
+        manager = BackpressureManager()
+    configure_from_app(manager, app)
+    return manager
@@ -0,0 +1,276 @@
+"""Live Socket.IO server metrics and sampled logging.
+
+`InstrumentedSocketIO` is a drop-in `SocketIO` that records, per process:
+
+  * connects / refused connects / disconnects, and connected clients,
+  * inbound events, handler latency and handler errors, per event name,
+  * emits, emits per second (last 60 s), emit latency and payload bytes,
+    per event name,
+  * room sizes, read from the client manager when a snapshot is taken.
+
+Everything is in-memory counters and fixed-bucket histograms under one lock;
+a snapshot is served by the local-only `/metrics/sockets` endpoint (and to
+admins at `/admin/socket-metrics`). Payload size needs a JSON encode, so only
+a fraction of emits (`SOCKETIO_METRICS_PAYLOAD_SAMPLE`) is measured.
+
+Connect / disconnect / per-event log lines replace the old `print`s and go
+through `SampledLogger`: only `SOCKETIO_LOG_SAMPLE_RATE` of them are written,
+as `key=value` pairs, so logging stays off the hot path at high fan-in.
+"""
+import json
+import random
+from collections import defaultdict, deque
+from logging import getLogger
+from threading import Lock
+from time import monotonic, perf_counter
+
+from flask_socketio import SocketIO
+
+logger = getLogger("app.sockets")
+
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+BYTES_BUCKETS = (128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+
+class Histogram:
+    """Non-cumulative fixed-bucket histogram (last bucket is +Inf). Not locked."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-th observation (max for the +Inf bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return round(self.max, 3)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg": round(self.sum / self.count, 3) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": round(self.max, 3),
+            "buckets": {str(b): n for b, n in zip(self.buckets + ("inf",), self.counts)},
+        }
+
+
+class RateWindow:
+    """Events per second over the last `seconds`, in one-second slots. Not locked."""
+
+    def __init__(self, seconds: int = 60):
+        self.seconds = seconds
+        self._slots: deque[list] = deque()  # [second, count]
+
+    def add(self, n: int = 1, now: float | None = None) -> None:
+        second = int(now if now is not None else monotonic())
+        if self._slots and self._slots[-1][0] == second:
+            self._slots[-1][1] += n
+        else:
+            self._slots.append([second, n])
+        self._trim(second)
+
+    def _trim(self, second: int) -> None:
+        while self._slots and self._slots[0][0] <= second - self.seconds:
+            self._slots.popleft()
+
+    def per_second(self, now: float | None = None) -> float:
+        self._trim(int(now if now is not None else monotonic()))
+        return round(sum(n for _, n in self._slots) / self.seconds, 3)
+
+
+class SampledLogger:
+    """Writes roughly `rate` of the info-level lines it is given."""
+
+    def __init__(self, log, rate: float = 0.01):
+        self.log = log
+        self.rate = rate
+
+    def info(self, event: str, **fields) -> None:
+        if self.rate <= 0 or (self.rate < 1 and random.random() >= self.rate):
+            return
+        pairs = " ".join(f"{k}={v}" for k, v in fields.items())
+        self.log.info("%s %s sample=%s", event, pairs, self.rate)
+
+
+class SocketMetrics:
+    def __init__(self, payload_sample: float = 0.1):
+        self.payload_sample = payload_sample
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = monotonic()
+            self.connections = {"connects": 0, "refused": 0, "disconnects": 0}
+            self.inbound = defaultdict(int)
+            self.handler_errors = defaultdict(int)
+            self.handler_ms = defaultdict(lambda: Histogram(LATENCY_BUCKETS_MS))
+            self.emits = defaultdict(int)
+            self.emit_rate = defaultdict(RateWindow)
+            self.emit_ms = defaultdict(lambda: Histogram(LATENCY_BUCKETS_MS))
+            self.payload_bytes = defaultdict(lambda: Histogram(BYTES_BUCKETS))
+
+    def observe_handler(self, message: str, seconds: float, refused: bool = False, failed: bool = False) -> None:
+        with self._lock:
+            self.inbound[message] += 1
+            if failed:
+                self.handler_errors[message] += 1
+            self.handler_ms[message].observe(seconds * 1000)
+            if message == "connect":
+                self.connections["refused" if refused else "connects"] += 1
+            elif message == "disconnect":
+                self.connections["disconnects"] += 1
+
+    def observe_emit(self, event: str, seconds: float, payload_bytes: int | None) -> None:
+        with self._lock:
+            self.emits[event] += 1
+            self.emit_rate[event].add()
+            self.emit_ms[event].observe(seconds * 1000)
+            if payload_bytes is not None:
+                self.payload_bytes[event].observe(payload_bytes)
+
+    def snapshot(self, server=None, namespace: str = "/") -> dict:
+        with self._lock:
+            data = {
+                "uptime_seconds": round(monotonic() - self.started, 1),
+                "connections": dict(self.connections),
+                "inbound": {
+                    name: {
+                        "count": n,
+                        "errors": self.handler_errors.get(name, 0),
+                        "handler_ms": self.handler_ms[name].snapshot(),
+                    }
+                    for name, n in self.inbound.items()
+                },
+                "emits": {
+                    name: {
+                        "count": n,
+                        "per_second": self.emit_rate[name].per_second(),
+                        "latency_ms": self.emit_ms[name].snapshot(),
+                        "payload_bytes": self.payload_bytes[name].snapshot(),
+                    }
+                    for name, n in self.emits.items()
+                },
+                "payload_sample": self.payload_sample,
+            }
+        data.update(room_stats(server, namespace))
+        return data
+
+
+def _local_rooms(manager, namespace: str) -> tuple[set, dict] | None:
+    """(connected sids, {room: size}) for `namespace` on this worker.
+
+    Manager, PubSubManager and so PostgresManager all keep this worker's
+    clients in `manager.rooms`, which python-socketio mutates from other
+    threads while we read. Returns None for a manager without that table.
+    """
+    rooms = getattr(manager, "rooms", None)
+    if not isinstance(rooms, dict):
+        return None
+    for _ in range(3):
+        try:
+            table = list(rooms.get(namespace, {}).items())
+            connected = set(dict(table).get(None, ()))
+            return connected, {room: len(members) for room, members in table if room is not None}
+        except RuntimeError:  # a room changed size while we copied it
+            continue
+    return None
+
+
+def room_stats(server, namespace: str = "/", top: int = 5) -> dict:
+    """Connected clients and room sizes on this worker, from the client manager."""
+    local = _local_rooms(getattr(server, "manager", None), namespace)
+    if local is None:
+        return {"connected_clients": None, "rooms": {}, "largest_rooms": []}
+    connected, all_sizes = local
+    sizes = {room: n for room, n in all_sizes.items() if room not in connected}  # every sid is also its own room
+    by_kind: dict[str, list[int]] = defaultdict(list)
+    for room, size in sizes.items():
+        by_kind[room.split(":", 1)[0] if ":" in str(room) else "user"].append(size)
+    return {
+        "connected_clients": len(connected),
+        "rooms": {
+            kind: {"rooms": len(s), "max_size": max(s), "avg_size": round(sum(s) / len(s), 2)}
+            for kind, s in sorted(by_kind.items())
+        },
+        "largest_rooms": sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)[:top],
+    }
+
+
+class InstrumentedSocketIO(SocketIO):
+    """`SocketIO` that feeds `self.metrics` from every emit and handled event."""
+
+    def __init__(self, app=None, **kwargs):
+        self.metrics = SocketMetrics()
+        self.log = SampledLogger(logger)
+        super().__init__(app, **kwargs)
+
+    def init_app(self, app, **kwargs):
+        self.metrics.payload_sample = app.config.get("SOCKETIO_METRICS_PAYLOAD_SAMPLE", 0.1)
+        self.log.rate = app.config.get("SOCKETIO_LOG_SAMPLE_RATE", 0.01)
+        super().init_app(app, **kwargs)
+
+    def emit(self, event, *args, **kwargs):
+        size = None
+        if args and random.random() < self.metrics.payload_sample:
+            size = len(json.dumps(args[0], default=str))
+        started = perf_counter()
+        try:
+            return super().emit(event, *args, **kwargs)
+        finally:
+            self.metrics.observe_emit(event, perf_counter() - started, size)
+
+    def _handle_event(self, handler, message, namespace, sid, *args):
+        # the one place Flask-SocketIO calls every registered handler
+        started = perf_counter()
+        refused = failed = False
+        try:
+            ret = super()._handle_event(handler, message, namespace, sid, *args)
+            refused = ret is False
+            return ret
+        except ConnectionRefusedError:
+            refused = True
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.metrics.observe_handler(message, perf_counter() - started, refused=refused, failed=failed)
+
+    def metrics_snapshot(self) -> dict:
+        data = self.metrics.snapshot(self.server)
+        manager = getattr(self.server, "manager", None)
+        if hasattr(manager, "backpressure_stats"):
+            data["backpressure"] = manager.backpressure_stats()
+        return data
+
+
+def socket_metrics_snapshot() -> dict:
+    """This worker's Socket.IO counters, histograms and room sizes, plus the
+    event coalescer's batching stats (call inside an app context)."""
+    from flask import current_app
+    from app import socketio
+    return {
+        "server": socketio.metrics_snapshot(),
+        "coalescer": current_app.extensions["emit_coalescer"].metrics(),
+    }
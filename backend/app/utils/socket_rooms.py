@@ -0,0 +1,87 @@
+"""Socket.IO rooms a connection belongs to, and rooms an event is sent to.
+
+A socket is authenticated from the access token sent in the handshake
+(`io(url, { auth: { token } })`) and joins:
+
+    "<user_id>"          personal room (assignments, reminders)
+    "role:<ROLE>"        e.g. role:ADMIN
+    "state:<state_id>"   the state on the volunteer's profile
+    "skill:<skill_id>"   one per skill on the profile
+
+An event notification goes to its state room, one room per required skill
+and role:ADMIN. A socket in several of those rooms still gets it once
+(python-socketio de-duplicates sids across a room list). Before this, every
+event was broadcast to every connected client.
+"""
+from flask_socketio import join_room
+from sqlalchemy import select
+
+from app.imports import db
+from app.models.userProfiles import UserProfiles
+from app.models.userToSkill import UserToSkill
+
+INTEREST_PREFIXES = ("state:", "skill:")
+ADMIN_ROOM = "role:ADMIN"
+
+
+def interest_rooms(user_id: int) -> list[str]:
+    """State and skill rooms for a user's profile (one query; [] without a profile)."""
+    rows = db.session.execute(
+        select(UserProfiles.state_id, UserToSkill.skill_id)
+        .outerjoin(UserToSkill, UserToSkill.user_id == UserProfiles.user_id)
+        .where(UserProfiles.user_id == user_id)
+    ).all()
+    if not rows:
+        return []
+    rooms = [f"state:{rows[0].state_id}"]
+    rooms += [f"skill:{r.skill_id}" for r in rows if r.skill_id is not None]
+    return rooms
+
+
+def connection_rooms(user_id: int, role: str | None) -> list[str]:
+    rooms = [str(user_id), *interest_rooms(user_id)]
+    if role:
+        rooms.append(f"role:{role}")
+    return rooms
+
+
+def join_connection_rooms(user_id: int, role: str | None) -> list[str]:
+    """Join the current socket (inside a connect handler) to all its rooms."""
+    rooms = connection_rooms(user_id, role)
+    for room in rooms:
+        join_room(room)
+    return rooms
+
+
+def event_rooms(state_id: str | None, skill_ids) -> tuple[str, ...]:
+    """Rooms that care about an event; sorted tuple so it works as a batching key."""
+    rooms = {ADMIN_ROOM}
+    if state_id:
+        rooms.add(f"state:{state_id}")
+    rooms.update(f"skill:{s}" for s in skill_ids)
+    return tuple(sorted(rooms))
+
+
+def refresh_interest_rooms(user_id: int, namespace: str = "/") -> int:
+    """Re-join this process's sockets for `user_id` after a profile change.
+
+    Only sockets connected to this worker are updated; sockets on other
+    workers pick up the new rooms on their next (re)connect. Returns the
+    number of sockets updated.
+    """
+    from app import socketio
+
+    server = socketio.server
+    if server is None:
+        return 0
+    sids = [sid for sid, _ in server.manager.get_participants(namespace, str(user_id))]
+    if not sids:
+        return 0
+    wanted = set(interest_rooms(user_id))
+    for sid in sids:
+        current = {r for r in server.rooms(sid, namespace=namespace) if r.startswith(INTEREST_PREFIXES)}
+        for room in current - wanted:
+            server.leave_room(sid, room, namespace=namespace)
+        for room in wanted - current:
+            server.enter_room(sid, room, namespace=namespace)
+    return len(sids)
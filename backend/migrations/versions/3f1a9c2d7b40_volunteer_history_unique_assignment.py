@@ -0,0 +1,38 @@
+"""Unique (user_id, event_id) on volunteer_history
+
+Revision ID: 3f1a9c2d7b40
+Revises: c80074fb66b1
+Create Date: 2026-10-19 09:12:04.118230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2d7b40'
+down_revision = 'c80074fb66b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Collapse duplicate assignments first, keeping the oldest row per pair,
+    # otherwise the constraint below cannot be created.
+    op.execute(
+        """
+        DELETE FROM volunteer_history a
+        USING volunteer_history b
+        WHERE a.user_id = b.user_id
+          AND a.event_id = b.event_id
+          AND a.vol_history_id > b.vol_history_id
+        """
+    )
+
+    with op.batch_alter_table('volunteer_history', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_volunteer_history_user_event', ['user_id', 'event_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('volunteer_history', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_volunteer_history_user_event', type_='unique')
@@ -0,0 +1,31 @@
+"""Add unlogged rate_limit_buckets table
+
+Revision ID: a61f0e93d2c8
+Revises: 8d2e4b61c5a7
+Create Date: 2026-10-19 11:27:40.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a61f0e93d2c8'
+down_revision = '8d2e4b61c5a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('rate_limit_buckets',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('tokens', sa.Float(), nullable=False),
+    sa.Column('allowed', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key'),
+    prefixes=['UNLOGGED']
+    )
+
+
+def downgrade():
+    op.drop_table('rate_limit_buckets')
@@ -0,0 +1,30 @@
+"""Add UNLOGGED socketio_spill for oversized Socket.IO NOTIFY payloads
+
+Revision ID: a8c4e6f2b359
+Revises: f3b7d9e5a182
+Create Date: 2026-10-19 18:32:07.514628
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4e6f2b359'
+down_revision = 'f3b7d9e5a182'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('socketio_spill',
+    sa.Column('spill_id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('spill_id'),
+    prefixes=['UNLOGGED']
+    )
+
+
+def downgrade():
+    op.drop_table('socketio_spill')
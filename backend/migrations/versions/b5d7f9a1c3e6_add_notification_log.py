@@ -0,0 +1,40 @@
+"""Add notification_cursors and notification_log for socket replay
+
+Revision ID: b5d7f9a1c3e6
+Revises: a8c4e6f2b359
+Create Date: 2026-10-19 19:05:41.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d7f9a1c3e6'
+down_revision = 'a8c4e6f2b359'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notification_cursors',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('last_seq', sa.BigInteger(), nullable=False),
+    sa.Column('acked_seq', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user_credentials.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('notification_log',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('seq', sa.BigInteger(), nullable=False),
+    sa.Column('event', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user_credentials.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'seq')
+    )
+
+
+def downgrade():
+    op.drop_table('notification_log')
+    op.drop_table('notification_cursors')
@@ -0,0 +1,47 @@
+"""Case-insensitive unique index on user_credentials.email
+
+Revision ID: c4e8a2f6b913
+Revises: b7c3d1e85f20
+Create Date: 2026-10-19 13:55:22.804417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a2f6b913'
+down_revision = 'b7c3d1e85f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Normalize legacy mixed-case rows. Rows whose lowercase form is already
+    # taken are left alone; the index below then fails and those pairs need a
+    # manual merge before re-running.
+    op.execute(
+        """
+        UPDATE user_credentials u
+        SET email = lower(u.email)
+        WHERE u.email <> lower(u.email)
+          AND NOT EXISTS (
+              SELECT 1 FROM user_credentials o
+              WHERE o.user_id <> u.user_id AND lower(o.email) = lower(u.email)
+          )
+        """
+    )
+    op.create_index(
+        'uq_user_credentials_email_lower',
+        'user_credentials',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+    with op.batch_alter_table('user_credentials', schema=None) as batch_op:
+        batch_op.drop_constraint('user_credentials_email_key', type_='unique')
+
+
+def downgrade():
+    with op.batch_alter_table('user_credentials', schema=None) as batch_op:
+        batch_op.create_unique_constraint('user_credentials_email_key', ['email'])
+    op.drop_index('uq_user_credentials_email_lower', table_name='user_credentials')
@@ -0,0 +1,44 @@
+"""Add notifications inbox and unread counter
+
+Revision ID: c6e8a0b2d4f7
+Revises: b5d7f9a1c3e6
+Create Date: 2026-10-19 19:48:12.660254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e8a0b2d4f7'
+down_revision = 'b5d7f9a1c3e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notifications',
+    sa.Column('notification_id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=30), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('message', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.event_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user_credentials.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('notification_id')
+    )
+    op.create_index('ix_notifications_user_created', 'notifications',
+                    ['user_id', 'created_at', 'notification_id'], unique=False)
+    op.create_index('uq_notifications_unread_update', 'notifications', ['user_id', 'event_id'], unique=True,
+                    postgresql_where=sa.text("read_at IS NULL AND kind = 'event_update'"))
+    op.add_column('notification_cursors',
+                  sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('notification_cursors', 'unread_count')
+    op.drop_index('uq_notifications_unread_update', table_name='notifications')
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_table('notifications')
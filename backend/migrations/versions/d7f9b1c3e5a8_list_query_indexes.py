@@ -0,0 +1,37 @@
+"""Add prefix, keyset and trigram indexes for list queries
+
+Revision ID: d7f9b1c3e5a8
+Revises: c6e8a0b2d4f7
+Create Date: 2026-10-19 20:31:07.114382
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f9b1c3e5a8'
+down_revision = 'c6e8a0b2d4f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_user_credentials_email_pattern', 'user_credentials',
+                    [sa.text('lower(email) text_pattern_ops')], unique=False)
+    op.create_index('ix_user_credentials_created', 'user_credentials',
+                    ['created_at', 'user_id'], unique=False)
+    op.create_index('ix_user_profiles_full_name_pattern', 'user_profiles',
+                    [sa.text('lower(full_name) text_pattern_ops')], unique=False)
+    # substring ("contains") search on names; not declared on the model so
+    # create_all() keeps working on databases without pg_trgm
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_user_profiles_full_name_trgm', 'user_profiles',
+                    [sa.text('full_name gin_trgm_ops')], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_user_profiles_full_name_trgm', table_name='user_profiles')
+    op.drop_index('ix_user_profiles_full_name_pattern', table_name='user_profiles')
+    op.drop_index('ix_user_credentials_created', table_name='user_credentials')
+    op.drop_index('ix_user_credentials_email_pattern', table_name='user_credentials')
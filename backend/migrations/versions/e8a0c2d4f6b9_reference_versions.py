@@ -0,0 +1,55 @@
+"""Add reference_versions and change triggers on states / skills
+
+Revision ID: e8a0c2d4f6b9
+Revises: d7f9b1c3e5a8
+Create Date: 2026-10-19 21:02:44.508913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a0c2d4f6b9'
+down_revision = 'd7f9b1c3e5a8'
+branch_labels = None
+depends_on = None
+
+BUMP_FUNCTION = """
+CREATE SEQUENCE IF NOT EXISTS reference_version_seq;
+CREATE OR REPLACE FUNCTION bump_reference_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO reference_versions (name, version)
+    VALUES (TG_TABLE_NAME, nextval('reference_version_seq'))
+    ON CONFLICT (name) DO UPDATE SET version = excluded.version;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade():
+    op.create_table('reference_versions',
+    sa.Column('name', sa.String(length=63), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(BUMP_FUNCTION)
+    for table in ('states', 'skills'):
+        op.execute(
+            f"CREATE TRIGGER {table}_bump_reference_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_version()"
+        )
+        op.execute(
+            f"INSERT INTO reference_versions (name, version) "
+            f"VALUES ('{table}', nextval('reference_version_seq'))"
+        )
+
+
+def downgrade():
+    for table in ('skills', 'states'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_reference_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_reference_version()")
+    op.execute("DROP SEQUENCE IF EXISTS reference_version_seq")
+    op.drop_table('reference_versions')
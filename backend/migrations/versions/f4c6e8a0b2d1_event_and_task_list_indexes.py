@@ -0,0 +1,27 @@
+"""Add keyset indexes for the event and task lists
+
+Revision ID: f4c6e8a0b2d1
+Revises: e8a0c2d4f6b9
+Create Date: 2026-10-19 21:12:40.508311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4c6e8a0b2d1'
+down_revision = 'e8a0c2d4f6b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_events_date', 'events', ['date', 'event_id'], unique=False)
+    op.create_index('ix_volunteer_history_user', 'volunteer_history',
+                    ['user_id', 'vol_history_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_volunteer_history_user', table_name='volunteer_history')
+    op.drop_index('ix_events_date', table_name='events')
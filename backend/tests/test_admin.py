@@ -2,7 +2,11 @@ from tests.utils import (
     seed_states,
     create_confirmed_user_and_token,
     auth_header,
-    find_rule
+    find_rule,
+    count_queries,
+    selects,
+    seed_skills,
+    login_get_token,
 )
 from app.models.userCredentials import UserCredentials, User_Roles
 from app.models.userProfiles import UserProfiles
@@ -112,3 +116,189 @@ def test_invalid_transitions_return_400(client, app):
     r2 = client.post(f"/admin/deny/{user_id}")
     assert r2.status_code == 400
     assert "is an admin" in r2.get_data(as_text=True)
+
+
+# ------------------- /admin/list -------------------
+def _seed_people(app):
+    seed_states(app)
+    people = [
+        ("ann@example.org", "Ann Archer", "TX", User_Roles.VOLUNTEER),
+        ("bob@example.org", "Bob Baker", "CA", User_Roles.VOLUNTEER),
+        ("cara@example.org", "Cara Annson", "TX", User_Roles.ADMIN),
+        ("dan_x@example.org", "Dan 100% Real", "TX", User_Roles.VOLUNTEER),
+        ("eve@example.org", None, None, User_Roles.VOLUNTEER),
+    ]
+    with app.app_context():
+        for email, name, state, role in people:
+            user = UserCredentials(email=email, role=role, password_hash="x")
+            if name:
+                user.profile = UserProfiles(full_name=name, address1="1 St", city="Houston",
+                                            state_id=state, zipcode="77001")
+            db.session.add(user)
+        db.session.commit()
+
+
+def _names(r):
+    return [u["full_name"] for u in r.get_json()["items"]]
+
+
+def test_list_users_filters(client, app):
+    _seed_people(app)
+    path = find_rule(app, "admin.list_users")
+
+    assert _names(client.get(path, query_string={"name": "an"})) == ["Ann Archer"]      # prefix only
+    assert _names(client.get(path, query_string={"q": "ann"})) == ["Ann Archer", "Cara Annson"]
+    assert _names(client.get(path, query_string={"email": "BO"})) == ["Bob Baker"]
+    assert _names(client.get(path, query_string={"role": "admin"})) == ["Cara Annson"]
+    assert _names(client.get(path, query_string={"state": "tx", "role": "VOLUNTEER"})) == [
+        "Ann Archer", "Dan 100% Real"]
+    # LIKE wildcards in the input are literal
+    assert _names(client.get(path, query_string={"q": "100%"})) == ["Dan 100% Real"]
+    assert _names(client.get(path, query_string={"email": "d_"})) == []
+    assert _names(client.get(path, query_string={"email": "dan_"})) == ["Dan 100% Real"]
+
+    r = client.get(path, query_string={"start_date": "01-01-2000", "end_date": "01-01-2001"})
+    assert r.status_code == 200 and r.get_json() == {"items": [], "next_cursor": None}
+
+
+def test_list_users_rejects_unknown_params(client, app):
+    path = find_rule(app, "admin.list_users")
+    for args in ({"password_hash": "x"}, {"sort": "password_hash"}, {"order": "sideways"},
+                 {"role": "ROOT"}, {"limit": "ten"}, {"cursor": "garbage"},
+                 {"start_date": "yesterday"}, {"cursor": "x", "offset": "5"}):
+        r = client.get(path, query_string=args)
+        assert r.status_code == 400, args
+        assert "error" in r.get_json()
+
+
+def test_list_users_keyset_pages(client, app):
+    _seed_people(app)
+    path = find_rule(app, "admin.list_users")
+
+    seen, args = [], {"sort": "full_name", "order": "desc", "limit": 2}
+    while True:
+        body = client.get(path, query_string=args).get_json()
+        assert len(body["items"]) <= 2
+        seen += [u["full_name"] for u in body["items"]]
+        if not body["next_cursor"]:
+            break
+        args = {**args, "cursor": body["next_cursor"]}
+    assert seen == ["Dan 100% Real", "Cara Annson", "Bob Baker", "Ann Archer", None]
+
+    # a cursor only fits the sort it came from
+    first = client.get(path, query_string={"sort": "email", "limit": 1}).get_json()
+    r = client.get(path, query_string={"sort": "user_id", "cursor": first["next_cursor"]})
+    assert r.status_code == 400
+
+    # offset is applied before limit
+    all_ids = [u["user_id"] for u in client.get(path).get_json()["items"]]
+    r = client.get(path, query_string={"offset": 1, "limit": 2})
+    assert [u["user_id"] for u in r.get_json()["items"]] == all_ids[1:3]
+
+
+def _more_people(app, n):
+    with app.app_context():
+        for i in range(n):
+            user = UserCredentials(email=f"bulk{i}@example.org", password_hash="x")
+            user.profile = UserProfiles(full_name=f"Bulk {i}", address1="1 St", city="Austin",
+                                        state_id="TX", zipcode="78701")
+            db.session.add(user)
+        db.session.commit()
+
+
+def test_list_users_statement_count_is_constant(client, app):
+    _seed_people(app)
+    path = find_rule(app, "admin.list_users")
+
+    with count_queries(app) as few:
+        r = client.get(path)
+    assert len(r.get_json()["items"]) == 5
+    _more_people(app, 20)
+    with count_queries(app) as many:
+        r = client.get(path, query_string={"sort": "full_name"})
+    assert len(r.get_json()["items"]) == 25
+    assert len(selects(few)) == len(selects(many)) == 1, many
+    assert r.get_json()["items"][0] == {
+        "user_id": r.get_json()["items"][0]["user_id"], "full_name": None, "role": "VOLUNTEER", "state_id": None,
+    }
+
+
+def test_query_handler_loader_options(app):
+    from sqlalchemy.orm import joinedload, lazyload
+    from app.routes.admin import USER_LIST
+    from app.utils.query_handler import query_handler
+
+    _seed_people(app)
+    with app.app_context():
+        with count_queries(app) as stmts:
+            page = query_handler(USER_LIST, {"state": "TX"}, options=[
+                joinedload(UserCredentials.profile).lazyload(UserProfiles.availability),
+                lazyload(UserCredentials.skills_assoc),
+            ])
+            names = [u.profile.full_name for u in page]
+        assert names == ["Ann Archer", "Cara Annson", "Dan 100% Real"]
+        assert len(selects(stmts)) == 1, stmts
+
+
+# ------------------- /admin/profiles -------------------
+def _admin_token(client, app):
+    create_confirmed_user_and_token(client, app, email="boss@example.org", role="admin", skip_login=True)
+    with app.app_context():
+        UserCredentials.find_by_email("boss@example.org").role = User_Roles.ADMIN
+        db.session.commit()
+    return login_get_token(client, "boss@example.org", "StrongPass!1")
+
+
+def test_batch_profiles_returns_skills_and_availability(client, app):
+    from datetime import date
+    from app.models.userAvailability import UserAvailability
+    from app.models.userToSkill import UserToSkill
+
+    _seed_people(app)
+    skills = seed_skills(app)
+    token = _admin_token(client, app)
+    with app.app_context():
+        ann = UserCredentials.find_by_email("ann@example.org").user_id
+        bob = UserCredentials.find_by_email("bob@example.org").user_id
+        eve = UserCredentials.find_by_email("eve@example.org").user_id  # no profile
+        db.session.add_all([
+            UserToSkill(user_id=ann, skill_id=skills["Technical"]),
+            UserToSkill(user_id=ann, skill_id=skills["Leadership"]),
+            UserAvailability(user_id=ann, available_date=date(2030, 5, 2)),
+            UserAvailability(user_id=ann, available_date=date(2030, 5, 1)),
+        ])
+        db.session.commit()
+
+    r = client.get(f"/admin/profiles?ids={bob},{ann}&ids={eve}", headers=auth_header(token))
+    assert r.status_code == 200
+    j = r.get_json()
+    assert [p["full_name"] for p in j["profiles"]] == ["Bob Baker", "Ann Archer"]
+    assert j["missing"] == [eve]
+    bob_p, ann_p = j["profiles"]
+    assert ann_p["skills"] == sorted([skills["Technical"], skills["Leadership"]])
+    assert ann_p["availability"] == ["2030-05-01", "2030-05-02"]
+    assert bob_p["skills"] == [] and bob_p["availability"] == []
+
+
+def test_batch_profiles_query_count_is_fixed(client, app):
+    _seed_people(app)
+    _more_people(app, 20)
+    token = _admin_token(client, app)
+    with app.app_context():
+        ids = [u.user_id for u in UserCredentials.query.all()]
+
+    client.get(f"/admin/profiles?ids={ids[0]}", headers=auth_header(token))  # warm role cache
+    with count_queries(app) as one:
+        client.get(f"/admin/profiles?ids={ids[0]}", headers=auth_header(token))
+    with count_queries(app) as many:
+        r = client.get("/admin/profiles?ids=" + ",".join(map(str, ids)), headers=auth_header(token))
+    assert len(r.get_json()["profiles"]) == 24
+    assert len(selects(one)) == len(selects(many)) == 3, many
+
+
+def test_batch_profiles_validation(client, app):
+    token = _admin_token(client, app)
+    for query in ("", "?ids=", "?ids=1,x", "?ids=" + ",".join(map(str, range(1, 202)))):
+        assert client.get("/admin/profiles" + query, headers=auth_header(token)).status_code == 400
+    volunteer = create_confirmed_user_and_token(client, app, email="vol@example.org")
+    assert client.get("/admin/profiles?ids=1", headers=auth_header(volunteer)).status_code == 403
@@ -209,3 +209,206 @@ def test_resend_confirmation_missing_email_400(client):
     r = client.post("/auth/resend-confirmation", json={})
     assert r.status_code == 400
     assert "Email is required" in r.get_data(as_text=True)
+
+
+# -------------------------------
+# Role checks (claims-based)
+# -------------------------------
+def _admin_token(client, app, email="boss@example.org", pw="StrongPass!1"):
+    _ = _register(client, email=email, password=pw, role="admin")
+    _ = _confirm_user(client, app, email, role_requested="admin")
+    with app.app_context():
+        user = UserCredentials.query.filter_by(email=email).first()
+        user.role = User_Roles.ADMIN
+        db.session.commit()
+    return _login(client, email, pw).get_json()["access_token"]
+
+
+def _guarded(*roles):
+    from app.utils.auth import roles_required
+
+    @roles_required(*roles)
+    def view():
+        return "ok"
+    return view
+
+
+def test_roles_required_uses_claims_and_cache(client, app):
+    from app.utils.auth import invalidate_role_cache
+    from tests.utils import count_queries, selects
+
+    token = _admin_token(client, app)
+    view = _guarded(User_Roles.ADMIN)
+    invalidate_role_cache()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with app.test_request_context(headers=headers):
+        with count_queries(app) as cold:
+            assert view() == "ok"
+    with app.test_request_context(headers=headers):
+        with count_queries(app) as warm:
+            assert view() == "ok"
+
+    assert len(selects(cold)) == 1   # role_version lookup only
+    assert selects(warm) == []       # served entirely from the token + cache
+
+
+def test_roles_required_forbids_other_roles(client, app):
+    email, pw = "plainvol@example.org", "StrongPass!1"
+    _ = _register(client, email=email, password=pw)
+    _ = _confirm_user(client, app, email)
+    token = _login(client, email, pw).get_json()["access_token"]
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        body, status = _guarded(User_Roles.ADMIN)()
+    assert status == 403
+
+
+def test_roles_required_rejects_token_after_demotion(client, app):
+    token = _admin_token(client, app, email="demoted@example.org")
+    view = _guarded(User_Roles.ADMIN)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with app.test_request_context(headers=headers):
+        assert view() == "ok"
+
+    # role change through the admin API bumps role_version + drops the cache entry
+    with app.app_context():
+        user = UserCredentials.query.filter_by(email="demoted@example.org").first()
+        user.role = User_Roles.ADMIN_PENDING
+        db.session.commit()
+        uid = user.user_id
+    assert client.post(f"/admin/deny/{uid}").status_code == 200
+
+    with app.test_request_context(headers=headers):
+        body, status = view()
+    assert status == 401
+    assert body.get_json()["error"] == "token_stale"
+
+
+# -------------------------------
+# Password hashing pool
+# -------------------------------
+@pytest.fixture
+def hash_config(app):
+    """Temporarily override hashing config; the pool is rebuilt around it."""
+    from app.utils.passwords import shutdown_pool
+
+    saved = {k: app.config[k] for k in ("PASSWORD_HASH_METHOD", "PASSWORD_HASH_MAX_PENDING")}
+    shutdown_pool()
+    yield app.config
+    app.config.update(saved)
+    shutdown_pool()
+
+
+def test_login_rehashes_when_cost_changes(client, app, hash_config):
+    email, pw = "rehash@example.org", "StrongPass!1"
+    _ = _register(client, email=email, password=pw)
+    _ = _confirm_user(client, app, email)
+    with app.app_context():
+        assert UserCredentials.query.filter_by(email=email).one().password_hash.startswith("pbkdf2:sha256:1000$")
+
+    hash_config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+    assert _login(client, email, pw).status_code == 200
+    with app.app_context():
+        new_hash = UserCredentials.query.filter_by(email=email).one().password_hash
+    assert new_hash.startswith("pbkdf2:sha256:2000$")
+
+    # the upgraded hash still verifies
+    assert _login(client, email, pw).status_code == 200
+
+
+def test_login_returns_503_when_hash_queue_full(client, app, hash_config):
+    email, pw = "busy@example.org", "StrongPass!1"
+    _ = _register(client, email=email, password=pw)
+    _ = _confirm_user(client, app, email)
+
+    from app.utils.passwords import shutdown_pool
+
+    hash_config["PASSWORD_HASH_MAX_PENDING"] = 0
+    shutdown_pool()  # pool limits are read when the pool is built
+    r = _login(client, email, pw)
+    assert r.status_code == 503
+    assert r.get_json()["error"] == "busy"
+    assert r.headers["Retry-After"] == "1"
+
+
+# -------------------------------
+# Refresh tokens
+# -------------------------------
+def _login_pair(client, app, email="refresh@example.org", pw="StrongPass!1"):
+    _ = _register(client, email=email, password=pw)
+    _ = _confirm_user(client, app, email)
+    j = _login(client, email, pw).get_json()
+    return j["access_token"], j["refresh_token"]
+
+
+def test_refresh_rotates_and_rejects_reuse(client, app):
+    access, refresh = _login_pair(client, app)
+
+    r = client.post("/auth/refresh", headers={"Authorization": f"Bearer {refresh}"})
+    assert r.status_code == 200
+    j = r.get_json()
+    assert j["refresh_token"] != refresh
+
+    # new access token works
+    me = client.get("/auth/me", headers={"Authorization": f"Bearer {j['access_token']}"})
+    assert me.status_code == 200
+
+    # old refresh token was rotated out
+    again = client.post("/auth/refresh", headers={"Authorization": f"Bearer {refresh}"})
+    assert again.status_code == 401
+
+    # the new one still works
+    r2 = client.post("/auth/refresh", headers={"Authorization": f"Bearer {j['refresh_token']}"})
+    assert r2.status_code == 200
+
+
+def test_refresh_requires_refresh_token(client, app):
+    access, _ = _login_pair(client, app, email="wrongtype@example.org")
+    r = client.post("/auth/refresh", headers={"Authorization": f"Bearer {access}"})
+    assert r.status_code in (401, 422)
+
+
+def test_logout_revokes_refresh_token(client, app):
+    _, refresh = _login_pair(client, app, email="bye@example.org")
+    assert client.post("/auth/logout", headers={"Authorization": f"Bearer {refresh}"}).status_code == 200
+    assert client.post("/auth/refresh", headers={"Authorization": f"Bearer {refresh}"}).status_code == 401
+
+
+# -------------------------------
+# Case-insensitive email / single-query login
+# -------------------------------
+def test_login_matches_legacy_mixed_case_email(client, app):
+    from datetime import datetime as dt
+    from app.utils.passwords import hash_password
+
+    with app.app_context():
+        db.session.add(UserCredentials(
+            email="Legacy.User@Example.ORG",
+            role=User_Roles.VOLUNTEER,
+            password_hash=hash_password("StrongPass!1"),
+            email_confirmed_at=dt.utcnow(),
+        ))
+        db.session.commit()
+
+    r = _login(client, "legacy.user@example.org", "StrongPass!1")
+    assert r.status_code == 200
+
+    # lower(email) is unique: a case variant cannot register again
+    r2 = _register(client, email="legacy.user@example.org", password="x")
+    assert r2.status_code == 409
+
+
+def test_login_issues_a_single_select(client, app):
+    from tests.utils import count_queries, selects
+
+    email, pw = "onequery@example.org", "StrongPass!1"
+    _ = _register(client, email=email, password=pw)
+    _ = _confirm_user(client, app, email)
+
+    with count_queries(app) as stmts:
+        r = _login(client, email, pw)
+    assert r.status_code == 200
+    assert "role" in r.get_json()["user"]
+    assert len(selects(stmts)) == 1, stmts
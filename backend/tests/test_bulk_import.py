@@ -0,0 +1,101 @@
+import io
+
+from app import db
+from app.models.emailOutbox import EmailOutbox
+from app.models.userCredentials import UserCredentials, User_Roles
+from app.models.userProfiles import UserProfiles
+from app.utils.bulk_import import hash_passwords
+from tests.utils import seed_states, create_confirmed_user_and_token, auth_header, login_get_token, confirm_email_via_token
+
+CSV = """email,password,full_name,address1,address2,city,state,zipcode,preferences
+New.One@Example.org,Pass!one1,New One,1 Main St,,Austin,tx,78701,mornings
+two@example.org,Pass!two2,,,,,,,
+taken@example.org,Whatever1,,,,,,,
+two@example.org,Pass!two2,,,,,,,
+,nopass,,,,,,,
+bad@example.org,Pass!bad3,Bad State,1 Main St,,Austin,ZZ,78701,
+"""
+
+
+def _admin_token(client, app):
+    create_confirmed_user_and_token(client, app, email="importer@example.org", role="admin", skip_login=True)
+    with app.app_context():
+        UserCredentials.find_by_email("importer@example.org").role = User_Roles.ADMIN
+        db.session.commit()
+    return login_get_token(client, "importer@example.org", "StrongPass!1")
+
+
+def test_import_creates_users_profiles_and_mail(client, app):
+    seed_states(app, [("TX", "Texas")])
+    create_confirmed_user_and_token(client, app, email="taken@example.org", skip_login=True)
+    token = _admin_token(client, app)
+
+    r = client.post(
+        "/admin/import-volunteers",
+        data={"file": (io.BytesIO(CSV.encode()), "volunteers.csv")},
+        headers=auth_header(token),
+    )
+    assert r.status_code == 201, r.get_data(as_text=True)
+    report = r.get_json()
+    assert report["rows"] == 6
+    assert report["created"] == 2 and report["profiles"] == 1
+    assert report["skipped_existing"] == ["taken@example.org"]
+    assert sorted(e["line"] for e in report["errors"]) == [5, 6, 7]
+    assert report["rows_per_second"] > 0
+
+    with app.app_context():
+        user = UserCredentials.find_by_email("new.one@example.org")
+        assert user.role is User_Roles.VOLUNTEER and user.email_confirmed_at is None
+        profile = db.session.get(UserProfiles, user.user_id)
+        assert (profile.state_id, profile.zipcode, profile.address2) == ("TX", "78701", None)
+        mails = db.session.query(EmailOutbox).filter(
+            EmailOutbox.to_email.in_(["new.one@example.org", "two@example.org"])
+        ).all()
+        assert len(mails) == 2 and all("/auth/confirm/" in m.body for m in mails)
+
+    # imported accounts go through the normal confirm + login flow
+    confirm_email_via_token(client, app, email="two@example.org")
+    assert client.post("/auth/login", json={"email": "two@example.org", "password": "Pass!two2"}).status_code == 200
+
+
+def test_import_requires_admin(client, app):
+    token = create_confirmed_user_and_token(client, app, email="vol@example.org")
+    r = client.post("/admin/import-volunteers", data=CSV, headers=auth_header(token))
+    assert r.status_code == 403
+
+
+def test_import_rejects_missing_columns(client, app):
+    r = client.post("/admin/import-volunteers", data="email\nx@example.org\n", headers=auth_header(_admin_token(client, app)))
+    assert r.status_code == 400
+
+
+def test_hash_passwords_in_processes_keeps_order():
+    from werkzeug.security import check_password_hash
+
+    pws = [f"pw{i}" for i in range(6)]
+    hashes = hash_passwords(pws, "pbkdf2:sha256:1000", processes=2, chunk_size=2)
+    assert [check_password_hash(h, pw) for h, pw in zip(hashes, pws)] == [True] * 6
+
+
+def test_import_over_http_row_cap_is_413(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_IMPORT_MAX_HTTP_ROWS", 3)
+    token = _admin_token(client, app)
+    r = client.post("/admin/import-volunteers", data=CSV, headers=auth_header(token))
+    assert r.status_code == 413
+    assert "import_volunteers" in r.get_json()["error"]
+    with app.app_context():
+        assert UserCredentials.find_by_email("two@example.org") is None
+
+
+def test_import_confirmation_token_carries_the_users_version(client, app):
+    from app.utils.tokens import verify_email_token
+
+    seed_states(app, [("TX", "Texas")])
+    r = client.post("/admin/import-volunteers", data=CSV, headers=auth_header(_admin_token(client, app)))
+    assert r.status_code == 201
+    with app.app_context():
+        user = UserCredentials.find_by_email("two@example.org")
+        mail = db.session.query(EmailOutbox).filter_by(to_email="two@example.org").one()
+        token = mail.body.split("/auth/confirm/", 1)[1].split()[0]
+        payload = verify_email_token(token)
+        assert (payload["uid"], payload["r"], payload["v"]) == (user.user_id, "volunteer", user.confirmation_token_version)
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+from app import db, socketio
+from app.models.events import Events, UrgencyEnum
+from app.utils.emit_coalescer import EmitCoalescer
+from tests.utils import seed_states
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.emitted, self.tasks = [], []
+
+    def emit(self, event, data, to=None):
+        self.emitted.append((event, to, data))
+
+    def start_background_task(self, fn):
+        self.tasks.append(fn)
+
+    def sleep(self, seconds):
+        pass
+
+
+def test_repeated_updates_collapse_into_one_batch():
+    sio = FakeSocketIO()
+    c = EmitCoalescer(sio, window_seconds=0.25)
+
+    for i in range(4):
+        c.emit("event_update", 1, {"event_id": 1, "rev": i})
+    c.emit("event_update", 2, {"event_id": 2, "rev": 0})
+
+    assert sio.emitted == []
+    assert len(sio.tasks) == 1  # one timer per window, not per emit
+    sio.tasks.pop()()
+
+    assert sio.emitted == [("event_update_batch", None, [{"event_id": 1, "rev": 3}, {"event_id": 2, "rev": 0}])]
+    m = c.metrics()
+    assert (m["received"], m["coalesced"], m["batches"], m["items_emitted"], m["emits_saved"]) == (5, 3, 1, 2, 4)
+
+
+def test_batches_are_split_per_room_and_size():
+    sio = FakeSocketIO()
+    c = EmitCoalescer(sio, window_seconds=0.25, max_batch=2)
+    for eid in range(3):
+        c.emit("event_created", eid, {"event_id": eid})
+    c.emit("event_created", 9, {"event_id": 9}, to="user:9")
+
+    assert c.flush() == 3
+    assert [(to, [d["event_id"] for d in data]) for _, to, data in sio.emitted] == [
+        (None, [0, 1]), (None, [2]), ("user:9", [9]),
+    ]
+
+
+def test_event_routes_emit_batches(client, app, monkeypatch):
+    seed_states(app, [("TX", "Texas")])
+    emitted = []
+    monkeypatch.setattr(socketio, "emit", lambda event, data, to=None, **kw: emitted.append((event, data)))
+
+    with app.app_context():
+        ev = Events(name="Batch", description="d", city="Austin", state_id="TX",
+                    urgency=UrgencyEnum.low, date=datetime.utcnow() + timedelta(days=1))
+        db.session.add(ev)
+        db.session.commit()
+        eid = ev.event_id
+
+    assert client.patch(f"/events/{eid}", json={"name": "Batch v2"}).status_code == 200
+    # TestConfig flushes immediately: a batch of one
+    assert [(e, [d["name"] for d in data]) for e, data in emitted] == [("event_update_batch", ["Batch v2"])]
+
+
+def test_socket_metrics_requires_admin(client):
+    assert client.get("/admin/socket-metrics").status_code == 401
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.emailOutbox import EmailOutbox
+from app.models.events import Events, UrgencyEnum
+from app.models.pendingEventChange import PendingEventChange
+from app.models.userCredentials import UserCredentials
+from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
+from app.utils.event_digest import flush_event_digests
+from tests.utils import seed_states, create_confirmed_user_and_token
+
+
+def _event(app, name) -> int:
+    with app.app_context():
+        ev = Events(name=name, description="d", city="Austin", state_id="TX",
+                    urgency=UrgencyEnum.low, date=datetime.utcnow() + timedelta(days=3))
+        db.session.add(ev)
+        db.session.commit()
+        return ev.event_id
+
+
+def _volunteer(client, app, email, *event_ids, status=ParticipationStatusEnum.ASSIGNED) -> int:
+    create_confirmed_user_and_token(client, app, email=email, skip_login=True)
+    with app.app_context():
+        uid = UserCredentials.query.filter_by(email=email).one().user_id
+        for eid in event_ids:
+            db.session.add(VolunteerHistory(user_id=uid, event_id=eid, participation_status=status))
+        db.session.commit()
+        return uid
+
+
+def _digests():
+    return db.session.query(EmailOutbox).filter(EmailOutbox.subject.notlike("Confirm%")).all()
+
+
+def test_edits_within_window_coalesce_into_one_email_per_volunteer(client, app):
+    seed_states(app, [("TX", "Texas")])
+    ev1, ev2 = _event(app, "Trail Day"), _event(app, "Book Drive")
+    _volunteer(client, app, "both@example.org", ev1, ev2)
+    _volunteer(client, app, "one@example.org", ev1)
+    _volunteer(client, app, "gone@example.org", ev2, status=ParticipationStatusEnum.CANCELLED)
+
+    for _ in range(3):
+        assert client.patch(f"/events/{ev1}", json={"description": "moved"}).status_code == 200
+    assert client.patch(f"/events/{ev2}", json={"city": "Dallas"}).status_code == 200
+
+    with app.app_context():
+        pending = {p.event_id: p.change_count for p in db.session.query(PendingEventChange)}
+        assert pending == {ev1: 3, ev2: 1}
+
+        # still inside the window → nothing sent, nothing cleared
+        assert flush_event_digests() == 0
+        assert _digests() == []
+
+        later = datetime.utcnow() + timedelta(seconds=app.config["EVENT_DIGEST_WINDOW_SECONDS"] + 1)
+        assert flush_event_digests(now=later) == 2
+
+        mails = {m.to_email: m for m in _digests()}
+        assert set(mails) == {"both@example.org", "one@example.org"}
+        assert mails["both@example.org"].subject == "2 of your events were updated"
+        assert "Trail Day" in mails["both@example.org"].body and "Book Drive" in mails["both@example.org"].body
+        assert mails["one@example.org"].subject == "Event updated: Trail Day"
+
+        assert db.session.query(PendingEventChange).count() == 0
+        assert flush_event_digests(now=later) == 0
+
+
+def test_digest_html_escapes_event_fields(client, app):
+    seed_states(app, [("TX", "Texas")])
+    ev = _event(app, "<script>alert(1)</script> Day")
+    _volunteer(client, app, "esc@example.org", ev)
+    assert client.patch(f"/events/{ev}", json={"city": 'Austin" onmouseover="x'}).status_code == 200
+
+    with app.app_context():
+        later = datetime.utcnow() + timedelta(seconds=app.config["EVENT_DIGEST_WINDOW_SECONDS"] + 1)
+        assert flush_event_digests(now=later) == 1
+        (mail,) = _digests()
+        assert "<script>" not in mail.html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt; Day" in mail.html
+        assert 'Austin&#34; onmouseover=&#34;x' in mail.html
+        assert "<script>alert(1)</script> Day" in mail.body  # plain-text part stays as entered
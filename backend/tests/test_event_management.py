@@ -38,8 +38,8 @@ def setup_skills(app):
 def test_list_upcoming_and_past_empty(client, app):
     up_path   = find_rule(app, "events.list_upcoming_events")
     past_path = find_rule(app, "events.list_past_events")
-    assert client.get(up_path ).get_json() == []
-    assert client.get(past_path).get_json() == []
+    assert client.get(up_path ).get_json() == {"items": [], "next_cursor": None}
+    assert client.get(past_path).get_json() == {"items": [], "next_cursor": None}
 
 
 def test_list_upcoming_and_past_with_events(client, app):
@@ -59,12 +59,44 @@ def test_list_upcoming_and_past_with_events(client, app):
         ])
         db.session.commit()
 
-    up  = client.get(find_rule(app, "events.list_upcoming_events")).get_json()
-    past= client.get(find_rule(app, "events.list_past_events"    )).get_json()
+    up  = client.get(find_rule(app, "events.list_upcoming_events")).get_json()["items"]
+    past= client.get(find_rule(app, "events.list_past_events"    )).get_json()["items"]
     assert len(up)   == 1 and up  [0]["name"] == "Future"
     assert len(past) == 1 and past[0]["name"] == "Past"
 
 
+def test_list_events_pages_and_filters(client, app):
+    now = datetime.utcnow()
+    with app.app_context():
+        db.session.add_all([
+            Events(name=f"Drive {n}", description="d", address="", city="Austin" if n % 2 else "Houston",
+                   state_id="TX", zipcode="1", urgency=UrgencyEnum.high if n == 3 else UrgencyEnum.low,
+                   date=now + timedelta(days=n))
+            for n in range(1, 6)
+        ] + [
+            Events(name=f"Old {n}", description="d", address="", city="Austin", state_id="TX",
+                   zipcode="1", urgency=UrgencyEnum.low, date=now - timedelta(days=n))
+            for n in range(1, 4)
+        ])
+        db.session.commit()
+    up_path = find_rule(app, "events.list_upcoming_events")
+    past_path = find_rule(app, "events.list_past_events")
+
+    first = client.get(up_path, query_string={"limit": 2}).get_json()
+    second = client.get(up_path, query_string={"limit": 2, "cursor": first["next_cursor"]}).get_json()
+    third = client.get(up_path, query_string={"limit": 2, "cursor": second["next_cursor"]}).get_json()
+    names = [e["name"] for page in (first, second, third) for e in page["items"]]
+    assert names == ["Drive 1", "Drive 2", "Drive 3", "Drive 4", "Drive 5"]
+    assert third["next_cursor"] is None
+
+    assert [e["name"] for e in client.get(past_path).get_json()["items"]] == ["Old 1", "Old 2", "Old 3"]
+    assert [e["name"] for e in client.get(up_path, query_string={"city": "aus"}).get_json()["items"]] == [
+        "Drive 1", "Drive 3", "Drive 5"]
+    assert [e["name"] for e in client.get(up_path, query_string={"urgency": "HIGH"}).get_json()["items"]] == [
+        "Drive 3"]
+    assert client.get(up_path, query_string={"date": "x"}).status_code == 400
+
+
 def test_create_event_and_get(client, app):
     create_path = find_rule(app, "events.create_event")
     get_rule    = find_rule(app, "events.get_event")
@@ -0,0 +1,70 @@
+from app import db, socketio
+from app.models.notificationLog import NotificationCursor, NotificationLog
+from app.utils.notification_log import notify_user, record_notifications
+from tests.utils import create_confirmed_user_and_token
+
+
+def _user(client, app, email):
+    token = create_confirmed_user_and_token(client, app, email=email)
+    with app.app_context():
+        from app.models.userCredentials import UserCredentials
+        return token, UserCredentials.query.filter_by(email=email).one().user_id
+
+
+def _received(sc):
+    return [(m["name"], m["args"][0]) for m in sc.get_received()]
+
+
+def test_sequences_are_per_user_and_monotonic(client, app):
+    _, a = _user(client, app, "seq-a@example.org")
+    _, b = _user(client, app, "seq-b@example.org")
+    with app.app_context():
+        first = record_notifications([(a, "event_reminder", {"n": 1}), (b, "event_reminder", {"n": 1}),
+                                      (a, "event_reminder", {"n": 2})])
+        second = record_notifications([(a, "event_assigned", {"n": 3})])
+        db.session.commit()
+        assert [(u, p["seq"]) for u, _, p in first + second] == [(a, 1), (b, 1), (a, 2), (a, 3)]
+        assert db.session.get(NotificationCursor, a).last_seq == 3
+
+
+def test_ring_keeps_only_the_newest_rows(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, "NOTIFICATION_LOG_RETENTION", 3)
+    _, uid = _user(client, app, "ring@example.org")
+    with app.app_context():
+        for n in range(5):
+            record_notifications([(uid, "event_reminder", {"n": n})])
+        db.session.commit()
+        seqs = db.session.query(NotificationLog.seq).filter_by(user_id=uid).order_by(NotificationLog.seq)
+        assert [s for (s,) in seqs] == [3, 4, 5]
+
+
+def test_reconnect_replays_after_last_ack(client, app):
+    token, uid = _user(client, app, "replay@example.org")
+    with app.app_context():
+        for n in range(3):
+            notify_user(uid, "event_assigned", {"eventId": n})
+
+    sc = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+    sc.emit("ack", 1)
+    sc.disconnect()
+
+    sc = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+    assert sc.emit("replay", callback=True) == 2
+    assert _received(sc) == [("event_assigned", {"eventId": 1, "seq": 2}),
+                             ("event_assigned", {"eventId": 2, "seq": 3})]
+    sc.emit("ack", 3)
+    assert sc.emit("replay", callback=True) == 0
+    sc.disconnect()
+
+
+def test_replay_reports_gap_when_ring_rotated(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, "NOTIFICATION_LOG_RETENTION", 2)
+    token, uid = _user(client, app, "gap@example.org")
+    with app.app_context():
+        for n in range(4):
+            notify_user(uid, "event_reminder", {"n": n})
+
+    sc = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+    assert sc.emit("replay", callback=True) == 0
+    assert _received(sc) == [("notifications_gap", {"acked_seq": 0, "last_seq": 4})]
+    sc.disconnect()
@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+
+from app import db
+from app.models.notification import Notification
+from tests.utils import seed_states, seed_skills, find_rule, create_confirmed_user_and_token, auth_header, count_queries, selects
+
+
+def _profile(client, app, token, state, skill_ids):
+    r = client.post(find_rule(app, "users_profiles.create_or_update_my_profile"), json={
+        "full_name": "Ina Box", "address1": "1 Main St", "city": "Houston", "state": state,
+        "zipcode": "77002", "skills": skill_ids,
+        "availability": [(date.today() + timedelta(days=1)).isoformat()],
+    }, headers=auth_header(token))
+    assert r.status_code == 200
+
+
+def _create_event(client, name, state, skill_ids):
+    r = client.post("/events/create", json={
+        "name": name, "description": "d", "address": "1 St", "city": "Austin", "state_id": state,
+        "zipcode": "73301", "urgency": "low", "date": (date.today() + timedelta(days=5)).isoformat(),
+        "skills": skill_ids,
+    })
+    assert r.status_code == 201
+    return r.get_json()["event_id"]
+
+
+def _inbox(client, token, **params):
+    r = client.get("/notifications", query_string=params, headers=auth_header(token))
+    assert r.status_code == 200
+    return r.get_json()
+
+
+def test_event_changes_reach_interested_inboxes_only(client, app):
+    seed_states(app, [("TX", "Texas"), ("CA", "California")])
+    skills = seed_skills(app)
+    tx = create_confirmed_user_and_token(client, app, email="inbox-tx@example.org")
+    ca = create_confirmed_user_and_token(client, app, email="inbox-ca@example.org")
+    coder = create_confirmed_user_and_token(client, app, email="inbox-coder@example.org")
+    _profile(client, app, tx, "TX", [skills["Design"]])
+    _profile(client, app, ca, "CA", [skills["Design"]])
+    _profile(client, app, coder, "CA", [skills["Technical"]])
+
+    eid = _create_event(client, "Cleanup", "TX", [skills["Technical"]])
+    for n in range(3):  # repeated saves leave a single unread "updated" entry, kept current
+        with count_queries(app) as stmts:
+            assert client.patch(f"/events/{eid}", json={"name": f"Cleanup v{n}"}).status_code == 200
+        # the whole audience is written by one INSERT ... SELECT
+        assert len([s for s in stmts if s.lstrip().upper().startswith(("INSERT", "WITH")) and "notifications " in s]) == 1
+
+    body = _inbox(client, tx)
+    assert [(i["kind"], i["message"]) for i in body["items"]] == [
+        ("event_update", "Event 'Cleanup v2' has been updated."),
+        ("event_created", "New event 'Cleanup' has been created."),
+    ]
+    assert body["unread"] == 2
+    assert _inbox(client, coder)["unread"] == 2  # shares a skill
+    assert _inbox(client, ca) == {"items": [], "next_cursor": None, "unread": 0}
+
+
+def test_cursor_pagination_and_mark_read(client, app):
+    seed_states(app, [("TX", "Texas")])
+    skills = seed_skills(app)
+    token = create_confirmed_user_and_token(client, app, email="pages@example.org")
+    _profile(client, app, token, "TX", [skills["Design"]])
+    ids = [_create_event(client, f"E{n}", "TX", []) for n in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        with count_queries(app) as stmts:
+            page = _inbox(client, token, **params)
+        assert len(selects(stmts)) == 2  # the page + the counter; no COUNT(*)
+        seen += [i["event_id"] for i in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == ids[::-1]
+
+    first = _inbox(client, token, limit=2)["items"]
+    r = client.post("/notifications/read", json={"ids": [i["id"] for i in first]}, headers=auth_header(token))
+    assert r.get_json() == {"unread": 3}
+    r = client.post("/notifications/read", json={"all": True}, headers=auth_header(token))
+    assert r.get_json() == {"unread": 0}
+    assert client.get("/notifications/unread-count", headers=auth_header(token)).get_json() == {"unread": 0}
+    with app.app_context():
+        assert db.session.query(Notification).filter(Notification.read_at.is_(None)).count() == 0
+
+
+def test_bad_cursor_and_body_are_400(client, app):
+    token = create_confirmed_user_and_token(client, app, email="bad-cursor@example.org")
+    assert client.get("/notifications?cursor=zzz", headers=auth_header(token)).status_code == 400
+    assert client.post("/notifications/read", json={"ids": "1"}, headers=auth_header(token)).status_code == 400
+    assert client.get("/notifications").status_code == 401
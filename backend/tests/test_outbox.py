@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.emailOutbox import EmailOutbox, OutboxStatusEnum
+from app.utils import mailer
+from app.utils.outbox import drain_outbox
+
+
+def _register(client, email):
+    return client.post("/auth/register", json={"email": email, "password": "StrongPass!1"})
+
+
+def _outbox_for(email):
+    return db.session.query(EmailOutbox).filter_by(to_email=email).all()
+
+
+def test_register_queues_confirmation_in_same_commit(client, app):
+    r = _register(client, "outbox@example.org")
+    assert r.status_code == 201
+
+    with app.app_context():
+        rows = _outbox_for("outbox@example.org")
+        assert len(rows) == 1
+        assert rows[0].status is OutboxStatusEnum.PENDING
+        assert "/auth/confirm/" in rows[0].body
+
+
+def test_drain_sends_batch_over_one_connection(client, app):
+    for i in range(3):
+        _register(client, f"batch{i}@example.org")
+
+    with app.app_context():
+        with mailer.mail.record_messages() as outbox:
+            assert drain_outbox() == 3
+        assert sorted(m.recipients[0] for m in outbox) == [f"batch{i}@example.org" for i in range(3)]
+        assert all(r.status is OutboxStatusEnum.SENT for r in _outbox_for("batch0@example.org"))
+        assert drain_outbox() == 0
+
+
+def test_drain_retries_with_backoff_then_gives_up(client, app, monkeypatch):
+    from flask_mail import Connection
+
+    def boom(self, msg, envelope_from=None):
+        raise OSError("smtp down")
+
+    monkeypatch.setattr(Connection, "send", boom)
+    _register(client, "flaky@example.org")
+
+    with app.app_context():
+        assert drain_outbox() == 0
+        row = _outbox_for("flaky@example.org")[0]
+        assert row.attempts == 1
+        assert row.status is OutboxStatusEnum.PENDING
+        assert row.next_attempt_at > datetime.utcnow()
+        assert "smtp down" in row.last_error
+
+        # not due yet → untouched
+        assert drain_outbox() == 0
+        assert row.attempts == 1
+
+        row.attempts = app.config["MAIL_OUTBOX_MAX_ATTEMPTS"] - 1
+        row.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        drain_outbox()
+        assert row.status is OutboxStatusEnum.FAILED
@@ -0,0 +1,104 @@
+import pytest
+
+from app.utils.rate_limit import MemoryBucketStore, get_store
+
+
+@pytest.fixture
+def limits(app):
+    keys = ("RATE_LIMIT_ENABLED", "RATE_LIMIT_STORAGE", "RATE_LIMIT_AUTH_PER_IP", "RATE_LIMIT_AUTH_PER_EMAIL",
+            "RATE_LIMIT_PROXY_HOPS")
+    saved = {k: app.config[k] for k in keys}
+    app.config.update(RATE_LIMIT_ENABLED=True, RATE_LIMIT_AUTH_PER_IP=(100, 60), RATE_LIMIT_AUTH_PER_EMAIL=(3, 60))
+    yield app.config
+    with app.app_context():
+        get_store().clear()
+    app.config.update(saved)
+
+
+def test_memory_bucket_refills_and_expires(monkeypatch):
+    import app.utils.rate_limit as rl
+
+    clock = [1000.0]
+    monkeypatch.setattr(rl, "monotonic", lambda: clock[0])
+    store = MemoryBucketStore()
+
+    assert store.take("k", 2, 10) == 0
+    assert store.take("k", 2, 10) == 0
+    assert store.take("k", 2, 10) == pytest.approx(5.0)   # 1 token per 5s
+
+    clock[0] += 5
+    assert store.take("k", 2, 10) == 0
+
+    clock[0] += 60                                         # long idle → bucket full again
+    store.take("other", 2, 10)
+    assert "k" not in store._buckets
+
+
+def test_memory_bucket_expires_behind_a_long_lived_one(monkeypatch):
+    import app.utils.rate_limit as rl
+
+    clock = [1000.0]
+    monkeypatch.setattr(rl, "monotonic", lambda: clock[0])
+    store = MemoryBucketStore()
+
+    store.take("slow", 2, 3600)                            # full again only in 30 min
+    for i in range(100):
+        store.take(f"burst{i}", 2, 10)                     # full again in 5s
+    for _ in range(50):
+        clock[0] += 1
+        store.take("slow", 2, 3600)                        # keeps being touched
+
+    assert set(store._buckets) == {"slow"}
+    assert len(store._expiry) <= 2 * len(store._buckets) + 64
+
+
+@pytest.mark.parametrize("storage", ["memory", "postgres"])
+def test_login_limited_per_email_before_any_work(client, app, limits, storage, monkeypatch):
+    import app.routes.login as login_mod
+
+    limits["RATE_LIMIT_STORAGE"] = storage
+    assert client.post("/auth/register", json={"email": "flood@example.org", "password": "pw"}).status_code == 201
+
+    hashed = []
+    monkeypatch.setattr(login_mod, "verify_password", lambda *a: hashed.append(a) or False)
+
+    body = {"email": "flood@example.org", "password": "wrong"}
+    codes = [client.post("/auth/login", json=body).status_code for _ in range(4)]
+
+    assert codes == [401, 401, 401, 429]
+    assert len(hashed) == 3                     # the rejected request never hashed
+
+    r = client.post("/auth/login", json=body)
+    assert r.get_json()["error"] == "rate_limited"
+    assert int(r.headers["Retry-After"]) >= 1
+
+    # a different email is still allowed from the same IP
+    assert client.post("/auth/login", json={"email": "other@example.org", "password": "x"}).status_code == 401
+
+
+def test_register_limited_per_ip(client, app, limits):
+    limits["RATE_LIMIT_AUTH_PER_IP"] = (2, 60)
+    codes = [
+        client.post("/auth/register", json={"email": f"ip{i}@example.org", "password": "pw"}).status_code
+        for i in range(3)
+    ]
+    assert codes == [201, 201, 429]
+
+
+def test_unlimited_endpoints_untouched(client, app, limits):
+    limits["RATE_LIMIT_AUTH_PER_IP"] = (1, 60)
+    for _ in range(3):
+        assert client.get("/auth/test").status_code == 200
+
+
+def test_per_ip_bucket_uses_trusted_proxy_hop(client, app, limits):
+    limits["RATE_LIMIT_AUTH_PER_IP"] = (1, 60)
+    limits["RATE_LIMIT_PROXY_HOPS"] = 1
+
+    def register(i, forwarded_for):
+        return client.post("/auth/register", json={"email": f"px{i}@example.org", "password": "pw"},
+                           headers={"X-Forwarded-For": forwarded_for}).status_code
+
+    assert register(1, "203.0.113.1") == 201
+    assert register(2, "203.0.113.2") == 201               # another client behind the same proxy
+    assert register(3, "198.51.100.9, 203.0.113.1") == 429  # a spoofed left entry does not help
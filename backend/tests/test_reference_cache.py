@@ -0,0 +1,97 @@
+from sqlalchemy import text
+
+from app import db
+from app.models.skill import Skill, SkillLevelEnum
+from app.utils.reference_cache import reference_cache
+from tests.utils import (
+    auth_header,
+    count_queries,
+    create_confirmed_user_and_token,
+    find_rule,
+    seed_skills,
+    seed_states,
+    selects,
+)
+
+
+def test_listings_are_served_from_memory_until_a_write(client, app, monkeypatch):
+    seed_states(app)
+    seed_skills(app)
+    monkeypatch.setitem(app.config, "REFERENCE_CACHE_TTL", 3600)
+    states_path = find_rule(app, "states.list_states")
+    skills_path = find_rule(app, "skills.list_skills")
+
+    first = client.get(skills_path)
+    with count_queries(app) as stmts:
+        again = client.get(skills_path)
+        states = client.get(states_path)
+    assert selects(stmts) == []
+    assert again.data == first.data and again.mimetype == "application/json"
+    assert [s["name"] for s in again.get_json()["skills"]] == ["Communication", "Design", "Leadership", "Technical"]
+    assert [s["code"] for s in states.get_json()["states"]] == ["AZ", "CA", "NY", "TX"]
+
+    # a committed ORM write in this process drops the snapshot immediately
+    seed_skills(app, names=["Archery"])
+    assert "Archery" in [s["name"] for s in client.get(skills_path).get_json()["skills"]]
+
+
+def test_uncommitted_write_never_reaches_the_shared_snapshot(client, app):
+    seed_skills(app)
+    path = find_rule(app, "skills.list_skills")
+    client.get(path)
+    shared = reference_cache._snapshot
+
+    with app.app_context():
+        db.session.add(Skill(skill_name="Juggling", level=SkillLevelEnum.BEGINNER))
+        db.session.flush()
+        own = reference_cache.get()  # the writing transaction sees its own row...
+        assert "Juggling" in own.skills_json.decode()
+        assert reference_cache._snapshot is shared  # ...without replacing the shared one
+        db.session.rollback()
+
+    assert reference_cache._snapshot is shared  # nothing committed, nothing dropped
+    assert "Juggling" not in [s["name"] for s in client.get(path).get_json()["skills"]]
+
+
+def test_version_check_picks_up_writes_from_other_processes(client, app):
+    seed_states(app)
+    path = find_rule(app, "states.list_states")
+    assert "OR" not in [s["code"] for s in client.get(path).get_json()["states"]]
+
+    with app.app_context():
+        # raw SQL: no ORM flush, so only the trigger-bumped version can tell
+        db.session.execute(text("INSERT INTO states (state_id, name) VALUES ('OR', 'Oregon')"))
+        db.session.commit()
+    loads = reference_cache.loads
+    with count_queries(app) as stmts:
+        codes = [s["code"] for s in client.get(path).get_json()["states"]]
+    assert "OR" in codes
+    assert reference_cache.loads == loads + 1
+    assert len(selects(stmts)) == 3  # versions, states, skills
+
+    with count_queries(app) as stmts:
+        client.get(path)
+    assert len(selects(stmts)) == 1  # version check only (TTL 0 in tests)
+
+
+def test_profile_validation_uses_cached_reference_data(client, app, monkeypatch):
+    seed_states(app)
+    skills = seed_skills(app)
+    token = create_confirmed_user_and_token(client, app)
+    monkeypatch.setitem(app.config, "REFERENCE_CACHE_TTL", 3600)
+    reference_cache.invalidate()
+    path = find_rule(app, "users_profiles.create_or_update_my_profile")
+    payload = {
+        "full_name": "Val Idate", "address1": "1 Main St", "city": "Houston", "state": "TX",
+        "zipcode": "77002", "skills": [skills["Design"]], "availability": ["2030-01-01"],
+    }
+    client.get(find_rule(app, "states.list_states"))  # warm
+
+    with count_queries(app) as stmts:
+        assert client.post(path, json=payload, headers=auth_header(token)).status_code == 200
+    touched = " ".join(selects(stmts))
+    assert "FROM states" not in touched and "FROM skills" not in touched
+
+    bad = client.post(path, json={**payload, "state": "ZZ", "skills": [999999]}, headers=auth_header(token))
+    assert bad.status_code == 400
+    assert set(bad.get_json()["fields"]) == {"state", "skills"}
@@ -0,0 +1,162 @@
+import time
+from datetime import datetime, timedelta
+
+from app import db, socketio
+from app.models.events import Events, UrgencyEnum
+from app.models.reminderLedger import ReminderLedger
+from app.models.userCredentials import UserCredentials
+from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
+from app.utils.reminders import ReminderQueue, send_due_reminders
+from tests.utils import seed_states, create_confirmed_user_and_token
+
+
+def _event(name, starts_in):
+    ev = Events(name=name, description="d", city="Austin", state_id="TX",
+                urgency=UrgencyEnum.low, date=datetime.utcnow() + starts_in)
+    db.session.add(ev)
+    db.session.flush()
+    return ev.event_id
+
+
+def _capture_emits(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(socketio, "emit", lambda name, data, to=None, **kw: emitted.append((name, to, data)))
+    return emitted
+
+
+def test_due_reminders_are_sent_exactly_once_per_offset(client, app, monkeypatch):
+    seed_states(app, [("TX", "Texas")])
+    for email in ("a@example.org", "b@example.org", "c@example.org"):
+        create_confirmed_user_and_token(client, app, email=email, skip_login=True)
+    emitted = _capture_emits(monkeypatch)
+
+    with app.app_context():
+        a, b, c = (UserCredentials.find_by_email(e).user_id for e in ("a@example.org", "b@example.org", "c@example.org"))
+        soon = _event("Soon", timedelta(minutes=30))
+        later = _event("Later", timedelta(hours=3))
+        db.session.add_all([
+            VolunteerHistory(user_id=a, event_id=soon, participation_status=ParticipationStatusEnum.ASSIGNED),
+            VolunteerHistory(user_id=b, event_id=soon, participation_status=ParticipationStatusEnum.ASSIGNED),
+            VolunteerHistory(user_id=c, event_id=soon, participation_status=ParticipationStatusEnum.CANCELLED),
+            VolunteerHistory(user_id=a, event_id=later, participation_status=ParticipationStatusEnum.ASSIGNED),
+        ])
+        db.session.commit()
+
+        # "Soon" is inside the 1h band only (no 24h reminder stacked on top),
+        # "Later" inside the 24h band
+        assert send_due_reminders() == 3
+        sent = sorted((to, data["event_id"], data["offset_minutes"]) for _, to, data in emitted)
+        assert sent == sorted([(str(a), soon, 60), (str(b), soon, 60), (str(a), later, 1440)])
+
+        # the next run finds everything already in the ledger
+        assert send_due_reminders() == 0
+        assert db.session.query(ReminderLedger).count() == 3
+
+        # 25 minutes on, "Soon" enters the 10m band: sent once more, once
+        in_10m_band = datetime.utcnow() + timedelta(minutes=25)
+        assert send_due_reminders(now=in_10m_band) == 2
+        assert send_due_reminders(now=in_10m_band) == 0
+
+
+def test_queue_orders_deadlines_and_fires_due_entries(client, app, monkeypatch):
+    seed_states(app, [("TX", "Texas")])
+    create_confirmed_user_and_token(client, app, email="q@example.org", skip_login=True)
+    emitted = _capture_emits(monkeypatch)
+
+    with app.app_context():
+        uid = UserCredentials.find_by_email("q@example.org").user_id
+        eid = _event("Queued", timedelta(hours=2))
+        db.session.add(VolunteerHistory(user_id=uid, event_id=eid, participation_status=ParticipationStatusEnum.ASSIGNED))
+        db.session.commit()
+        starts_at = db.session.get(Events, eid).date
+
+    queue = ReminderQueue(app, (1440, 60, 10), horizon_seconds=3 * 3600)
+    queue.schedule(eid, starts_at)
+    queue.schedule(eid, starts_at)  # duplicate hook calls don't grow the heap
+    assert queue.pending() == 3
+
+    now = datetime.utcnow()
+    due = queue.pop_due(now)
+    assert [offset for _, _, offset in due] == [1440]  # already past start-24h → due now
+    assert queue.fire(due) == 1
+
+    # nothing else until start - 1h; then exactly the 1h entry
+    assert queue.pop_due(now + timedelta(minutes=30)) == []
+    due = queue.pop_due(starts_at - timedelta(minutes=60))
+    assert [(fire_at, offset) for fire_at, _, offset in due] == [(starts_at - timedelta(minutes=60), 60)]
+    assert queue.pending() == 1
+    assert [d["offset_minutes"] for _, _, d in emitted] == [1440]
+
+
+def test_queue_thread_sleeps_until_next_deadline(app):
+    fired = []
+    queue = ReminderQueue(app, (10,), horizon_seconds=3600)
+    queue.fire = lambda due: fired.extend((time.monotonic(), d) for d in due)
+    queue.start()
+    try:
+        t0 = time.monotonic()
+        queue.schedule(1, datetime.utcnow() + timedelta(minutes=10, seconds=0.3))
+        deadline = time.monotonic() + 3
+        while not fired and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        queue.stop()
+
+    assert len(fired) == 1
+    assert 0.25 <= fired[0][0] - t0 < 2
+    assert queue.pending() == 0
+
+
+def test_standby_queue_stays_bounded_and_reloads_when_it_leads(app):
+    fired, leader, resyncs = [], {"is": False}, []
+    queue = ReminderQueue(app, (60, 10), horizon_seconds=3600, is_active=lambda: leader["is"])
+    queue.fire = lambda due: fired.extend(due)
+    queue.resync = lambda: resyncs.append(queue.pending()) or 0
+    queue.start()
+    try:
+        soon = datetime.utcnow() + timedelta(minutes=30)
+        for round_ in range(20):  # NOTIFYs keep arriving on a follower
+            for event_id in range(50):
+                queue.schedule(event_id)  # due now
+                queue.schedule(event_id, soon)  # 60m band open now, 10m band in 20 min
+            time.sleep(0.01)
+        time.sleep(0.1)
+        assert fired == []
+        assert queue.pending() <= 50  # only the future 10m entries; due ones were dropped
+
+        leader["is"] = True
+        queue.take_over()  # what the election calls: clear, then reload from the DB
+        assert resyncs == [0] and queue.pending() == 0
+    finally:
+        queue.stop()
+    assert fired == []
+
+
+def test_hook_notifies_every_queue_through_postgres(app):
+    from sqlalchemy import create_engine, text
+    from app.utils.reminders import ReminderListener, schedule_event_reminders
+    from tests.utils import count_queries
+
+    with app.app_context():
+        with count_queries(app) as stmts:
+            schedule_event_reminders(42, datetime(2030, 1, 1, 12, 0))
+    assert any("pg_notify" in s for s in stmts)
+
+    # another process's commit reaches this process's queue
+    queue = ReminderQueue(app, (60, 10), horizon_seconds=10 * 365 * 86400)
+    listener = ReminderListener(app.config["SQLALCHEMY_DATABASE_URI"], "reminders_test", queue,
+                                poll_timeout=0.05).start()
+    try:
+        engine = create_engine(app.config["SQLALCHEMY_DATABASE_URI"], isolation_level="AUTOCOMMIT")
+        starts_at = datetime.utcnow() + timedelta(days=30)
+        deadline = time.monotonic() + 5
+        with engine.connect() as conn:
+            while queue.pending() == 0 and time.monotonic() < deadline:
+                conn.execute(text("SELECT pg_notify('reminders_test', :p)"),
+                             {"p": f'{{"event_id": 42, "starts_at": "{starts_at.isoformat()}"}}'})
+                time.sleep(0.1)
+        engine.dispose()
+    finally:
+        listener.stop()
+    assert queue.pending() == 2
+    assert sorted(offset for _, _, offset in queue.pop_due(starts_at)) == [10, 60]
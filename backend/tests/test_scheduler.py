@@ -0,0 +1,36 @@
+import os
+
+from sqlalchemy import create_engine, text
+
+from app.utils.scheduler import LeaderElection
+
+LOCK_KEY = 990_001
+
+
+def test_scheduler_not_started_under_tests(app):
+    assert "scheduler" not in app.extensions
+
+
+def test_single_leader_with_failover(app):
+    engine = create_engine(os.environ["DATABASE_URL"])
+    a, b = LeaderElection(engine, LOCK_KEY), LeaderElection(engine, LOCK_KEY)
+    try:
+        assert a.heartbeat() is True
+        assert b.heartbeat() is False
+        assert a.heartbeat() is True  # leader keeps the lock across heartbeats
+
+        # leader's connection dies (process crash, network) -> Postgres frees the lock
+        leader_pid = a._conn.execute(text("SELECT pg_backend_pid()")).scalar()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": leader_pid})
+
+        assert a.heartbeat() is False
+        assert b.heartbeat() is True
+        assert a.heartbeat() is False
+
+        b.release()
+        assert a.heartbeat() is True
+    finally:
+        a.release()
+        b.release()
+        engine.dispose()
@@ -0,0 +1,163 @@
+"""Stress test: slow consumers against the bounded per-connection queues."""
+import json
+import queue
+import threading
+import time
+
+import socketio
+
+from app.utils.socket_backpressure import BackpressureManager
+
+MAX_QUEUE = 20
+
+
+class FakeEioSocket:
+    """Stands in for an Engine.IO socket: its queue is what the writer drains."""
+    closed = False
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def send(self, pkt):
+        self.queue.put(pkt)
+
+
+class FastEioSocket(FakeEioSocket):
+    """A client on a good connection: its writer empties the queue at once."""
+
+    def __init__(self):
+        super().__init__()
+        self.got = []
+
+    def send(self, pkt):
+        super().send(pkt)
+        self.got.append(_event(self.queue.get_nowait()))
+        self.queue.task_done()
+
+
+def _event(pkt) -> str:
+    return json.loads(pkt.data[1:])[0]  # '2["event_name", ...]'
+
+
+def _server(policy):
+    mgr = BackpressureManager()
+    mgr.configure_backpressure(MAX_QUEUE, policy)
+    server = socketio.Server(async_mode="threading", client_manager=mgr)
+    return server, mgr
+
+
+def _client(server, name, sock_class=FakeEioSocket):
+    sock = sock_class()
+    server.eio.sockets[name] = sock
+    sid = server.manager.connect(name, "/")
+    server.manager.enter_room(sid, "/", "volunteers", eio_sid=name)
+    return sid, sock
+
+
+def _consume(sock, got, delay, stop):
+    while not stop.is_set() or not sock.queue.empty():
+        try:
+            pkt = sock.queue.get(timeout=0.01)
+        except queue.Empty:
+            continue
+        sock.queue.task_done()
+        got.append(_event(pkt))
+        time.sleep(delay)
+
+
+def _flood(server, n=2000, check=None):
+    for i in range(n):
+        if i % 200 == 0:
+            server.emit("event_reminder", {"i": i}, to="volunteers")
+        if i % 10 == 0:
+            server.emit("pong_test", {"i": i}, to="volunteers")
+        server.emit("event_update_batch", [{"i": i}], to="volunteers")
+        if check:
+            check()
+
+
+def test_drop_oldest_bounds_slow_client_and_keeps_reminders():
+    server, mgr = _server("drop_oldest")
+    _, slow = _client(server, "slow")
+    _, fast = _client(server, "fast", FastEioSocket)
+    slow_got, stop = [], threading.Event()
+    worker = threading.Thread(target=_consume, args=(slow, slow_got, 0.002, stop))
+    worker.start()
+
+    depths = []
+    _flood(server, check=lambda: depths.append(slow.queue.qsize()))
+    stop.set()
+    worker.join(timeout=10)
+
+    assert max(depths) <= MAX_QUEUE + 10  # normal traffic capped; 10 reminders may exceed it
+    assert [e for e in slow_got if e == "event_reminder"] == ["event_reminder"] * 10
+    assert fast.got.count("event_update_batch") == 2000  # the fast client loses nothing
+    assert fast.got.count("pong_test") == 200
+    stats = mgr.backpressure_stats()
+    assert stats["shed_oldest"] > 0 and stats["disconnected"] == 0
+    # every update / pong was delivered, shed from the queue or refused, none vanished
+    delivered = slow_got.count("event_update_batch") + slow_got.count("pong_test")
+    assert delivered + stats["shed_oldest"] + stats["dropped_new"] + stats["dropped_chatter"] == 2200
+
+
+def test_disconnect_policy_drops_only_the_stalled_client():
+    server, mgr = _server("disconnect")
+    disconnected = []
+    server.on("disconnect", lambda sid, *args: disconnected.append(sid))
+    stalled_sid, stalled = _client(server, "stalled")  # never drains
+    _, fast = _client(server, "fast", FastEioSocket)
+
+    _flood(server, n=500)
+
+    assert disconnected == [stalled_sid]
+    assert not server.manager.is_connected(stalled_sid, "/")
+    assert stalled.queue.qsize() <= MAX_QUEUE + 1  # + the DISCONNECT packet
+    assert fast.got.count("event_update_batch") == 500
+    assert mgr.backpressure_stats()["disconnected"] == 1
+
+
+def test_chatter_is_dropped_first():
+    server, mgr = _server("drop_oldest")
+    _, sock = _client(server, "idle")
+    for i in range(MAX_QUEUE // 2):
+        server.emit("event_update_batch", [{"i": i}], to="volunteers")
+    server.emit("pong_test", {}, to="volunteers")
+    assert sock.queue.qsize() == MAX_QUEUE // 2
+    assert mgr.backpressure_stats()["dropped_chatter"] == 1
+
+
+def test_concurrent_emits_keep_order_while_shedding():
+    server, mgr = _server("drop_oldest")
+    _, slow = _client(server, "slow")
+    got, stop = [], threading.Event()
+    reader = threading.Thread(target=lambda: _consume_payloads(slow, got, stop))
+    reader.start()
+
+    def emitter(name):
+        for i in range(1000):
+            server.emit("event_update_batch", [{"by": name, "i": i}], to="volunteers")
+
+    emitters = [threading.Thread(target=emitter, args=(f"t{n}",)) for n in range(4)]
+    for t in emitters:
+        t.start()
+    for t in emitters:
+        t.join(timeout=30)
+    stop.set()
+    reader.join(timeout=10)
+
+    assert mgr.backpressure_stats()["shed_oldest"] > 0
+    for name in ("t0", "t1", "t2", "t3"):
+        seq = [i for by, i in got if by == name]
+        assert seq == sorted(seq)  # shedding never lets a newer packet overtake an older one
+
+
+def _consume_payloads(sock, got, stop):
+    while not stop.is_set() or not sock.queue.empty():
+        try:
+            pkt = sock.queue.get(timeout=0.01)
+        except queue.Empty:
+            continue
+        sock.queue.task_done()
+        item = json.loads(pkt.data[1:])[1][0]
+        got.append((item["by"], item["i"]))
+        time.sleep(0.0005)
@@ -0,0 +1,91 @@
+import os
+import time
+import uuid
+
+import psycopg2
+import socketio
+
+from app.utils.socket_manager import PostgresManager, libpq_dsn
+
+
+def _server(channel):
+    mgr = PostgresManager(os.environ["DATABASE_URL"], channel=channel, poll_timeout=0.2)
+    server = socketio.Server(async_mode="threading", client_manager=mgr)
+    delivered = []
+    server._send_eio_packet = lambda eio_sid, pkt: delivered.append((eio_sid, pkt.data))
+    return server, mgr, delivered
+
+
+def _client(mgr, eio_sid, *rooms):
+    sid = mgr.connect(eio_sid, "/")
+    for room in rooms:
+        mgr.enter_room(sid, "/", room, eio_sid=eio_sid)
+    return sid
+
+
+def _wait_for(pred, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_libpq_dsn_drops_driver():
+    assert libpq_dsn("postgresql+psycopg2://u:p@h:5432/db") == "postgresql://u:p@h:5432/db"
+    assert libpq_dsn("postgresql://u@h/db") == "postgresql://u@h/db"
+
+
+def _unprobed(delivered):
+    # readiness probes still in flight may land after the wait below
+    return [(eio, d) for eio, d in delivered if '"probe"' not in d]
+
+
+def test_emits_fan_out_between_workers():
+    channel = f"sio_{uuid.uuid4().hex[:12]}"
+    a, mgr_a, _ = _server(channel)
+    b, mgr_b, got_b = _server(channel)
+    mgr_b.initialize()  # start B's LISTEN thread
+    _client(mgr_b, "eio-1", "user:1")
+    _client(mgr_b, "eio-2", "user:2")
+
+    # wait until B is listening
+    assert _wait_for(lambda: a.emit("probe", {}) or any("probe" in d for _, d in got_b))
+    got_b.clear()
+
+    a.emit("event_created", {"event_id": 7})
+    assert _wait_for(lambda: len(_unprobed(got_b)) == 2)
+    assert {eio for eio, _ in _unprobed(got_b)} == {"eio-1", "eio-2"}
+
+    got_b.clear()
+    a.emit("event_assigned", {"eventId": 7}, to="user:2")
+    assert _wait_for(lambda: len(_unprobed(got_b)) == 1)
+    [(eio, data)] = _unprobed(got_b)
+    assert eio == "eio-2" and "event_assigned" in data
+
+    # payloads over the NOTIFY limit travel through socketio_spill
+    got_b.clear()
+    a.emit("event_update", {"description": "x" * 20_000}, to="user:1")
+    assert _wait_for(lambda: len(_unprobed(got_b)) == 1)
+    assert "x" * 20_000 in _unprobed(got_b)[0][1]
+
+
+class _FailingConn:
+    closed = False
+
+    def cursor(self):
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def close(self):
+        self.closed = True
+
+
+def test_publish_closes_a_failed_connection_before_reconnecting():
+    _, mgr, _ = _server(f"sio_{uuid.uuid4().hex[:12]}")
+    broken = mgr._pub_conn = _FailingConn()
+
+    mgr._publish({"method": "emit", "event": "probe"})
+    assert broken.closed
+    assert mgr._pub_conn is not None and not mgr._pub_conn.closed  # second attempt reconnected
+    mgr._drop_pub_conn()
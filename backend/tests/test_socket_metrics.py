@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+import socketio as pysocketio
+
+from app import socketio
+from app.utils.socket_manager import PostgresManager
+from app.utils.socket_metrics import Histogram, RateWindow, SampledLogger, room_stats
+from tests.utils import create_confirmed_user_and_token
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    h = Histogram((1, 10, 100))
+    for v in (0.5, 0.7, 5, 50, 500):
+        h.observe(v)
+    assert h.counts == [2, 1, 1, 1]
+    assert (h.quantile(0.4), h.quantile(0.5), h.quantile(0.99)) == (1, 10, 500)
+    assert Histogram((1,)).quantile(0.5) is None
+
+
+def test_rate_window_forgets_old_seconds():
+    r = RateWindow(seconds=10)
+    r.add(30, now=100.0)
+    r.add(10, now=105.5)
+    assert r.per_second(now=105.9) == 4.0
+    assert r.per_second(now=111.0) == 1.0
+
+
+def test_sampled_logger(caplog):
+    log = logging.getLogger("test.sampled")
+    with caplog.at_level(logging.INFO, logger="test.sampled"):
+        SampledLogger(log, rate=0).info("socket.connect", user=1)
+        SampledLogger(log, rate=1).info("socket.connect", user=2, rooms=3)
+    assert [r.getMessage() for r in caplog.records] == ["socket.connect user=2 rooms=3 sample=1"]
+
+
+def test_metrics_endpoint_reports_connections_rooms_and_emits(client, app, monkeypatch):
+    monkeypatch.setattr(socketio.metrics, "payload_sample", 1.0)
+    socketio.metrics.reset()
+    token = create_confirmed_user_and_token(client, app, email="metrics@example.org")
+    sc = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+    socketio.test_client(app, flask_test_client=client)  # refused, no token
+    socketio.emit("event_update_batch", [{"event_id": 1}], to="role:VOLUNTEER")
+
+    r = client.get("/metrics/sockets")
+    assert r.status_code == 200
+    server = r.get_json()["server"]
+    assert server["connections"] == {"connects": 1, "refused": 1, "disconnects": 0}
+    assert server["connected_clients"] == 1
+    assert server["rooms"]["role"] == {"rooms": 1, "max_size": 1, "avg_size": 1.0}
+    emitted = server["emits"]["event_update_batch"]
+    assert emitted["count"] == 1 and emitted["latency_ms"]["count"] == 1
+    assert emitted["payload_bytes"]["max"] == len('[{"event_id": 1}]')
+    assert server["inbound"]["connect"]["count"] == 2
+    sc.disconnect()
+
+
+def test_metrics_endpoint_is_local_only(client):
+    assert client.get("/metrics/sockets", environ_base={"REMOTE_ADDR": "10.1.2.3"}).status_code == 404
+    assert client.get("/metrics/sockets", headers={"X-Forwarded-For": "10.1.2.3"}).status_code == 404
+
+
+def test_failing_handler_is_timed_and_counted(client, app):
+    socketio.metrics.reset()
+    token = create_confirmed_user_and_token(client, app, email="metrics-boom@example.org")
+    sc = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+
+    def boom():
+        raise RuntimeError("handler bug")
+
+    sid = socketio.server.manager.sid_from_eio_sid(sc.eio_sid, "/")
+    with pytest.raises(RuntimeError):
+        socketio._handle_event(boom, "boom_test", "/", sid)
+
+    inbound = socketio.metrics.snapshot()["inbound"]["boom_test"]
+    assert inbound["count"] == 1 and inbound["errors"] == 1
+    assert inbound["handler_ms"]["count"] == 1
+    sc.disconnect()
+
+
+def test_room_stats_with_postgres_manager_and_without_rooms():
+    server = pysocketio.Server(async_mode="threading", client_manager=PostgresManager("postgresql://unused/db"))
+    sid = server.manager.connect("eio-1", "/")
+    server.manager.enter_room(sid, "/", "role:VOLUNTEER", eio_sid="eio-1")
+
+    stats = room_stats(server)
+    assert stats["connected_clients"] == 1
+    assert stats["rooms"]["role"] == {"rooms": 1, "max_size": 1, "avg_size": 1.0}
+    assert room_stats(None) == {"connected_clients": None, "rooms": {}, "largest_rooms": []}
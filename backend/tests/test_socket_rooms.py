@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+from app import socketio
+from tests.utils import seed_states, seed_skills, find_rule, create_confirmed_user_and_token, auth_header
+
+
+def _profile(skill_ids, state="TX"):
+    return {
+        "full_name": "Sam Rooms",
+        "address1": "1 Main St",
+        "city": "Houston",
+        "state": state,
+        "zipcode": "77002",
+        "skills": skill_ids,
+        "availability": [(date.today() + timedelta(days=1)).isoformat()],
+    }
+
+
+def _connect(app, client, token):
+    return socketio.test_client(app, flask_test_client=client, auth={"token": token})
+
+
+def _events(sc, name):
+    return [msg["args"][0] for msg in sc.get_received() if msg["name"] == name]
+
+
+def test_connect_requires_valid_access_token(client, app):
+    assert not socketio.test_client(app, flask_test_client=client).is_connected()
+    assert not _connect(app, client, "not-a-jwt").is_connected()
+
+
+def test_connect_joins_user_role_and_interest_rooms(client, app):
+    seed_states(app, [("TX", "Texas")])
+    skills = seed_skills(app)
+    token = create_confirmed_user_and_token(client, app, email="rooms@example.org")
+    client.post(find_rule(app, "users_profiles.create_or_update_my_profile"),
+                json=_profile([skills["Technical"]]), headers=auth_header(token))
+
+    sc = _connect(app, client, token)
+    assert sc.is_connected()
+    sid = socketio.server.manager.sid_from_eio_sid(sc.eio_sid, "/")
+    rooms = set(socketio.server.rooms(sid))
+    assert {"role:VOLUNTEER", "state:TX", f"skill:{skills['Technical']}"} <= rooms
+    sc.disconnect()
+
+
+def test_event_notifications_reach_only_interested_sockets(client, app):
+    seed_states(app, [("TX", "Texas"), ("CA", "California")])
+    skills = seed_skills(app)
+    path = find_rule(app, "users_profiles.create_or_update_my_profile")
+    tx = create_confirmed_user_and_token(client, app, email="tx@example.org")
+    ca = create_confirmed_user_and_token(client, app, email="ca@example.org")
+    client.post(path, json=_profile([skills["Design"]], "TX"), headers=auth_header(tx))
+    client.post(path, json=_profile([skills["Design"]], "CA"), headers=auth_header(ca))
+
+    tx_sc, ca_sc = _connect(app, client, tx), _connect(app, client, ca)
+    r = client.post("/events/create", json={
+        "name": "Food drive", "description": "d", "address": "1 St", "city": "Austin",
+        "state_id": "TX", "zipcode": "73301", "urgency": "low",
+        "date": (date.today() + timedelta(days=2)).isoformat(), "skills": [skills["Technical"]],
+    })
+    assert r.status_code == 201
+
+    assert [b[0]["name"] for b in _events(tx_sc, "event_created_batch")] == ["Food drive"]
+    assert _events(ca_sc, "event_created_batch") == []
+
+    # moving to TX puts the CA socket in the state room without reconnecting
+    client.post(path, json=_profile([skills["Design"]], "TX"), headers=auth_header(ca))
+    client.patch(f"/events/{r.get_json()['event_id']}", json={"name": "Food drive v2"})
+    assert [b[0]["name"] for b in _events(ca_sc, "event_update_batch")] == ["Food drive v2"]
+    tx_sc.disconnect()
+    ca_sc.disconnect()
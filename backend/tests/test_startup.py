@@ -0,0 +1,17 @@
+"""Startup stays lean: heavy or side-effecting modules are loaded only when used."""
+from app.scripts.bench_startup import STEPS, importtime_report
+
+NOT_ON_IMPORT = ("app.routes.events", "app.routes.login", "app.utils.scheduler", "alembic", "flask_migrate", "apscheduler")
+NOT_ON_CREATE_APP = ("app.utils.scheduler", "apscheduler", "alembic", "eventlet")
+
+
+def test_import_app_defers_routes_and_tooling():
+    _, modules = importtime_report(STEPS["import app"])
+    assert "app" in modules
+    assert [m for m in NOT_ON_IMPORT if m in modules] == []
+
+
+def test_create_app_starts_no_background_services():
+    _, modules = importtime_report(STEPS["create_app()"])
+    assert "app.routes.events" in modules  # blueprints do get registered
+    assert [m for m in NOT_ON_CREATE_APP if m in modules] == []
@@ -72,7 +72,9 @@ def test_list_my_tasks_returns_only_current_user_tasks(client, app):
     r = client.get(get_path, headers=auth_header(token_a))
 
     assert r.status_code == 200
-    tasks = r.get_json()
+    body = r.get_json()
+    assert body["next_cursor"] is None
+    tasks = body["items"]
     assert len(tasks) == 1
     t = tasks[0]
     assert t["id"] == str(task_id_a)
@@ -80,6 +82,26 @@ def test_list_my_tasks_returns_only_current_user_tasks(client, app):
     assert t["status"] == "assigned"
 
 
+def test_list_my_tasks_pages_and_filters_by_status(client, app):
+    seed_states(app)
+    token = create_confirmed_user_and_token(client, app, email="pages@example.org")
+    uid = _uid(app, "pages@example.org")
+    ids = [_add_task(app, uid, _create_event(app, name=f"Task {n}")) for n in range(3)]
+    registered = _add_task(app, uid, _create_event(app, name="Done"), ParticipationStatusEnum.REGISTERED)
+
+    get_path = find_rule(app, "task_list.list_my_tasks")
+    first = client.get(get_path, query_string={"limit": 2}, headers=auth_header(token)).get_json()
+    rest = client.get(get_path, query_string={"limit": 2, "cursor": first["next_cursor"]},
+                      headers=auth_header(token)).get_json()
+    assert [t["id"] for t in first["items"] + rest["items"]] == [str(i) for i in ids + [registered]]
+    assert rest["next_cursor"] is None
+
+    only = client.get(get_path, query_string={"status": "registered"}, headers=auth_header(token)).get_json()
+    assert [t["title"] for t in only["items"]] == ["Done"]
+    # the owner filter comes from the token; callers cannot pass their own
+    assert client.get(get_path, query_string={"user_id": 1}, headers=auth_header(token)).status_code == 400
+
+
 def test_update_task_status_success(client, app):
     seed_states(app)
     token = create_confirmed_user_and_token(client, app)
@@ -8,6 +8,7 @@ from tests.utils import (
     find_rule,
     create_confirmed_user_and_token,
     auth_header,
+    count_queries,
 )
 
 def _valid_profile_payload(skill_ids, state_code="TX"):
@@ -165,3 +166,42 @@ def test_profile_validation_error_returns_400(client, app):
     j = r.get_json()
     assert j.get("error") == "validation_error"
     assert isinstance(j.get("fields"), dict)
+
+
+def _writes(stmts, table):
+    return [s.split()[0] for s in stmts
+            if s.lstrip().upper().startswith(("INSERT", "DELETE")) and table in s]
+
+
+def test_profile_save_writes_only_changed_skills_and_availability(client, app):
+    seed_states(app)
+    skills = seed_skills(app)
+    token = create_confirmed_user_and_token(client, app)
+    post_path = find_rule(app, "users_profiles.create_or_update_my_profile")
+    payload = _valid_profile_payload(skills)
+    assert client.post(post_path, json=payload, headers=auth_header(token)).status_code == 200
+
+    # unchanged save: no writes to either table
+    with count_queries(app) as stmts:
+        r = client.post(post_path, json=payload, headers=auth_header(token))
+    assert r.status_code == 200
+    assert _writes(stmts, "user_to_skill") == []
+    assert _writes(stmts, "user_availability") == []
+
+    # swap one skill, add one date: one DELETE + one INSERT, one INSERT
+    changed = {**payload,
+               "skills": [skills["Leadership"], skills["Design"]],
+               "availability": payload["availability"] + [(date.today() + timedelta(days=5)).isoformat()]}
+    with count_queries(app) as stmts:
+        r = client.post(post_path, json=changed, headers=auth_header(token))
+    assert _writes(stmts, "user_to_skill") == ["DELETE", "INSERT"]
+    assert _writes(stmts, "user_availability") == ["INSERT"]
+    prof = r.get_json()["profile"]
+    assert set(prof["skills"]) == {skills["Leadership"], skills["Design"]}
+    assert sorted(prof["availability"]) == sorted(changed["availability"])
+
+    # PATCH without skills / availability leaves them alone
+    with count_queries(app) as stmts:
+        r = client.patch(post_path, json={"city": "Austin"}, headers=auth_header(token))
+    assert r.status_code == 200
+    assert _writes(stmts, "user_to_skill") == _writes(stmts, "user_availability") == []
@@ -11,6 +11,9 @@ from app.models.userProfiles import UserProfiles
 from app.models.userToSkill import UserToSkill
 from app.models.userAvailability import UserAvailability
 from app.models.volunteerHistory import VolunteerHistory, ParticipationStatusEnum
+from app.models.notification import Notification
+from app.models.notificationLog import NotificationLog
+from app.utils.inbox import unread_count
 from tests.utils import (
     seed_states,
     seed_skills,
@@ -142,10 +145,15 @@ def test_save_match_persists_and_saved_endpoint_returns_names(client, app):
     assert r.status_code == 201
     assert r.get_json()["saved"] == {"eventId": ev_id, "volunteerId": vol_id}
 
-    # Row exists in DB with ASSIGNED status
+    # Row exists in DB with ASSIGNED status, committed with its inbox entry and log row
     with app.app_context():
         vh = db.session.query(VolunteerHistory).filter_by(user_id=vol_id, event_id=ev_id).one()
         assert vh.participation_status is ParticipationStatusEnum.ASSIGNED
+        inbox = db.session.query(Notification).filter_by(user_id=vol_id).one()
+        assert (inbox.kind, inbox.event_id, inbox.read_at) == ("event_assigned", ev_id, None)
+        assert unread_count(vol_id) == 1
+        logged = db.session.query(NotificationLog).filter_by(user_id=vol_id).one()
+        assert logged.event == "event_assigned" and logged.payload["eventId"] == ev_id
 
     # GET /saved includes resolved names
     saved_path = find_rule(app, "volunteer_matching.list_saved_matches")
@@ -157,3 +165,46 @@ def test_save_match_persists_and_saved_endpoint_returns_names(client, app):
         "volunteerId": vol_id,
         "volunteerName": "Val Volunteer",
     }]
+
+
+def test_save_match_twice_is_idempotent(client, app):
+    _clear_globals()
+    seed_states(app, [("TX", "Texas")])
+    skills = seed_skills(app, ["Leadership"])
+
+    event_date = datetime.utcnow() + timedelta(days=2)
+    ev_id = _create_event(app, "TX", event_date, [skills["Leadership"]])
+    vol_id = _create_volunteer(client, app, "twice@example.org", "Tina Twice",
+                               [skills["Leadership"]], [event_date.date().isoformat()])
+
+    post_path = find_rule(app, "volunteer_matching.save_volunteer_match")
+    r1 = client.post(post_path, json={"eventId": ev_id, "volunteerId": vol_id})
+    r2 = client.post(post_path, json={"eventId": ev_id, "volunteerId": vol_id})
+    assert r1.status_code == 201
+    assert r2.status_code == 200
+    assert r2.get_json()["created"] is False
+
+    with app.app_context():
+        rows = db.session.query(VolunteerHistory).filter_by(user_id=vol_id, event_id=ev_id).count()
+        assert rows == 1
+        assert unread_count(vol_id) == 1  # the repeat told the volunteer nothing new
+        assert db.session.query(NotificationLog).filter_by(user_id=vol_id).count() == 1
+
+
+def test_save_match_keeps_notifications_when_emit_fails(client, app, monkeypatch):
+    _clear_globals()
+    seed_states(app, [("TX", "Texas")])
+    skills = seed_skills(app, ["Leadership"])
+    ev_id = _create_event(app, "TX", datetime.utcnow() + timedelta(days=2), [skills["Leadership"]])
+    vol_id = _create_volunteer(client, app, "offline@example.org", "Olly Offline", [], [])
+
+    def socket_down(recorded):
+        raise ConnectionError("socket server unavailable")
+
+    monkeypatch.setattr(vm, "emit_recorded", socket_down)
+    post_path = find_rule(app, "volunteer_matching.save_volunteer_match")
+    assert client.post(post_path, json={"eventId": ev_id, "volunteerId": vol_id}).status_code == 201
+
+    with app.app_context():  # committed before the emit: the replay and inbox still have it
+        assert unread_count(vol_id) == 1
+        assert db.session.query(NotificationLog).filter_by(user_id=vol_id, event="event_assigned").count() == 1
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import Iterable, List, Tuple, Dict
 from flask import Flask
+from sqlalchemy import event
 
 from app import db
 from app.models.state import States
@@ -25,6 +27,30 @@ def find_rule(app: Flask, endpoint: str) -> str:
     raise AssertionError(f"Could not find URL rule for endpoint '{endpoint}'")
 
 
+@contextmanager
+def count_queries(app: Flask):
+    """
+    Collect every SQL statement sent to the database inside the block.
+    Yields the list; use `selects(stmts)` to ignore SAVEPOINT noise.
+    """
+    with app.app_context():
+        engine = db.engine
+    statements: List[str] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def selects(statements: Iterable[str]) -> List[str]:
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
 # -------------------------------
 # Auth helpers
 # -------------------------------
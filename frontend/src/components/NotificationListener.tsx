@@ -5,7 +5,7 @@ import { Notify } from "@/components/Notifications";
 
 const NotificationListener = () => {
   const socket = useSocket();
-  const { user } = useAuth();
+  const { user, token } = useAuth();
 
   // if (!socket) return null;
 
@@ -17,21 +17,35 @@ const NotificationListener = () => {
       console.log("📨 Socket event received:", event, args);
     });
 
-    // Join personal room after connect or reconnect
-    const joinRoom = () => {
-      if (user?.id) {
-        socket.emit("join", user.id);
-        console.log(`📡 (Re)joined room for user ID ${user.id}`);
-      }
+    // Assignments and reminders carry a per-user `seq`. Ack each one; after
+    // every (re)connect ask for whatever came in since the last ack.
+    const ack = (data: any) => {
+      if (typeof data?.seq === "number") socket.emit("ack", data.seq);
     };
+    const requestReplay = () => socket.emit("replay");
+    socket.on("connect", requestReplay);
 
-    socket.on("connect", joinRoom);
-
-    // Initial join
-    joinRoom();
+    // Too far behind for a replay: the server only keeps recent notifications
+    const onGap = (data: any) => {
+      Notify({
+        title: "Missed Notifications",
+        description: "You were offline for a while. Refresh to see your latest tasks and events.",
+        variant: "info",
+      });
+      ack({ seq: data?.last_seq });
+    };
 
-    // Notification: Event Created
-    const onEventCreated = (data: any) => {
+    // Notification: Event Created (server batches bursts into one list)
+    const onEventCreated = (batch: any[]) => {
+      if (batch.length > 1) {
+        Notify({
+          title: "New Events",
+          description: `🆕 ${batch.length} new events posted.`,
+          variant: "info",
+        });
+        return;
+      }
+      const data = batch[0] ?? {};
       Notify({
         title: "New Event",
         description: data.message || `🆕 New event posted: ${data.name || "Unnamed"}`,
@@ -46,10 +60,20 @@ const NotificationListener = () => {
         description: data.message || "Reminder: Your event is starting soon!",
         variant: "default",
       });
+      ack(data);
     };
 
-    // Notification: Event Update
-    const onEventUpdate = (data: any) => {
+    // Notification: Event Update (one entry per event, latest version only)
+    const onEventUpdate = (batch: any[]) => {
+      if (batch.length > 1) {
+        Notify({
+          title: "Events Updated",
+          description: `📅 ${batch.length} events have been updated.`,
+          variant: "warning",
+        });
+        return;
+      }
+      const data = batch[0] ?? {};
       Notify({
         title: "Event Updated",
         description: `📅 Event “${data.name?.trim() || "Unnamed"}” has been updated.`,
@@ -64,22 +88,33 @@ const NotificationListener = () => {
         description: `🎉 You’ve been assigned to “${data.name?.trim() || "an event"}”!`,
         variant: "success",
       });
+      ack(data);
     };
 
-    socket.on("event_created", onEventCreated);
+    socket.on("event_created_batch", onEventCreated);
     socket.on("event_reminder", onEventReminder);
-    socket.on("event_update", onEventUpdate);
+    socket.on("event_update_batch", onEventUpdate);
     socket.on("event_assigned", onEventAssigned);
+    socket.on("notifications_gap", onGap);
+
+    // The server joins our rooms from the token sent in the handshake, so
+    // (re)connect whenever the logged-in user / token changes.
+    if (user?.id && token) {
+      socket.disconnect().connect();
+    } else {
+      socket.disconnect();
+    }
 
     return () => {
-      socket.off("connect", joinRoom);
-      socket.off("event_created", onEventCreated);
+      socket.off("event_created_batch", onEventCreated);
       socket.off("event_reminder", onEventReminder);
-      socket.off("event_update", onEventUpdate);
+      socket.off("event_update_batch", onEventUpdate);
       socket.off("event_assigned", onEventAssigned);
+      socket.off("notifications_gap", onGap);
+      socket.off("connect", requestReplay);
       socket.offAny(); // clean up debugger
     };
-  }, [socket, user?.id]);
+  }, [socket, user?.id, token]);
 
   return null;
 };
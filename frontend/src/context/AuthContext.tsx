@@ -1,6 +1,6 @@
 import React, { createContext, useContext, useState, useCallback, useEffect } from 'react';
 import type { AuthUser } from '@/types/auth';
-import { loginUser as apiLoginUser, fetchMe } from '@/lib/api';
+import { loginUser as apiLoginUser, fetchMe, refreshSession, logoutSession } from '@/lib/api';
 
 interface AuthContextType {
   user: AuthUser | null;
@@ -16,6 +16,7 @@ const STORAGE_KEY = 'volunteerapp.auth';
 
 interface StoredAuth {
   token: string;
+  refreshToken?: string;
   user: AuthUser;
 }
 
@@ -36,11 +37,20 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
             setToken(stored.token);
             setUser(u);
           })
-          .catch(err => {
-            // If token invalid/expired -> clear
-            if (err?.status === 401 || err?.status === 422) {
-              window.localStorage.removeItem(STORAGE_KEY);
+          .catch(async err => {
+            if (err?.status !== 401 && err?.status !== 422) return;
+            // Access token expired -> try the refresh token before giving up
+            if (stored.refreshToken) {
+              try {
+                const pair = await refreshSession(stored.refreshToken);
+                const u = await fetchMe(pair.access_token);
+                setToken(pair.access_token);
+                setUser(u);
+                persist(pair.access_token, u, pair.refresh_token);
+                return;
+              } catch {/* fall through */}
             }
+            window.localStorage.removeItem(STORAGE_KEY);
           })
           .finally(() => setLoading(false));
       } else {
@@ -51,8 +61,8 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
     }
   }, []);
 
-  const persist = (token: string, user: AuthUser) => {
-    window.localStorage.setItem(STORAGE_KEY, JSON.stringify({ token, user } satisfies StoredAuth));
+  const persist = (token: string, user: AuthUser, refreshToken?: string) => {
+    window.localStorage.setItem(STORAGE_KEY, JSON.stringify({ token, refreshToken, user } satisfies StoredAuth));
   };
 
   const clearPersist = () => {
@@ -63,11 +73,15 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
     const resp = await apiLoginUser(email, password);
     setToken(resp.access_token);
     setUser(resp.user);
-    persist(resp.access_token, resp.user);
+    persist(resp.access_token, resp.user, resp.refresh_token);
     return { redirect: resp.user.redirect };
   }, []);
 
   const logout = useCallback(() => {
+    try {
+      const stored: StoredAuth | null = JSON.parse(window.localStorage.getItem(STORAGE_KEY) ?? 'null');
+      if (stored?.refreshToken) void logoutSession(stored.refreshToken);
+    } catch {/* ignore */}
     setUser(null);
     setToken(null);
     clearPersist();
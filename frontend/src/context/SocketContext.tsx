@@ -4,12 +4,28 @@ import { io, Socket } from "socket.io-client";
 
 const SocketContext = createContext<Socket | null>(null);
 
+// Same key AuthContext persists the session under.
+const AUTH_STORAGE_KEY = "volunteerapp.auth";
+
+// The server authenticates the socket from the access token in the handshake
+// and puts it in its rooms; read it fresh on every (re)connect.
+const handshakeAuth = (cb: (data: object) => void) => {
+  let token: string | undefined;
+  try {
+    token = JSON.parse(window.localStorage.getItem(AUTH_STORAGE_KEY) || "{}").token;
+  } catch {
+    token = undefined;
+  }
+  cb({ token });
+};
+
 export const SocketProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const socketRef = useRef<Socket | null>(null);
   const db_url = import.meta.env.VITE_DEVELOPMENT_DB_URL;
 
   if (!socketRef.current) {
-    socketRef.current = io(db_url);
+    // Connected by NotificationListener once there is a logged-in user.
+    socketRef.current = io(db_url, { auth: handshakeAuth, autoConnect: false });
     (window as any).socket = socketRef.current; // ✅ Dev testing
   }
 
@@ -1,4 +1,4 @@
-import type { AuthUser, LoginResponse } from '@/types/auth';
+import type { AuthUser, LoginResponse, RefreshResponse } from '@/types/auth';
 import type { VolunteerProfile, VolunteerProfileInput, SkillOption, StateOption } from '@/types/profile';
 import type { Volunteer } from '@/types/type';
 
@@ -75,6 +75,27 @@ export async function fetchMe(token: string): Promise<AuthUser> {
   return json.user as AuthUser;
 }
 
+// Exchange a refresh token for a new access/refresh pair (the old one is revoked)
+export async function refreshSession(refreshToken: string): Promise<RefreshResponse> {
+  const res = await fetch(buildUrl('/auth/refresh'), {
+    method: 'POST',
+    headers: { Authorization: `Bearer ${refreshToken}` },
+  });
+  if (!res.ok) {
+    const err: any = new Error('Session expired');
+    err.status = res.status;
+    throw err;
+  }
+  return res.json();
+}
+
+export async function logoutSession(refreshToken: string): Promise<void> {
+  await fetch(buildUrl('/auth/logout'), {
+    method: 'POST',
+    headers: { Authorization: `Bearer ${refreshToken}` },
+  }).catch(() => {/* best effort */});
+}
+
 export async function resendConfirmation(email: string): Promise<void> {
   await fetch(buildUrl('/auth/resend-confirmation'), {
     method: 'POST',
@@ -229,13 +250,28 @@ export type Task = {
   assignee: string;
 };
 
+export interface TaskPage {
+  items: Task[];
+  next_cursor: string | null;
+}
+
+// GET /tasks is keyset-paginated; follow next_cursor until the last page
 export async function fetchVolunteerTasks(token?: string): Promise<Task[]> {
-  const res = await fetch(buildUrl("/tasks"), {
-    headers: token ? { Authorization: `Bearer ${token}` } : {},
-    credentials: "include",
-  });
-  if (!res.ok) throw new Error("Failed to load volunteer tasks");
-  return (await res.json()) as Task[];
+  const tasks: Task[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: "200" });
+    if (cursor) params.set("cursor", cursor);
+    const res = await fetch(buildUrl(`/tasks?${params}`), {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+      credentials: "include",
+    });
+    if (!res.ok) throw new Error("Failed to load volunteer tasks");
+    const page = (await res.json()) as TaskPage;
+    tasks.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor);
+  return tasks;
 }
 
 export async function updateTaskStatus(
@@ -252,4 +288,65 @@ export async function updateTaskStatus(
     credentials: "include",
   });
   if (!res.ok) throw new Error("Failed to update task status");
-}
\ No newline at end of file
+}
+// Notifications inbox ------------------------------------------------------
+export type InboxNotification = {
+  id: number;
+  kind: "event_created" | "event_update" | "event_assigned" | "event_reminder";
+  event_id: number | null;
+  message: string;
+  created_at: string;
+  read: boolean;
+};
+
+export interface InboxPage {
+  items: InboxNotification[];
+  next_cursor: string | null;
+  unread: number;
+}
+
+export async function fetchNotifications(token: string, cursor?: string | null, limit = 20): Promise<InboxPage> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) params.set("cursor", cursor);
+  const res = await fetch(buildUrl(`/notifications?${params}`), {
+    headers: { ...authHeaders(token) },
+  });
+  if (!res.ok) throw new Error("Failed to load notifications");
+  return (await res.json()) as InboxPage;
+}
+
+export async function markNotificationsRead(token: string, ids: number[] | "all"): Promise<number> {
+  const res = await fetch(buildUrl("/notifications/read"), {
+    method: "POST",
+    headers: { "Content-Type": "application/json", ...authHeaders(token) },
+    body: JSON.stringify(ids === "all" ? { all: true } : { ids }),
+  });
+  if (!res.ok) throw new Error("Failed to mark notifications read");
+  return (await res.json()).unread as number;
+}
+
+// Admin: many volunteer profiles in one request ----------------------------
+export type AdminProfile = {
+  user_id: number;
+  full_name: string;
+  address1: string;
+  address2: string | null;
+  city: string;
+  state: string;
+  zipcode: string;
+  preferences: string | null;
+  skills: number[];
+  availability: string[]; // YYYY-MM-DD
+};
+
+export async function fetchProfiles(
+  token: string,
+  ids: number[]
+): Promise<{ profiles: AdminProfile[]; missing: number[] }> {
+  const params = new URLSearchParams({ ids: ids.join(",") });
+  const res = await fetch(buildUrl(`/admin/profiles?${params}`), {
+    headers: { ...authHeaders(token) },
+  });
+  if (!res.ok) throw new Error("Failed to load profiles");
+  return await res.json();
+}
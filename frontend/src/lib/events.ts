@@ -22,11 +22,32 @@ async function json<T>(res: Response): Promise<T> {
   return res.json() as Promise<T>
 }
 
-export const listUpcoming = () =>
-  fetch(`${BASE}/upcoming`).then(json<Event[]>)
+export interface EventPage {
+  items: Event[]
+  next_cursor: string | null
+}
+
+// one page; pass the previous page's next_cursor to continue
+export const listEventPage = (kind: "upcoming" | "past", cursor?: string | null, limit = 200) => {
+  const params = new URLSearchParams({ limit: String(limit) })
+  if (cursor) params.set("cursor", cursor)
+  return fetch(`${BASE}/${kind}?${params}`).then(json<EventPage>)
+}
+
+async function listAll(kind: "upcoming" | "past"): Promise<Event[]> {
+  const events: Event[] = []
+  let cursor: string | null = null
+  do {
+    const page: EventPage = await listEventPage(kind, cursor)
+    events.push(...page.items)
+    cursor = page.next_cursor
+  } while (cursor)
+  return events
+}
+
+export const listUpcoming = () => listAll("upcoming")
 
-export const listPast = () =>
-  fetch(`${BASE}/past`).then(json<Event[]>)
+export const listPast = () => listAll("past")
 
 export const createEvent = (payload: EventPayload) =>
   fetch(`${BASE}/create`, {
@@ -12,5 +12,11 @@ export interface AuthUser {
 
 export interface LoginResponse {
   access_token: string;
+  refresh_token: string;
   user: AuthUser & { redirect?: string; admin_pending?: boolean };
-}
\ No newline at end of file
+}
+
+export interface RefreshResponse {
+  access_token: string;
+  refresh_token: string;
+}